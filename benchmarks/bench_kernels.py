@@ -0,0 +1,129 @@
+"""Compare kernel backends for V(r) and (V, F) evaluation and check they agree.
+
+Every backend's ``calculate`` and ``energy_and_force`` is first checked
+against the plain NumPy expressions on several distance ranges, then
+timed on arrays of increasing size. The ``python`` backend runs the kernel
+loops uncompiled, so it checks the kernel code when Numba is missing, but
+it is only timed up to ``--python-max`` points.
+
+    python benchmarks/bench_kernels.py [--sizes 1000 100000 10000000] [--backends numpy numba]
+    python benchmarks/bench_kernels.py --check    # equivalence checks only
+
+Large sizes need memory: 10^8 points use about 3 GB for r, V and F.
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'pyPairViz'))
+
+from models import kernels
+from models.registry import create_model
+
+def lj_reference(m, r):
+    V = 4 * m.epsilon_over_kB * ((m.sigma/r)**12 - (m.sigma/r)**6)
+    F = 24 * m.epsilon_over_kB * (2*(m.sigma/r)**12 - (m.sigma/r)**6) / r
+    return V, F
+
+def mie_reference(m, r):
+    V = m.epsilon_over_kB * ((m.sigma/r)**m.n - (m.sigma/r)**m.m)
+    F = m.epsilon_over_kB * (m.n*(m.sigma/r)**m.n - m.m*(m.sigma/r)**m.m) / r
+    return V, F
+
+def morse_reference(m, r):
+    x = np.exp(-m.a * (r - m.sigma))
+    return m.epsilon_over_kB * (1 - x)**2, -2 * m.epsilon_over_kB * m.a * x * (1 - x)
+
+def buckingham_reference(m, r):
+    V = m.A * np.exp(-m.B * r) - m.epsilon_over_kB * (m.sigma/r)**6
+    F = m.B * m.A * np.exp(-m.B * r) - 6 * m.epsilon_over_kB * (m.sigma/r)**6 / r
+    return V, F
+
+def yukawa_reference(m, r):
+    V = (m.epsilon_over_kB/r) * np.exp(-m.kappa * r)
+    return V, V * (m.kappa + 1/r)
+
+CASES = [
+    ("Lennard-Jones", {}, lj_reference),
+    ("Mie 14-6", {"n": 14, "m": 6}, mie_reference),
+    ("Mie 13.5-6.5", {"n": 13.5, "m": 6.5}, mie_reference),
+    ("Morse", {"a": 1.3}, morse_reference),
+    ("Buckingham", {"A": 5e5, "B": 3.0}, buckingham_reference),
+    ("Yukawa", {"kappa": 0.7}, yukawa_reference),
+]
+
+def build(name, params):
+    return create_model(name.split()[0], **params)
+
+def check(backends, num_points=20000):
+    """Assert every backend matches the reference expressions"""
+    ranges = [(0.8, 3.0), (2.5, 12.0), (8.0, 40.0)]
+    for backend in backends:
+        kernels.set_backend(backend)
+        for name, params, reference in CASES:
+            model = build(name, params)
+            for low, high in ranges:
+                r = np.linspace(low, high, num_points)
+                V_ref, F_ref = reference(model, r)
+                V_out = np.empty_like(r)
+                results = [("calculate", model.calculate(r), V_ref)]
+                if "out" in model.calculate.__code__.co_varnames:
+                    results.append(("calculate(out=)", model.calculate(r, out=V_out), V_ref))
+                V, F = model.energy_and_force(r)
+                results += [("energy", V, V_ref), ("force", F, F_ref)]
+                # Strided input takes the copy path of kernels.evaluate
+                results.append(("strided", model.calculate(r[::2]), V_ref[::2]))
+                for label, value, expected in results:
+                    np.testing.assert_allclose(
+                        value, expected, rtol=1e-10, atol=1e-12 * np.abs(expected).max(),
+                        err_msg=f"{backend} {name} {label} on [{low}, {high}]")
+        print(f"{backend}: all {len(CASES)} models agree with the NumPy reference")
+
+def best_time(func, size):
+    number = max(1, int(1e6 // size))
+    return min(timeit.repeat(func, repeat=3, number=number)) / number
+
+def run(sizes, backends, python_max):
+    check(backends)
+    print(f"\n{'model':<14}{'N':>12}" + "".join(f"{backend + ' V':>13}{backend + ' V,F':>13}"
+                                                for backend in backends))
+    for name, params, reference in CASES:
+        model = build(name, params)
+        for size in sizes:
+            r = np.linspace(2.5, 12.0, size)
+            row = f"{name:<14}{size:>12,}"
+            for backend in backends:
+                if backend == "python" and size > python_max:
+                    row += f"{'-':>13}{'-':>13}"
+                    continue
+                kernels.set_backend(backend)
+                # First call compiles (numba) or warms the work buffers
+                model.energy_and_force(r[:kernels.KERNEL_MIN_SIZE])
+                t_V = best_time(lambda r=r: model.calculate(r), size)
+                t_VF = best_time(lambda r=r: model.energy_and_force(r), size)
+                row += f"{t_V * 1e3:>11.3f}ms{t_VF * 1e3:>11.3f}ms"
+            print(row)
+            del r
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**3, 10**5, 10**7])
+    parser.add_argument("--backends", nargs="+", choices=kernels.BACKENDS,
+                        help="backends to compare (default: numpy, plus numba and auto "
+                             "when Numba is installed)")
+    parser.add_argument("--python-max", type=int, default=10**5,
+                        help="largest size timed with the uncompiled python backend")
+    parser.add_argument("--check", action="store_true", help="only run the equivalence checks")
+    args = parser.parse_args()
+
+    backends = args.backends or [backend for backend in kernels.available_backends()
+                                 if backend != "python"]
+    if args.backends is None and "numba" in backends:
+        backends.append("auto")
+    if args.check:
+        check(backends or ["numpy"])
+    else:
+        run(args.sizes, backends, args.python_max)
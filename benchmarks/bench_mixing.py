@@ -0,0 +1,68 @@
+"""Compare per-pair dictionary lookups with gathered mixture parameters.
+
+Random pairs of S species are evaluated with Lennard-Jones parameters from
+the Lorentz-Berthelot rule: first by looking up (ε_ij, σ_ij) in a dict for
+every pair, as a plain Python mixture would, then through Mixture's gathers
+from contiguous coefficient arrays, and through a TabulatedMixture.
+
+    python benchmarks/bench_mixing.py [--species 10 50] [--pairs 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'pyPairViz'))
+
+from models.potential_models import LennardJones
+from models.mixing import Mixture
+
+def dict_lookup(parameters, r, si, sj):
+    """Reference: one dict lookup per pair, then a vectorized LJ evaluation"""
+    epsilon = np.empty_like(r)
+    sigma = np.empty_like(r)
+    for k, key in enumerate(zip(si.tolist(), sj.tolist())):
+        epsilon[k], sigma[k] = parameters[key]
+    sr6 = (sigma / r)**6
+    return 4 * epsilon * sr6 * (sr6 - 1)
+
+def run(species_counts, n_pairs):
+    rng = np.random.default_rng(1)
+    print(f"{'species':>8}{'pairs':>10}{'dict lookup':>14}{'gathered':>12}{'tabulated':>12}{'speedup':>10}")
+    for n_species in species_counts:
+        epsilon = rng.uniform(50.0, 250.0, n_species)
+        sigma = rng.uniform(2.8, 4.2, n_species)
+        mixture = Mixture(LennardJones, epsilon, sigma, "lorentz-berthelot")
+        table = mixture.tabulate(r_min=2.0, r_max=12.0)
+        parameters = {(a, b): (mixture.epsilon_matrix[a, b], mixture.sigma_matrix[a, b])
+                      for a in range(n_species) for b in range(n_species)}
+
+        si = rng.integers(0, n_species, n_pairs)
+        sj = rng.integers(0, n_species, n_pairs)
+        r = rng.uniform(3.0, 12.0, n_pairs)
+
+        start = time.perf_counter()
+        reference = dict_lookup(parameters, r, si, sj)
+        t_dict = time.perf_counter() - start
+
+        start = time.perf_counter()
+        V = mixture.calculate(r, si, sj)
+        t_gather = time.perf_counter() - start
+
+        start = time.perf_counter()
+        V_table = table.calculate(r, si, sj)
+        t_table = time.perf_counter() - start
+
+        assert np.allclose(V, reference, rtol=1e-12, atol=1e-12)
+        assert np.allclose(V_table, reference, rtol=1e-6, atol=1e-6)
+        print(f"{n_species:>8}{n_pairs:>10}{t_dict:>13.3f}s{t_gather:>11.3f}s"
+              f"{t_table:>11.3f}s{t_dict / t_gather:>9.0f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--species", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--pairs", type=int, default=1000000)
+    args = parser.parse_args()
+    run(args.species, args.pairs)
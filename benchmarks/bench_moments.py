@@ -0,0 +1,70 @@
+"""Compare direct and moment-sum total energies of Lennard-Jones/Mie configurations.
+
+Particles are placed uniformly at a liquid-like density. The pair distances
+below r_cut are found once; the direct path then evaluates the model on
+every pair per parameter change, while PowerMoments rescales the cached sums
+S_k = Σ r^-k. Changing ε/σ reuses the sums; changing the Mie exponents costs
+one pass for the new ones.
+
+    python benchmarks/bench_moments.py [--sizes 1000 10000 100000] [--repeat 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'pyPairViz'))
+
+from models.potential_models import LennardJones, MiePotential
+from engine.moments import PowerMoments
+
+def best_time(function, repeat):
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(sizes, repeat, reduced_density=0.8, r_cut_sigma=2.5):
+    model = LennardJones()
+    density = reduced_density / model.sigma**3
+    r_cut = r_cut_sigma * model.sigma
+    rng = np.random.default_rng(1)
+
+    print(f"{'N':>8}{'pairs':>10}{'direct':>12}{'ε/σ change':>14}{'new n, m':>12}{'speedup':>10}")
+    for n in sizes:
+        box = np.full(3, (n / density) ** (1/3))
+        positions = rng.uniform(0, box, size=(n, 3))
+        moments = PowerMoments.from_configuration(positions, box, r_cut)
+        r = moments.distances
+
+        # Fill the cache for the LJ exponents before timing parameter changes
+        moments.energies(model)
+        epsilons = iter(np.linspace(100.0, 140.0, repeat))
+
+        def change_epsilon():
+            model.set_parameters(epsilon_over_kB=next(epsilons))
+            return moments.energy(model)
+
+        t_direct = best_time(lambda: model.calculate(r).sum(), repeat)
+        t_moments = best_time(change_epsilon, repeat)
+        assert np.isclose(moments.energy(model), model.calculate(r).sum(), rtol=1e-9)
+
+        exponents = iter(np.linspace(13.0, 15.0, repeat))
+        def change_exponent():
+            mie = MiePotential(n=next(exponents))
+            return moments.energy(mie)
+        t_exponent = best_time(change_exponent, repeat)
+
+        print(f"{n:>8}{len(r):>10}{t_direct * 1e3:>10.2f}ms{t_moments * 1e6:>12.1f}µs"
+              f"{t_exponent * 1e3:>10.2f}ms{t_direct / t_moments:>9.0f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
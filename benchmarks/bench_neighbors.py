@@ -0,0 +1,81 @@
+"""Compare brute-force O(N²) and cell-list O(N) energy/force evaluation.
+
+Particles are placed uniformly at a liquid-like Lennard-Jones density.
+The brute-force path is timed up to ``--brute-max`` particles and
+extrapolated as N² beyond that.
+
+    python benchmarks/bench_neighbors.py [--sizes 1000 10000 100000] [--brute-max 10000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'pyPairViz'))
+
+from models.potential_models import LennardJones
+from engine.neighbors import VerletList, energy_and_forces, minimum_image
+
+def brute_force(model, positions, box, r_cut, block_size=256):
+    """Reference O(N²) energy and forces, processed in row blocks"""
+    n = len(positions)
+    energy = 0.0
+    forces = np.zeros_like(positions)
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        d = minimum_image(positions[None, :, :] - positions[start:stop, None, :], box)
+        r2 = np.einsum("abk,abk->ab", d, d)
+        i, j = np.nonzero((r2 < r_cut * r_cut) &
+                          (np.arange(n)[None, :] > np.arange(start, stop)[:, None]))
+        r = np.sqrt(r2[i, j])
+        V, F = model.energy_and_force(r)
+        energy += V.sum()
+        f = (F / r)[:, None] * d[i, j]
+        np.add.at(forces, j, f)
+        np.add.at(forces, i + start, -f)
+    return energy, forces
+
+def run(sizes, brute_max, reduced_density=0.8, r_cut_sigma=2.5):
+    model = LennardJones()
+    density = reduced_density / model.sigma**3
+    r_cut = r_cut_sigma * model.sigma
+    rng = np.random.default_rng(1)
+
+    print(f"{'N':>8}{'brute force':>16}{'cell list':>14}{'reused list':>14}{'speedup':>10}")
+    brute_reference = None
+    for n in sizes:
+        box = np.full(3, (n / density) ** (1/3))
+        positions = rng.uniform(0, box, size=(n, 3))
+
+        neighbor_list = VerletList(r_cut, skin=0.3 * model.sigma)
+        start = time.perf_counter()
+        energy, forces = energy_and_forces(model, positions, box, neighbor_list)
+        t_cell = time.perf_counter() - start
+
+        # Second call reuses the Verlet list (no rebuild)
+        start = time.perf_counter()
+        energy_and_forces(model, positions, box, neighbor_list)
+        t_reuse = time.perf_counter() - start
+
+        if n <= brute_max:
+            start = time.perf_counter()
+            energy_ref, forces_ref = brute_force(model, positions, box, r_cut)
+            t_brute = time.perf_counter() - start
+            assert np.isclose(energy, energy_ref, rtol=1e-9)
+            assert np.allclose(forces, forces_ref, rtol=1e-6, atol=1e-6 * np.abs(forces_ref).max())
+            brute_reference = (n, t_brute)
+            label = f"{t_brute:>14.3f}s"
+        else:
+            n_ref, t_ref = brute_reference
+            t_brute = t_ref * (n / n_ref) ** 2
+            label = f"~{t_brute:>13.1f}s"
+        print(f"{n:>8}{label}{t_cell:>13.3f}s{t_reuse:>13.3f}s{t_brute / t_cell:>9.0f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--brute-max", type=int, default=10000)
+    args = parser.parse_args()
+    run(args.sizes, args.brute_max)
@@ -0,0 +1,53 @@
+"""Benchmark the fused-power LennardJones/MiePotential evaluation paths.
+
+Compares the current ``calculate`` (with and without a preallocated
+``out=`` buffer) against the original two-``**`` expressions.
+
+    python benchmarks/bench_potentials.py [num_points]
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'pyPairViz'))
+
+from models.potential_models import LennardJones, MiePotential
+
+def lj_reference(model, r):
+    return 4 * model.epsilon_over_kB * ((model.sigma/r)**12 - (model.sigma/r)**6)
+
+def mie_reference(model, r):
+    return model.epsilon_over_kB * ((model.sigma/r)**model.n - (model.sigma/r)**model.m)
+
+def best_time(func, repeat=5, number=5):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+def run(num_points=1_000_000):
+    r = np.linspace(3.0, 12.0, num_points)
+    out = np.empty_like(r)
+
+    mie_int = MiePotential()
+    mie_int.n, mie_int.m = 14, 6
+    mie_float = MiePotential()
+    mie_float.n, mie_float.m = 13.5, 6.5
+
+    cases = [
+        ("Lennard-Jones", LennardJones(), lj_reference),
+        ("Mie 14-6", mie_int, mie_reference),
+        ("Mie 13.5-6.5", mie_float, mie_reference),
+    ]
+
+    print(f"{num_points:,} pair distances")
+    print(f"{'model':<16}{'reference':>12}{'calculate':>12}{'out=':>12}{'speedup':>10}")
+    for name, model, reference in cases:
+        np.testing.assert_allclose(model.calculate(r), reference(model, r), rtol=1e-10)
+        t_ref = best_time(lambda: reference(model, r))
+        t_new = best_time(lambda: model.calculate(r))
+        t_out = best_time(lambda: model.calculate(r, out=out))
+        print(f"{name:<16}{t_ref*1e3:>10.2f}ms{t_new*1e3:>10.2f}ms"
+              f"{t_out*1e3:>10.2f}ms{t_ref/t_out:>9.1f}x")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,67 @@
+"""Measure the import cost of starting the pyPairViz GUI.
+
+Runs ``python -X importtime -c "import main"`` in a fresh interpreter, the
+import work done before the window can appear, and reports the total and
+the slowest modules. Exits non-zero when the total exceeds ``--budget`` or
+when matplotlib is imported at startup (it should load on the first draw).
+
+    python benchmarks/bench_startup.py [--budget 250] [--repeat 5] [--top 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'pyPairViz')
+
+# Modules that must not be imported until they are first needed
+DEFERRED = ("matplotlib", "concurrent.futures", "multiprocessing")
+
+def import_times():
+    """Cumulative import time (ms) per top-level module entry of one cold start"""
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                             cwd=APP_DIR, capture_output=True, text=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self | cumulative | <2 spaces per nesting level>name"
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.rstrip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return times
+
+def run(budget, repeat, top):
+    # The best of several runs filters out disk-cache and scheduler noise
+    runs = [import_times() for _ in range(repeat)]
+    best = min(runs, key=lambda times: sum(cumulative for _, cumulative, depth in times.values()
+                                           if depth == 0))
+    total = sum(cumulative for _, cumulative, depth in best.values() if depth == 0) / 1000
+
+    print(f"{'module':<48}{'self':>10}{'cumulative':>13}")
+    slowest = sorted(best.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    for name, (self_us, cumulative_us, _) in slowest:
+        print(f"{name:<48}{self_us / 1000:>8.1f}ms{cumulative_us / 1000:>11.1f}ms")
+    print(f"total import time: {total:.1f} ms (best of {repeat}, budget {budget:.0f} ms)")
+
+    failures = []
+    eager = sorted(name for name in best
+                   if any(name == module or name.startswith(module + ".") for module in DEFERRED))
+    if eager:
+        failures.append(f"imported at startup: {', '.join(eager[:5])}"
+                        + (" ..." if len(eager) > 5 else ""))
+    if total > budget:
+        failures.append(f"total import time {total:.1f} ms exceeds the {budget:.0f} ms budget")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=250.0,
+                        help="maximum total import time in ms")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    sys.exit(run(args.budget, args.repeat, args.top))
@@ -0,0 +1,57 @@
+"""Compare TabulatedPotential lookups with the analytic models they replace.
+
+Times ``calculate`` and ``energy_and_force`` of the analytic model and of
+its table (r and r² spacing) on random distances, for each kernel backend.
+With a compiled backend the table runs through the fused
+``hermite_lookup`` kernel; the NumPy path pays for its gathers.
+
+    python benchmarks/bench_tabulated.py [num_points] [--backends numpy numba]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'pyPairViz'))
+
+from models import kernels
+from models.potential_models import (BuckinghamPotential, LennardJones, SquareWell,
+                                     YukawaPotential)
+from models.tabulated import TabulatedPotential
+
+def best_time(func, repeat=5, number=3):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+def run(num_points, backends):
+    r = np.random.default_rng(0).uniform(2.5, 9.9, num_points)
+    models = [LennardJones(), BuckinghamPotential(A=5e5, B=3.0), YukawaPotential(), SquareWell()]
+
+    print(f"{num_points:,} random pair distances")
+    print(f"{'backend':<8}{'model':<14}{'spacing':>8}{'model V':>12}{'table V':>12}"
+          f"{'model V,F':>12}{'table V,F':>12}")
+    for backend in backends:
+        kernels.set_backend(backend)
+        for model in models:
+            for spacing in ("r", "r2"):
+                table = TabulatedPotential(model, spacing=spacing)
+                # First call compiles the kernel (numba)
+                table.energy_and_force(r[:kernels.KERNEL_MIN_SIZE])
+                times = [best_time(lambda: model.calculate(r)),
+                         best_time(lambda: table.calculate(r)),
+                         best_time(lambda: model.energy_and_force(r)),
+                         best_time(lambda: table.energy_and_force(r))]
+                print(f"{backend:<8}{model.name:<14}{spacing:>8}"
+                      + "".join(f"{t * 1e3:>10.2f}ms" for t in times))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("num_points", type=int, nargs="?", default=1_000_000)
+    parser.add_argument("--backends", nargs="+", choices=kernels.BACKENDS,
+                        help="backends to compare (default: numpy, plus auto when Numba "
+                             "is installed)")
+    args = parser.parse_args()
+    backends = args.backends or ["numpy"] + (
+        ["auto"] if "numba" in kernels.available_backends() else [])
+    run(args.num_points, backends)
@@ -0,0 +1,37 @@
+"""Convert trajectories between XYZ and the binary .pvtraj format, streaming.
+
+    python convert.py run.xyz run.pvtraj [--precision float64] [--box LX LY LZ]
+    python convert.py run.pvtraj run.xyz
+
+The direction follows from the extensions. Binary files are read through
+np.memmap, so re-analysing a run skips the text parsing entirely.
+"""
+import argparse
+import sys
+
+from engine.binary_trajectory import EXTENSION, PRECISIONS, binary_to_xyz, xyz_to_binary
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--precision", choices=PRECISIONS, default="float32",
+                        help="position precision of binary output")
+    parser.add_argument("--box", type=float, nargs=3, metavar=("LX", "LY", "LZ"),
+                        help="box lengths (Å) for XYZ frames without a Lattice")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.output.endswith(EXTENSION):
+            count = xyz_to_binary(args.input, args.output, args.box, args.precision)
+        elif args.input.endswith(EXTENSION):
+            count = binary_to_xyz(args.input, args.output)
+        else:
+            parser.error(f"one of the files must be a {EXTENSION} file")
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"error: {error}\n")
+    print(f"{count} frames written to {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
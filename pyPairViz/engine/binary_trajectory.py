@@ -0,0 +1,234 @@
+"""Compact binary trajectories that are read through ``np.memmap``.
+
+Layout (little-endian):
+
+    header    64 bytes, HEADER_DTYPE
+    species   n_particles fixed-width byte strings (species_width bytes
+              each; absent when 0), padded to a multiple of 8 bytes
+    frames    n_frames records of frame_dtype: step (int64), energy
+              (float64, NaN when unknown), box lengths (3 float64) and
+              positions (n_particles x 3, float32 or float64), each padded
+              to a multiple of 8 bytes
+
+Every frame has the same size, so frame k starts at a computed offset and is
+read without touching the others. The frame count follows from the file
+size, and a partly written last frame (e.g. after a crash) is ignored.
+"""
+import os
+
+import numpy as np
+
+from engine.trajectory import Frame, read_xyz
+
+MAGIC = b"PPVTRAJF"
+VERSION = 1
+EXTENSION = ".pvtraj"
+
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("position_bytes", "<u4"),
+    ("n_particles", "<u8"),
+    ("species_width", "<u4"),
+    ("reserved", "V36")
+])
+
+PRECISIONS = {"float32": 4, "float64": 8}
+
+def frame_dtype(n_particles, position_bytes):
+    fields = [
+        ("step", "<i8"),
+        ("energy", "<f8"),
+        ("box", "<f8", (3,)),
+        ("positions", f"<f{position_bytes}", (n_particles, 3))
+    ]
+    size = np.dtype(fields).itemsize
+    if size % 8:
+        fields.append(("padding", f"V{8 - size % 8}"))
+    return np.dtype(fields)
+
+def data_offset(n_particles, species_width):
+    species_bytes = n_particles * species_width
+    return HEADER_DTYPE.itemsize + species_bytes + (-species_bytes) % 8
+
+def read_header(path):
+    header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+    if len(header) == 0 or header["magic"][0] != MAGIC:
+        raise ValueError(f"{path} is not a binary trajectory")
+    header = header[0]
+    if header["version"] != VERSION:
+        raise ValueError(f"{path} has format version {header['version']}, expected {VERSION}")
+    return header
+
+class TrajectoryWriter:
+    """Append frames to a binary trajectory.
+
+    Frames are written as they arrive, so memory does not grow with the run.
+    The writer can be passed as the ``callback`` of MDSimulation.run or
+    MonteCarloSimulation.run to record their state. With ``append=True`` an
+    existing file with the same particle count and precision is extended.
+    """
+    def __init__(self, path, n_particles, species=None, precision="float32", append=False):
+        if precision not in PRECISIONS:
+            raise ValueError(f"precision must be one of {tuple(PRECISIONS)}, not {precision!r}")
+        self.path = path
+        self.n_particles = n_particles
+        self.dtype = frame_dtype(n_particles, PRECISIONS[precision])
+        self.record = np.zeros(1, dtype=self.dtype)
+
+        if append and os.path.exists(path):
+            header = read_header(path)
+            if (header["n_particles"] != n_particles
+                    or header["position_bytes"] != PRECISIONS[precision]):
+                raise ValueError(f"{path} holds {header['n_particles']} particles at "
+                                 f"{8 * header['position_bytes']}-bit precision")
+            offset = data_offset(n_particles, int(header["species_width"]))
+            self.file = open(path, "r+b")
+            # Drop a partly written last frame before appending
+            complete = (os.path.getsize(path) - offset) // self.dtype.itemsize
+            self.file.truncate(offset + complete * self.dtype.itemsize)
+            self.file.seek(0, os.SEEK_END)
+            return
+
+        species = None if species is None else np.asarray(species, dtype="S")
+        if species is not None and len(species) != n_particles:
+            raise ValueError("species needs one entry per particle")
+        header = np.zeros(1, dtype=HEADER_DTYPE)
+        header["magic"] = MAGIC
+        header["version"] = VERSION
+        header["position_bytes"] = PRECISIONS[precision]
+        header["n_particles"] = n_particles
+        header["species_width"] = 0 if species is None else species.dtype.itemsize
+
+        self.file = open(path, "wb")
+        self.file.write(header.tobytes())
+        if species is not None:
+            self.file.write(species.tobytes())
+            self.file.write(bytes(-species.nbytes % 8))
+
+    def write(self, positions, box, energy=None, step=None):
+        """Append one frame; a missing ``energy`` (K) is stored as NaN and a missing step as -1"""
+        record = self.record[0]
+        record["positions"] = positions
+        record["box"] = box
+        record["energy"] = np.nan if energy is None else energy
+        record["step"] = -1 if step is None else step
+        self.file.write(self.record.tobytes())
+
+    def __call__(self, simulation):
+        """Append the current state of an MDSimulation or MonteCarloSimulation"""
+        if hasattr(simulation, "step_count"):
+            self.write(simulation.positions, simulation.box,
+                       simulation.potential_energy, simulation.step_count)
+        else:
+            self.write(simulation.positions, simulation.box,
+                       simulation.energy, simulation.sweeps)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class BinaryTrajectory:
+    """Memory-mapped view of a binary trajectory.
+
+    ``positions``, ``boxes``, ``energies`` and ``steps`` are zero-copy views
+    over all frames; ``trajectory[k]`` returns frame k as a Frame whose
+    arrays are also views into the file.
+    """
+    def __init__(self, path):
+        self.path = path
+        header = read_header(path)
+        self.n_particles = int(header["n_particles"])
+        species_width = int(header["species_width"])
+        self.dtype = frame_dtype(self.n_particles, int(header["position_bytes"]))
+
+        self.species = None
+        if species_width:
+            self.species = np.fromfile(path, dtype=f"S{species_width}", count=self.n_particles,
+                                       offset=HEADER_DTYPE.itemsize).astype(str)
+
+        offset = data_offset(self.n_particles, species_width)
+        n_frames = (os.path.getsize(path) - offset) // self.dtype.itemsize
+        # np.memmap cannot map zero bytes, so an empty file gets an empty array
+        if n_frames:
+            self.frames_array = np.memmap(path, dtype=self.dtype, mode="r",
+                                          offset=offset, shape=(n_frames,))
+        else:
+            self.frames_array = np.zeros(0, dtype=self.dtype)
+
+    def __len__(self):
+        return len(self.frames_array)
+
+    def __getitem__(self, index):
+        record = self.frames_array[index]
+        energy = float(record["energy"])
+        step = int(record["step"])
+        return Frame(record["positions"], record["box"], self.species,
+                     step if step >= 0 else None, None if np.isnan(energy) else energy)
+
+    @property
+    def positions(self):
+        return self.frames_array["positions"]
+
+    @property
+    def boxes(self):
+        return self.frames_array["box"]
+
+    @property
+    def energies(self):
+        return self.frames_array["energy"]
+
+    @property
+    def steps(self):
+        return self.frames_array["step"]
+
+    def frames(self, start=0, stop=None, step=1):
+        """Yield frames start:stop:step; skipped frames are never read"""
+        for index in range(*slice(start, stop, step).indices(len(self))):
+            yield self[index]
+
+def xyz_to_binary(xyz_path, path, box=None, precision="float32"):
+    """Convert an XYZ trajectory frame by frame; returns the number of frames.
+
+    ``box`` is used for frames without an extended-XYZ Lattice.
+    """
+    writer = None
+    count = 0
+    try:
+        for frame in read_xyz(xyz_path, box):
+            if frame.box is None:
+                raise ValueError(f"{xyz_path} gives no box; pass the box lengths")
+            if writer is None:
+                writer = TrajectoryWriter(path, len(frame), frame.species, precision)
+            elif len(frame) != writer.n_particles:
+                raise ValueError(f"{xyz_path}: frame {count} has {len(frame)} particles, "
+                                 f"not {writer.n_particles}")
+            writer.write(frame.positions, frame.box, frame.energy, frame.step)
+            count += 1
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+def binary_to_xyz(path, xyz_path):
+    """Write a binary trajectory as extended XYZ frame by frame; returns the number of frames"""
+    trajectory = BinaryTrajectory(path)
+    species = (trajectory.species if trajectory.species is not None
+               else np.full(trajectory.n_particles, "X"))
+    with open(xyz_path, "w") as f:
+        for frame in trajectory.frames():
+            Lx, Ly, Lz = frame.box
+            comment = f'Lattice="{Lx:.10g} 0 0 0 {Ly:.10g} 0 0 0 {Lz:.10g}" Properties=species:S:1:pos:R:3'
+            if frame.energy is not None:
+                comment += f" energy={frame.energy:.10g}"
+            if frame.step is not None:
+                comment += f" step={frame.step}"
+            f.write(f"{trajectory.n_particles}\n{comment}\n")
+            f.writelines(f"{name} {x:.8f} {y:.8f} {z:.8f}\n"
+                         for name, (x, y, z) in zip(species, frame.positions.tolist()))
+    return len(trajectory)
@@ -0,0 +1,140 @@
+import numpy as np
+
+from engine.neighbors import iter_pair_blocks, minimum_image
+
+class ConfigurationResult:
+    """Energy, forces and virial of one particle configuration.
+
+    Energies are in K (ε/kB units), forces in K/Å and the virial tensor
+    W = Σ_pairs r_ij ⊗ f_ij in K.
+    """
+    def __init__(self, energy, per_particle_energy, forces, virial, volume):
+        self.energy = energy
+        self.per_particle_energy = per_particle_energy
+        self.forces = forces
+        self.virial = virial
+        self.volume = volume
+
+    def pressure(self, temperature):
+        """Virial pressure (K/Å³) at ``temperature`` (K)"""
+        n = len(self.forces)
+        return (n * temperature + np.trace(self.virial) / 3) / self.volume
+
+class ConfigurationAccumulator:
+    """Accumulate per-pair energies and forces into per-particle totals
+
+    With ``species`` (one index per particle) the model is a Mixture or
+    TabulatedMixture and is given the species of both particles of each pair.
+    """
+    def __init__(self, n, dim, species=None):
+        self.n = n
+        self.species = species
+        self.energy = 0.0
+        self.per_particle_energy = np.zeros(n)
+        self.forces = np.zeros((n, dim))
+        self.virial = np.zeros((dim, dim))
+
+    def reset(self):
+        """Zero the totals in place, so one accumulator serves every step"""
+        self.energy = 0.0
+        self.per_particle_energy.fill(0.0)
+        self.forces.fill(0.0)
+        self.virial.fill(0.0)
+
+    def add(self, model, i, j, d, r2):
+        if len(i) == 0:
+            return
+        r = np.sqrt(r2)
+        if self.species is None:
+            V, F = model.energy_and_force(r)
+        else:
+            V, F = model.energy_and_force(r, self.species[i], self.species[j])
+        V = np.asarray(V, dtype=float)
+
+        self.energy += V.sum()
+        half = 0.5 * V
+        self.per_particle_energy += np.bincount(i, half, self.n)
+        self.per_particle_energy += np.bincount(j, half, self.n)
+
+        # Force on j along +d is F(r)·d/r; i receives the opposite
+        w = np.asarray(F, dtype=float) / r
+        for k in range(d.shape[1]):
+            fk = w * d[:, k]
+            self.forces[:, k] += np.bincount(j, fk, self.n)
+            self.forces[:, k] -= np.bincount(i, fk, self.n)
+        self.virial += np.einsum("p,pa,pb->ab", w, d, d)
+
+def iter_all_pair_blocks(positions, box, max_block_pairs):
+    """Yield (i, j, d, r2) blocks covering every pair i < j under minimum image.
+
+    Rows are processed in blocks of ``max_block_pairs // N`` so no N×N array
+    is ever materialized.
+    """
+    n = len(positions)
+    rows = max(1, max_block_pairs // max(n, 1))
+    for start in range(0, n, rows):
+        stop = min(start + rows, n)
+        # Only columns beyond the first row of the block can pair with it
+        cols = np.arange(start + 1, n)
+        d = minimum_image(positions[None, cols, :] - positions[start:stop, None, :], box)
+        a, b = np.nonzero(cols[None, :] > np.arange(start, stop)[:, None])
+        d = d[a, b]
+        yield a + start, cols[b], d, np.einsum("ij,ij->i", d, d)
+
+def compute_configuration(model, positions, box, r_cut=None, max_block_pairs=1 << 22,
+                          species=None):
+    """Total energy, per-particle energy, forces and virial of a configuration.
+
+    ``positions`` is an (N, 3) array in an orthorhombic periodic ``box``
+    (three edge lengths) with minimum-image convention. With ``r_cut`` only
+    pairs closer than the cutoff are evaluated through a cell list, which is
+    O(N); wrap the model in a TruncatedPotential for shifted cutoffs. Without
+    it every pair is evaluated, O(N²), in blocks of at most
+    ``max_block_pairs`` pairs so memory stays bounded.
+
+    For a multi-component Mixture (or TabulatedMixture) ``model``, ``species``
+    gives each particle's species index (see ``model.species_indices``).
+
+    Each pair energy is split equally between its two particles.
+    """
+    positions = np.asarray(positions, dtype=float)
+    box = np.asarray(box, dtype=float)
+    n, dim = positions.shape
+
+    if r_cut is None:
+        blocks = iter_all_pair_blocks(positions, box, max_block_pairs)
+    else:
+        if np.any(r_cut > box / 2):
+            raise ValueError("r_cut must not exceed half the box length")
+        blocks = iter_pair_blocks(positions, box, r_cut)
+
+    if species is not None:
+        species = np.asarray(species, dtype=np.intp)
+        if species.shape != (n,):
+            raise ValueError("species needs one index per particle")
+    accumulator = ConfigurationAccumulator(n, dim, species)
+    for i, j, d, r2 in blocks:
+        accumulator.add(model, i, j, d, r2)
+
+    return ConfigurationResult(
+        float(accumulator.energy),
+        accumulator.per_particle_energy,
+        accumulator.forces,
+        accumulator.virial,
+        float(np.prod(box))
+    )
+
+def cubic_lattice(n_particles, density):
+    """Simple cubic starting configuration of ``n_particles`` at number density ρ (Å⁻³).
+
+    Returns (positions, box). The lattice has ceil(N^(1/3)) sites per edge,
+    so the first N sites are filled when N is not a perfect cube.
+    """
+    edge = (n_particles / density) ** (1/3)
+    sites = int(round(n_particles ** (1/3)))
+    if sites**3 < n_particles:
+        sites += 1
+    spacing = edge / sites
+    grid = np.arange(sites) * spacing + 0.5 * spacing
+    positions = np.stack(np.meshgrid(grid, grid, grid, indexing="ij"), axis=-1).reshape(-1, 3)
+    return positions[:n_particles].copy(), np.full(3, edge)
@@ -0,0 +1,267 @@
+import heapq
+import itertools
+
+import numpy as np
+
+from models.potential_models import HardSphere, SquareWell
+from engine.md import KB_OVER_AMU
+from engine.neighbors import CellGrid, find_pairs, minimum_image
+
+# Event types
+CORE, WELL_ENTRY, WELL_EXIT, CELL_CROSSING = range(4)
+
+class EventDrivenSimulation:
+    """Event-driven (collision-scheduled) dynamics for HardSphere and SquareWell.
+
+    Particles move ballistically between events. Core collisions at
+    ``sigma``, well entries and exits at ``sigma * well_width``, and cell
+    crossings are predicted exactly and kept in a priority queue. Stale events
+    are discarded lazily through per-particle event counters. Each particle
+    only looks at the 27 surrounding cells, so an event costs O(log N).
+
+    Positions are stored per particle at the time of its last event
+    ("delayed states") and synchronised by ``current_positions``.
+
+    Units: Å, ps, amu and K, as in MDSimulation. The initial temperature is
+    ``temperature`` in K, or ``reduced_temperature`` scaled by
+    ``model.epsilon_over_kB``.
+    """
+    def __init__(self, model, positions, box, mass=39.948, temperature=None,
+                 reduced_temperature=1.0, seed=None):
+        if not isinstance(model, (HardSphere, SquareWell)):
+            raise ValueError("event-driven dynamics supports HardSphere and SquareWell only")
+
+        self.model = model
+        self.box = np.asarray(box, dtype=float)
+        self.mass = mass
+        self.sigma2 = model.sigma**2
+        if isinstance(model, SquareWell):
+            self.well_range = model.sigma * model.well_width
+            self.well_energy = model.epsilon_over_kB * model.well_depth
+        else:
+            self.well_range = None
+            self.well_energy = 0.0
+        self.interaction_range = self.well_range or model.sigma
+        self.well2 = self.well_range**2 if self.well_range else None
+        # Relative radial speed² released by the well: 2U/μ with μ = m/2
+        self.well_dv2 = 4 * self.well_energy * KB_OVER_AMU / mass
+        self.temperature_target = (
+            temperature if temperature is not None
+            else reduced_temperature * model.epsilon_over_kB
+        )
+        self.rng = np.random.default_rng(seed)
+
+        self.positions = np.mod(np.array(positions, dtype=float), self.box)
+        self.n_particles = len(self.positions)
+        self.local_time = np.zeros(self.n_particles)
+        self.event_count = np.zeros(self.n_particles, dtype=np.int64)
+        self.time = 0.0
+
+        self.velocities = self.rng.standard_normal(self.positions.shape)
+        self.velocities *= np.sqrt(KB_OVER_AMU * self.temperature_target / mass)
+        self.velocities -= self.velocities.mean(axis=0)
+
+        # Counters and collisional virial Σ r·Δp for the pressure
+        self.events_processed = dict.fromkeys((CORE, WELL_ENTRY, WELL_EXIT, CELL_CROSSING), 0)
+        self.events_invalidated = 0
+        self.virial_sum = 0.0
+
+        if np.any(self.interaction_range > self.box / 2):
+            raise ValueError("the interaction range must not exceed half the box length")
+        i, j = find_pairs(self.positions, self.box, self.interaction_range)
+        d = minimum_image(self.positions[j] - self.positions[i], self.box)
+        r2 = np.einsum("ij,ij->i", d, d)
+        if np.any(r2 < self.sigma2 * (1 - 1e-10)):
+            raise ValueError("initial configuration has overlapping hard cores")
+        self.bonded_pairs = int(np.count_nonzero(r2 < self.well2)) if self.well2 else 0
+
+        self.build_cells()
+        self.queue = []
+        self.sequence = itertools.count()
+        for particle in range(self.n_particles):
+            self.predict(particle)
+
+    def build_cells(self):
+        self.grid = CellGrid(self.positions, self.box, self.interaction_range)
+
+    def positions_at(self, particles, t):
+        return self.positions[particles] + self.velocities[particles] * (t - self.local_time[particles])[..., None]
+
+    def advance(self, particle):
+        """Bring one particle's stored position up to the current time"""
+        self.positions[particle] += self.velocities[particle] * (self.time - self.local_time[particle])
+        self.local_time[particle] = self.time
+
+    def push(self, t, kind, i, j=-1):
+        count_j = self.event_count[j] if j >= 0 else -1
+        heapq.heappush(self.queue, (t, next(self.sequence), kind, i, j,
+                                    self.event_count[i], count_j))
+
+    def predict(self, i):
+        """Schedule the next cell crossing and all pair events of particle i"""
+        self.predict_cell_crossing(i)
+
+        others = self.grid.neighbors_of(i)
+        if len(others) == 0:
+            return
+        r = minimum_image(self.positions_at(others, self.time) -
+                          self.positions_at(i, self.time), self.box)
+        v = self.velocities[others] - self.velocities[i]
+        r2 = np.einsum("ij,ij->i", r, r)
+        b = np.einsum("ij,ij->i", r, v)
+        v2 = np.einsum("ij,ij->i", v, v)
+
+        times = np.full(len(others), np.inf)
+        kinds = np.full(len(others), CORE)
+        approaching = b < 0
+
+        # Core collisions
+        disc = b*b - v2*(r2 - self.sigma2)
+        core = approaching & (disc > 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            times = np.where(core, (r2 - self.sigma2) / (-b + np.sqrt(np.maximum(disc, 0))), times)
+
+        if self.well2 is not None:
+            # At the well boundary the sign of b tells which side the pair is on
+            tol = 1e-9 * self.well2
+            inside = (r2 < self.well2 - tol) | ((np.abs(r2 - self.well2) <= tol) & approaching)
+            disc_well = b*b - v2*(r2 - self.well2)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                exit_time = (-b + np.sqrt(np.maximum(disc_well, 0))) / v2
+                entry_time = (r2 - self.well2) / (-b + np.sqrt(np.maximum(disc_well, 0)))
+            leaving = inside & ~core & (v2 > 0)
+            times = np.where(leaving, exit_time, times)
+            kinds = np.where(leaving, WELL_EXIT, kinds)
+            entering = ~inside & approaching & (disc_well > 0)
+            times = np.where(entering, entry_time, times)
+            kinds = np.where(entering, WELL_ENTRY, kinds)
+
+        for j, dt, kind in zip(others, times, kinds):
+            if np.isfinite(dt):
+                self.push(self.time + max(dt, 0.0), int(kind), i, int(j))
+
+    def predict_cell_crossing(self, i):
+        x = self.positions_at(i, self.time)
+        v = self.velocities[i]
+        width = self.grid.cell_width
+        lower = self.grid.coords[i] * width
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dt = np.where(v > 0, (lower + width - x) / v,
+                          np.where(v < 0, (lower - x) / v, np.inf))
+        axis = int(np.argmin(dt))
+        self.push(self.time + max(dt[axis], 0.0), CELL_CROSSING, i, axis)
+
+    def collide(self, i, j, kind):
+        """Apply the velocity change of a pair event at the current time"""
+        self.advance(i)
+        self.advance(j)
+        r = minimum_image(self.positions[j] - self.positions[i], self.box)
+        v = self.velocities[j] - self.velocities[i]
+        r2 = r @ r
+        radial_speed = (r @ v) / np.sqrt(r2)
+
+        if kind == CORE:
+            new_speed = -radial_speed
+        elif kind == WELL_ENTRY:
+            new_speed = -np.sqrt(radial_speed**2 + self.well_dv2)
+            self.bonded_pairs += 1
+        elif radial_speed**2 > self.well_dv2:
+            new_speed = np.sqrt(radial_speed**2 - self.well_dv2)
+            self.bonded_pairs -= 1
+        else:
+            # Not enough energy to escape: bounce back into the well
+            new_speed = -radial_speed
+
+        dv = 0.5 * (new_speed - radial_speed) * r / np.sqrt(r2)
+        self.velocities[j] += dv
+        self.velocities[i] -= dv
+        self.virial_sum += self.mass * (r @ dv) / KB_OVER_AMU
+
+    def cross_cell(self, i, axis):
+        self.advance(i)
+        coords = self.grid.coords[i].copy()
+        step = 1 if self.velocities[i, axis] > 0 else -1
+        coords[axis] = (coords[axis] + step) % self.grid.shape[axis]
+        self.grid.move(i, coords)
+        # Pin the stored position to the edge of the new cell so rounding
+        # never leaves it outside; positions stay within [0, box]
+        edge = coords[axis] if step > 0 else coords[axis] + 1
+        self.positions[i, axis] = edge * self.grid.cell_width[axis]
+
+    def step(self):
+        """Process the next valid event; return its type"""
+        while True:
+            t, _, kind, i, j, count_i, count_j = heapq.heappop(self.queue)
+            if count_i == self.event_count[i] and (
+                    kind == CELL_CROSSING or count_j == self.event_count[j]):
+                break
+            self.events_invalidated += 1
+
+        self.time = t
+        if kind == CELL_CROSSING:
+            self.cross_cell(i, j)
+            self.event_count[i] += 1
+            self.predict(i)
+        else:
+            self.collide(i, j, kind)
+            self.event_count[i] += 1
+            self.event_count[j] += 1
+            self.predict(i)
+            self.predict(j)
+        self.events_processed[kind] += 1
+
+        # Drop stale entries once they dominate the queue
+        if len(self.queue) > 64 * self.n_particles:
+            self.compact_queue()
+        return kind
+
+    def compact_queue(self):
+        self.queue = [
+            event for event in self.queue
+            if event[5] == self.event_count[event[3]] and (
+                event[2] == CELL_CROSSING or event[6] == self.event_count[event[4]])
+        ]
+        heapq.heapify(self.queue)
+
+    def run(self, until_time=None, n_events=None):
+        """Process events until ``until_time`` (ps) or for ``n_events`` events"""
+        processed = 0
+        while n_events is None or processed < n_events:
+            if until_time is not None and self.queue and self.queue[0][0] > until_time:
+                self.time = until_time
+                break
+            self.step()
+            processed += 1
+        return processed
+
+    def current_positions(self):
+        """Positions of all particles at the current time, wrapped into the box"""
+        return np.mod(self.positions_at(np.arange(self.n_particles), self.time), self.box)
+
+    def kinetic_energy(self):
+        return 0.5 * self.mass * np.vdot(self.velocities, self.velocities) / KB_OVER_AMU
+
+    def potential_energy(self):
+        return -self.well_energy * self.bonded_pairs
+
+    def temperature(self):
+        return 2 * self.kinetic_energy() / (self.velocities.size - self.velocities.shape[1])
+
+    def pressure(self):
+        """Pressure (K/Å³) from the collisional virial averaged since t = 0"""
+        volume = np.prod(self.box)
+        ideal = self.n_particles * self.temperature()
+        if self.time == 0:
+            return ideal / volume
+        return (ideal + self.virial_sum / (3 * self.time)) / volume
+
+    def stats(self):
+        return {
+            "time": self.time,
+            "core_collisions": self.events_processed[CORE],
+            "well_entries": self.events_processed[WELL_ENTRY],
+            "well_exits": self.events_processed[WELL_EXIT],
+            "cell_crossings": self.events_processed[CELL_CROSSING],
+            "invalidated": self.events_invalidated,
+            "queue_size": len(self.queue)
+        }
@@ -0,0 +1,155 @@
+import numpy as np
+
+from engine.configuration import ConfigurationAccumulator, iter_all_pair_blocks
+from engine.neighbors import VerletList, pair_block
+
+# kB/amu in Å²·ps⁻²·K⁻¹: with energies in K (ε/kB units), masses in amu and
+# lengths in Å, a = F/m · KB_OVER_AMU gives accelerations in Å/ps²
+KB_OVER_AMU = 0.83144626
+
+THERMOSTATS = (None, "berendsen", "langevin")
+
+class MDSimulation:
+    """Velocity-Verlet molecular dynamics of N identical particles.
+
+    Forces come from ``model.energy_and_force`` through a Verlet neighbor
+    list when ``r_cut`` is given (O(N) per step), or from all minimum-image
+    pairs otherwise. Positions, velocities, forces and thermostat noise live
+    in arrays allocated once and updated in place every step; forces and
+    per-particle energies are accumulated straight into them.
+
+    Units: Å, ps, amu and K. The thermostat target is ``temperature`` in K,
+    or ``reduced_temperature`` T* = kB·T/ε scaled by ``model.epsilon_over_kB``.
+
+    Thermostats:
+        ``None``         plain NVE velocity Verlet
+        ``berendsen``    velocity rescaling towards the target with time
+                         constant ``tau`` (ps)
+        ``langevin``     BAOAB Langevin splitting with friction ``1/tau``
+    """
+    def __init__(self, model, positions, box, r_cut=None, skin=None, mass=39.948,
+                 dt=0.005, temperature=None, reduced_temperature=1.0,
+                 thermostat="berendsen", tau=0.5, seed=None):
+        if model.discontinuities():
+            raise ValueError(
+                f"{model.name} has a discontinuous potential; force-based "
+                "integration cannot handle it, use EventDrivenSimulation instead"
+            )
+        if thermostat not in THERMOSTATS:
+            raise ValueError(f"thermostat must be one of {THERMOSTATS}, not {thermostat!r}")
+
+        self.model = model
+        self.box = np.asarray(box, dtype=float)
+        self.mass = mass
+        self.dt = dt
+        self.thermostat = thermostat
+        self.tau = tau
+        self.target_temperature = (
+            temperature if temperature is not None
+            else reduced_temperature * model.epsilon_over_kB
+        )
+        self.rng = np.random.default_rng(seed)
+
+        self.r_cut = r_cut
+        self.neighbor_list = None
+        if r_cut is not None:
+            skin = 0.3 * model.sigma if skin is None else skin
+            self.neighbor_list = VerletList(r_cut, skin)
+
+        # State arrays, allocated once and updated in place
+        self.positions = np.array(positions, dtype=float)
+        np.mod(self.positions, self.box, out=self.positions)
+        self.velocities = np.empty_like(self.positions)
+        self.noise = np.empty_like(self.positions)
+        self.accumulator = ConfigurationAccumulator(*self.positions.shape)
+        self.forces = self.accumulator.forces
+        self.per_particle_energy = self.accumulator.per_particle_energy
+
+        self.step_count = 0
+        self.time = 0.0
+        self.potential_energy = 0.0
+
+        self.initialize_velocities(self.target_temperature)
+        self.compute_forces()
+
+    @property
+    def n_particles(self):
+        return len(self.positions)
+
+    @property
+    def degrees_of_freedom(self):
+        # Total momentum is conserved (and removed) without a Langevin bath
+        n_dof = self.positions.size
+        return n_dof if self.thermostat == "langevin" else n_dof - self.positions.shape[1]
+
+    def initialize_velocities(self, temperature):
+        """Draw Maxwell-Boltzmann velocities with zero total momentum"""
+        self.rng.standard_normal(out=self.velocities)
+        self.velocities *= np.sqrt(KB_OVER_AMU * temperature / self.mass)
+        self.velocities -= self.velocities.mean(axis=0)
+        current = self.temperature()
+        if current > 0:
+            self.velocities *= np.sqrt(temperature / current)
+
+    def compute_forces(self):
+        """Zero the force and energy buffers in place and accumulate every pair into them"""
+        self.accumulator.reset()
+        if self.neighbor_list is not None:
+            self.neighbor_list.update(self.positions, self.box)
+            i, j = self.neighbor_list.pairs()
+            blocks = [pair_block(self.positions, self.box, i, j, self.neighbor_list.r_cut)]
+        else:
+            blocks = iter_all_pair_blocks(self.positions, self.box, 1 << 22)
+        for i, j, d, r2 in blocks:
+            self.accumulator.add(self.model, i, j, d, r2)
+        self.potential_energy = float(self.accumulator.energy)
+
+    def kinetic_energy(self):
+        """Kinetic energy in K"""
+        return 0.5 * self.mass * np.vdot(self.velocities, self.velocities) / KB_OVER_AMU
+
+    def temperature(self):
+        """Instantaneous kinetic temperature in K"""
+        return 2 * self.kinetic_energy() / self.degrees_of_freedom
+
+    def total_energy(self):
+        return self.potential_energy + self.kinetic_energy()
+
+    def step(self):
+        """Advance one time step"""
+        half_kick = 0.5 * self.dt * KB_OVER_AMU / self.mass
+
+        # B: half kick, A: half drift
+        self.velocities += half_kick * self.forces
+        self.positions += 0.5 * self.dt * self.velocities
+
+        if self.thermostat == "langevin":
+            # O: exact Ornstein-Uhlenbeck update of the velocities
+            c1 = np.exp(-self.dt / self.tau)
+            c2 = np.sqrt((1 - c1*c1) * KB_OVER_AMU * self.target_temperature / self.mass)
+            self.rng.standard_normal(out=self.noise)
+            self.velocities *= c1
+            self.noise *= c2
+            self.velocities += self.noise
+
+        # A: half drift, wrap into the box, new forces, B: half kick
+        self.positions += 0.5 * self.dt * self.velocities
+        np.mod(self.positions, self.box, out=self.positions)
+        self.compute_forces()
+        self.velocities += half_kick * self.forces
+
+        if self.thermostat == "berendsen":
+            current = self.temperature()
+            if current > 0:
+                scale = 1 + self.dt / self.tau * (self.target_temperature / current - 1)
+                self.velocities *= np.sqrt(max(scale, 0.0))
+
+        self.step_count += 1
+        self.time += self.dt
+
+    def run(self, n_steps, callback=None, callback_interval=1):
+        """Advance ``n_steps``, calling ``callback(self)`` every ``callback_interval`` steps"""
+        for _ in range(n_steps):
+            self.step()
+            if callback is not None and self.step_count % callback_interval == 0:
+                callback(self)
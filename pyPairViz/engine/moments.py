@@ -0,0 +1,79 @@
+import numpy as np
+
+from engine.neighbors import iter_pair_blocks
+from models.potential_models import integer_powers, is_integral
+
+def frame_sums(values, offsets):
+    """Sum ``values`` over each frame's slice offsets[k]:offsets[k + 1]"""
+    sums = np.zeros(len(offsets) - 1)
+    # reduceat needs strictly valid start indices, so skip frames without pairs
+    nonempty = np.diff(offsets) > 0
+    if nonempty.any():
+        sums[nonempty] = np.add.reduceat(values, offsets[:-1][nonempty])
+    return sums
+
+class PowerMoments:
+    """Moment sums S_k = Σ r^-k over the pairs of each frame, cached by exponent.
+
+    For a potential that is a sum of power laws, V(r) = Σ c·r^-k (see
+    ``model.power_terms()``; LennardJones and MiePotential), the energy of a
+    frame is Σ c·S_k. Once the moments are known, changing ε or σ only
+    changes the coefficients and costs O(1) per frame, whatever the number of
+    pairs. A new exponent costs one pass over the distances; integer
+    exponents computed together share their squarings.
+
+    ``distances`` and ``offsets`` are laid out as in PairDistanceCache, frame
+    k owning ``distances[offsets[k]:offsets[k + 1]]``; without ``offsets``
+    all distances form one frame.
+    """
+    def __init__(self, distances, offsets=None):
+        self.distances = np.asarray(distances, dtype=float)
+        self.offsets = (np.array([0, len(self.distances)]) if offsets is None
+                        else np.asarray(offsets))
+        self.sums = {}
+
+    @classmethod
+    def from_configuration(cls, positions, box, r_cut):
+        """Moments of the pairs closer than ``r_cut`` in one periodic configuration"""
+        positions = np.asarray(positions, dtype=float)
+        box = np.asarray(box, dtype=float)
+        if np.any(r_cut > box / 2):
+            raise ValueError("r_cut must not exceed half the box length")
+        blocks = [np.sqrt(r2) for _, _, _, r2 in iter_pair_blocks(positions, box, r_cut)]
+        return cls(np.concatenate(blocks) if blocks else np.zeros(0))
+
+    def compute(self, exponents):
+        """Cache S_k for each exponent in ``exponents`` that is not known yet"""
+        missing = sorted({float(k) for k in exponents} - set(self.sums))
+        if not missing:
+            return
+        inv_r = 1.0 / self.distances
+        integral = [k for k in missing if is_integral(k)]
+        if integral:
+            outs = [np.empty_like(inv_r) for _ in integral]
+            integer_powers(inv_r, [int(k) for k in integral], outs, np.empty_like(inv_r))
+            for k, out in zip(integral, outs):
+                self.sums[k] = frame_sums(out, self.offsets)
+        for k in missing:
+            if k not in self.sums:
+                self.sums[k] = frame_sums(np.power(inv_r, k), self.offsets)
+
+    def moment(self, k):
+        """S_k of every frame"""
+        self.compute([k])
+        return self.sums[float(k)]
+
+    def energies(self, model):
+        """Total energy (K) of every frame under ``model``"""
+        terms = model.power_terms()
+        if terms is None:
+            raise ValueError(f"{model.name} is not a sum of power laws")
+        self.compute(k for _, k in terms)
+        energies = np.zeros(len(self.offsets) - 1)
+        for c, k in terms:
+            energies += c * self.sums[float(k)]
+        return energies
+
+    def energy(self, model):
+        """Total energy (K) under ``model``, summed over all frames"""
+        return float(self.energies(model).sum())
@@ -0,0 +1,259 @@
+import numpy as np
+
+from engine.configuration import compute_configuration
+from engine.neighbors import CellGrid, minimum_image
+
+def hard_core_radius(model):
+    """Distance below which ``model`` is infinite, or None for soft potentials"""
+    for point in sorted(model.discontinuities()):
+        inside = np.array([np.nextafter(point, 0.0)])
+        if not np.isfinite(model.calculate(inside)[0]):
+            return point
+    return None
+
+class MonteCarloSimulation:
+    """Canonical-ensemble Metropolis Monte Carlo of N identical particles.
+
+    A trial move displaces one particle uniformly within ``max_displacement``
+    along each axis. Only the energy change of that particle against its
+    neighbors in the surrounding cells is evaluated; the total energy is
+    updated incrementally and never recomputed per move. For hard-core models
+    (HardSphere, SquareWell, Sutherland, or any model that is infinite below
+    its first discontinuity) a trial position is rejected as soon as it
+    overlaps a core, before the model is evaluated on any pair.
+
+    ``sweep(batch=True)`` moves one particle from each cell of a checkerboard
+    parity class at once. Such cells are at least one cell width (>= r_cut)
+    apart, so as long as every particle stays in its own cell the moves do not
+    interact and can be accepted or rejected independently in one vectorized
+    pass. The checkerboard is shifted by a random offset before each batch, so
+    that particles can still cross every cell boundary.
+
+    ``run`` tunes ``max_displacement`` towards ``target_acceptance`` during
+    equilibration sweeps only, since tuning breaks detailed balance.
+
+    Units: Å and K, as in MDSimulation. The temperature is ``temperature`` in
+    K, or ``reduced_temperature`` scaled by ``model.epsilon_over_kB``.
+    """
+    def __init__(self, model, positions, box, r_cut=None, temperature=None,
+                 reduced_temperature=1.0, max_displacement=None,
+                 target_acceptance=0.4, seed=None):
+        self.model = model
+        self.box = np.asarray(box, dtype=float)
+        self.r_cut = 2.5 * model.sigma if r_cut is None else r_cut
+        if np.any(self.r_cut > self.box / 2):
+            raise ValueError("r_cut must not exceed half the box length")
+        if any(point >= self.r_cut for point in model.discontinuities()):
+            raise ValueError("r_cut must lie beyond every discontinuity of the potential")
+        self.r_cut2 = self.r_cut * self.r_cut
+        self.core = hard_core_radius(model)
+        self.core2 = None if self.core is None else self.core * self.core
+
+        self.temperature = (
+            temperature if temperature is not None
+            else reduced_temperature * model.epsilon_over_kB
+        )
+        self.beta = 1.0 / self.temperature
+        self.max_displacement = 0.1 * model.sigma if max_displacement is None else max_displacement
+        self.target_acceptance = target_acceptance
+        self.rng = np.random.default_rng(seed)
+
+        self.positions = np.mod(np.array(positions, dtype=float), self.box)
+        self.grid = CellGrid(self.positions, self.box, self.r_cut, even=True)
+        self.energy = self.recompute_energy()
+        if not np.isfinite(self.energy):
+            raise ValueError("initial configuration has overlapping hard cores")
+
+        self.sweeps = 0
+        self.attempted = 0
+        self.accepted = 0
+        self.window_attempted = 0
+        self.window_accepted = 0
+
+    @property
+    def n_particles(self):
+        return len(self.positions)
+
+    @property
+    def acceptance_ratio(self):
+        return self.accepted / self.attempted if self.attempted else 0.0
+
+    def recompute_energy(self):
+        """Full O(N) energy of the current configuration (K), for checks"""
+        return compute_configuration(self.model, self.positions, self.box, self.r_cut).energy
+
+    def pair_energy(self, r2):
+        inside = r2 < self.r_cut2
+        if not inside.any():
+            return 0.0
+        return float(np.sum(self.model.calculate(np.sqrt(r2[inside]))))
+
+    def particle_energy(self, particle, position, cell):
+        """Energy of ``particle`` placed at ``position`` with the neighbors of ``cell``"""
+        others = self.grid.neighbors_of(particle, cell)
+        if len(others) == 0:
+            return 0.0
+        d = minimum_image(self.positions[others] - position, self.box)
+        r2 = np.einsum("ij,ij->i", d, d)
+        if self.core2 is not None and np.any(r2 < self.core2):
+            return np.inf
+        return self.pair_energy(r2)
+
+    def attempt(self, particle, displacement, threshold):
+        """One Metropolis trial move; ``threshold`` is a uniform draw in [0, 1)"""
+        trial = np.mod(self.positions[particle] + displacement, self.box)
+        coords = self.grid.coords_at(trial)
+        self.attempted += 1
+        self.window_attempted += 1
+
+        # New energy first: an overlap rejects the move without touching the old pairs
+        new = self.particle_energy(particle, trial, self.grid.cell_index(coords))
+        if not np.isfinite(new):
+            return False
+        old = self.particle_energy(particle, self.positions[particle], self.grid.cell_of[particle])
+        delta = new - old
+        if delta > 0 and threshold >= np.exp(-self.beta * delta):
+            return False
+
+        self.positions[particle] = trial
+        self.grid.move(particle, coords)
+        self.energy += delta
+        self.accepted += 1
+        self.window_accepted += 1
+        return True
+
+    def sweep(self, batch=False):
+        """N trial moves, one at a time or as independent checkerboard batches"""
+        if batch:
+            attempts = 0
+            while attempts < self.n_particles:
+                attempts += self.batch_moves()
+        else:
+            n = self.n_particles
+            particles = self.rng.integers(n, size=n)
+            displacements = self.rng.uniform(-self.max_displacement, self.max_displacement, (n, 3))
+            thresholds = self.rng.random(n)
+            for particle, displacement, threshold in zip(particles, displacements, thresholds):
+                self.attempt(particle, displacement, threshold)
+        self.sweeps += 1
+
+    def batch_moves(self):
+        """Move one random particle from every cell of a random parity class.
+
+        The checkerboard is the cell grid shifted by a random offset drawn
+        anew for every batch, and a trial move is rejected when it leaves its
+        shifted cell. Since the shift changes between batches, particles still
+        cross cell boundaries over time, while the move from x to x' remains
+        as likely as the one back. Returns the number of attempted moves.
+        """
+        width = self.grid.cell_width
+        shape = self.grid.shape
+        shift = self.rng.uniform(0.0, width)
+        parity = self.rng.integers(2, size=3)
+        shifted = np.floor((self.positions + shift) / width).astype(int) % shape
+        candidates = np.flatnonzero(np.all(shifted % 2 == parity, axis=1))
+        if len(candidates) == 0:
+            return 0
+        # First candidate of every shifted cell in a random order: a uniform pick per cell
+        candidates = self.rng.permutation(candidates)
+        cells = np.ravel_multi_index(shifted[candidates].T, shape)
+        _, first = np.unique(cells, return_index=True)
+        particles = candidates[first]
+
+        n_moves = len(particles)
+        trials = np.mod(self.positions[particles] +
+                        self.rng.uniform(-self.max_displacement, self.max_displacement, (n_moves, 3)),
+                        self.box)
+        thresholds = self.rng.random(n_moves)
+        self.attempted += n_moves
+        self.window_attempted += n_moves
+
+        # Moving particles kept in same-parity shifted cells are >= r_cut apart
+        stays = np.all(np.floor((trials + shift) / width).astype(int) % shape ==
+                       shifted[particles], axis=1)
+        particles, trials, thresholds = particles[stays], trials[stays], thresholds[stays]
+        if len(particles) == 0:
+            return n_moves
+        n_stays = len(particles)
+        coords = self.grid.coords_at(trials)
+        new_cells = np.ravel_multi_index(coords.T, shape)
+
+        # Flattened neighbor lists, one segment per moving particle, from the
+        # unshifted grid around the new and the old position
+        new_neighbors = [self.grid.neighbors_of(particle, cell)
+                         for particle, cell in zip(particles, new_cells)]
+        new_others = np.concatenate(new_neighbors)
+        new_segment = np.repeat(np.arange(n_stays), [len(others) for others in new_neighbors])
+        old_neighbors = [self.grid.neighbors_of(particle) for particle in particles]
+        old_others = np.concatenate(old_neighbors)
+        old_segment = np.repeat(np.arange(n_stays), [len(others) for others in old_neighbors])
+
+        d_new = minimum_image(self.positions[new_others] - trials[new_segment], self.box)
+        r2_new = np.einsum("ij,ij->i", d_new, d_new)
+        valid = np.ones(n_stays, dtype=bool)
+        if self.core2 is not None:
+            valid = np.bincount(new_segment, r2_new < self.core2, n_stays) == 0
+            r2_new = r2_new[valid[new_segment]]
+            new_segment = new_segment[valid[new_segment]]
+            keep = valid[old_segment]
+            old_others, old_segment = old_others[keep], old_segment[keep]
+
+        d_old = minimum_image(self.positions[old_others] - self.positions[particles[old_segment]],
+                              self.box)
+        r2_old = np.einsum("ij,ij->i", d_old, d_old)
+        delta = (self.segment_energy(r2_new, new_segment, n_stays) -
+                 self.segment_energy(r2_old, old_segment, n_stays))
+
+        with np.errstate(over="ignore"):
+            accept = valid & ((delta <= 0) | (thresholds < np.exp(-self.beta * np.where(valid, delta, 0.0))))
+        self.positions[particles[accept]] = trials[accept]
+        for particle, particle_coords in zip(particles[accept], coords[accept]):
+            self.grid.move(particle, particle_coords)
+        self.energy += float(np.sum(delta[accept]))
+        n_accepted = int(np.count_nonzero(accept))
+        self.accepted += n_accepted
+        self.window_accepted += n_accepted
+        return n_moves
+
+    def segment_energy(self, r2, segment, n_segments):
+        inside = r2 < self.r_cut2
+        V = np.zeros_like(r2)
+        if inside.any():
+            V[inside] = self.model.calculate(np.sqrt(r2[inside]))
+        return np.bincount(segment, V, n_segments)
+
+    def tune(self):
+        """Scale the step size towards the target acceptance ratio"""
+        if self.window_attempted == 0:
+            return
+        ratio = self.window_accepted / self.window_attempted
+        scale = np.clip(ratio / self.target_acceptance, 0.5, 1.5)
+        limit = 0.5 * float(np.min(self.grid.cell_width))
+        self.max_displacement = float(min(self.max_displacement * scale, limit))
+        self.window_attempted = 0
+        self.window_accepted = 0
+
+    def run(self, n_sweeps, equilibration=0, batch=False, callback=None, callback_interval=1):
+        """Run ``equilibration`` tuning sweeps, then ``n_sweeps`` production sweeps.
+
+        ``callback(self)`` is called every ``callback_interval`` production sweeps.
+        """
+        for _ in range(equilibration):
+            self.sweep(batch)
+            self.tune()
+        self.attempted = self.accepted = 0
+        self.window_attempted = self.window_accepted = 0
+        for sweep in range(1, n_sweeps + 1):
+            self.sweep(batch)
+            if callback is not None and sweep % callback_interval == 0:
+                callback(self)
+
+    def stats(self):
+        return {
+            "sweeps": self.sweeps,
+            "attempted": self.attempted,
+            "accepted": self.accepted,
+            "acceptance_ratio": self.acceptance_ratio,
+            "max_displacement": self.max_displacement,
+            "energy": self.energy
+        }
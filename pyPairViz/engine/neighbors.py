@@ -0,0 +1,235 @@
+import itertools
+
+import numpy as np
+
+def minimum_image(d, box):
+    """Wrap separation vectors into the primary periodic image (in place)"""
+    d -= box * np.round(d / box)
+    return d
+
+class CellList:
+    """Particles binned into a periodic grid of cells at least ``cell_size`` wide.
+
+    Stored CSR-style: the particles of cell ``c`` are
+    ``particles[start[c]:start[c + 1]]``.
+    """
+    def __init__(self, positions, box, cell_size):
+        self.box = np.asarray(box, dtype=float)
+        self.shape = np.maximum((self.box // cell_size).astype(int), 1)
+        self.cell_width = self.box / self.shape
+
+        self.coords = (np.floor(positions / self.cell_width).astype(int) % self.shape).T
+        self.cell_of = np.ravel_multi_index(self.coords, self.shape)
+        self.particles = np.argsort(self.cell_of, kind="stable")
+        counts = np.bincount(self.cell_of, minlength=int(np.prod(self.shape)))
+        self.start = np.zeros(len(counts) + 1, dtype=np.intp)
+        np.cumsum(counts, out=self.start[1:])
+
+    def neighbor_offsets(self):
+        """Distinct periodic offsets to the 27 surrounding cells.
+
+        With fewer than three cells along an axis several offsets wrap onto
+        the same cell; duplicates are removed so no pair is visited twice.
+        """
+        offsets = {
+            tuple(np.mod(offset, self.shape))
+            for offset in itertools.product((-1, 0, 1), repeat=3)
+        }
+        return sorted(offsets)
+
+    def candidate_pairs(self, offset):
+        """All (i, j) with j in the cell at ``offset`` from the cell of i"""
+        neighbor_coords = (self.coords + np.reshape(offset, (3, 1))) % self.shape[:, None]
+        neighbor_cell = np.ravel_multi_index(neighbor_coords, self.shape)
+
+        first = self.start[neighbor_cell]
+        counts = self.start[neighbor_cell + 1] - first
+        i = np.repeat(np.arange(len(self.cell_of)), counts)
+        # Position of each candidate within its neighbor cell run
+        run_start = np.repeat(np.cumsum(counts) - counts, counts)
+        j = self.particles[np.repeat(first, counts) + np.arange(len(i)) - run_start]
+        return i, j
+
+class CellGrid:
+    """Periodic cell grid whose particles move one at a time.
+
+    Unlike CellList, which is rebuilt as a whole, each cell keeps a set of
+    particle indices and ``move`` transfers a single particle between cells.
+    ``cell_neighbors[c]`` lists the distinct periodic neighbor cells of flat
+    cell ``c``, itself included. With ``even=True`` the number of cells along
+    every axis with more than one cell is rounded down to an even number, so
+    same-parity cells never touch across the periodic boundary.
+    """
+    def __init__(self, positions, box, cell_size, even=False):
+        self.box = np.asarray(box, dtype=float)
+        self.shape = np.maximum((self.box // cell_size).astype(int), 1)
+        if even:
+            self.shape = np.where(self.shape > 1, self.shape - self.shape % 2, 1)
+        self.cell_width = self.box / self.shape
+
+        self.coords = np.floor(positions / self.cell_width).astype(int) % self.shape
+        self.cell_of = np.ravel_multi_index(self.coords.T, self.shape)
+        n_cells = int(np.prod(self.shape))
+        self.cells = [set() for _ in range(n_cells)]
+        for particle, cell in enumerate(self.cell_of):
+            self.cells[cell].add(particle)
+
+        offsets = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+        self.all_coords = np.array(np.unravel_index(np.arange(n_cells), self.shape)).T
+        self.cell_neighbors = [
+            sorted(set(np.ravel_multi_index(((coords + offsets) % self.shape).T,
+                                            self.shape).tolist()))
+            for coords in self.all_coords
+        ]
+
+    def coords_at(self, position):
+        return np.floor(position / self.cell_width).astype(int) % self.shape
+
+    def cell_index(self, coords):
+        return int(np.ravel_multi_index(tuple(coords), self.shape))
+
+    def move(self, particle, coords):
+        """Place ``particle`` in the cell at ``coords``"""
+        cell = self.cell_index(coords)
+        old = self.cell_of[particle]
+        if cell != old:
+            self.cells[old].discard(particle)
+            self.cells[cell].add(particle)
+            self.cell_of[particle] = cell
+        self.coords[particle] = coords
+
+    def neighbors_of(self, particle, cell=None):
+        """Particles in the cells around ``cell`` (default: the particle's own), excluding it"""
+        cell = self.cell_of[particle] if cell is None else cell
+        found = []
+        for neighbor in self.cell_neighbors[cell]:
+            found.extend(self.cells[neighbor])
+        found = np.array(found, dtype=np.intp)
+        return found[found != particle]
+
+def iter_pair_blocks(positions, box, r_cut, cell_list=None):
+    """Yield (i, j, d, r2) blocks covering every pair i < j closer than ``r_cut``.
+
+    ``d`` holds the minimum-image separations x_j - x_i and ``r2`` their
+    squared lengths. Blocks are produced one neighbor-cell offset at a time,
+    so each is roughly 1/27 of the candidate pairs.
+    """
+    positions = np.asarray(positions, dtype=float)
+    box = np.asarray(box, dtype=float)
+    if cell_list is None:
+        cell_list = CellList(positions, box, r_cut)
+
+    r_cut2 = r_cut * r_cut
+    for offset in cell_list.neighbor_offsets():
+        i, j = cell_list.candidate_pairs(offset)
+        keep = i < j
+        i, j = i[keep], j[keep]
+        d = minimum_image(positions[j] - positions[i], box)
+        r2 = np.einsum("ij,ij->i", d, d)
+        close = r2 < r_cut2
+        yield i[close], j[close], d[close], r2[close]
+
+def find_pairs(positions, box, r_cut, cell_list=None):
+    """Return half pair list (i < j) of all pairs closer than ``r_cut``"""
+    pair_i, pair_j = [], []
+    for i, j, _, _ in iter_pair_blocks(positions, box, r_cut, cell_list):
+        pair_i.append(i)
+        pair_j.append(j)
+    return np.concatenate(pair_i), np.concatenate(pair_j)
+
+class VerletList:
+    """Half neighbor list with a skin, rebuilt only when particles move far.
+
+    Pairs within ``r_cut + skin`` are stored CSR-style: the neighbors j > i of
+    particle i are ``neighbors[offsets[i]:offsets[i + 1]]``. ``update`` rebuilds
+    the list once any particle has moved more than ``skin / 2`` since the last
+    build, which guarantees no pair inside ``r_cut`` is missed.
+    """
+    def __init__(self, r_cut, skin=0.3):
+        self.r_cut = r_cut
+        self.skin = skin
+        self.offsets = None
+        self.neighbors = None
+        self.reference_positions = None
+        self.box = None
+        self.build_count = 0
+
+    @property
+    def r_list(self):
+        return self.r_cut + self.skin
+
+    def build(self, positions, box):
+        positions = np.asarray(positions, dtype=float)
+        self.box = np.asarray(box, dtype=float)
+        if np.any(self.r_list > self.box / 2):
+            raise ValueError("r_cut + skin must not exceed half the box length")
+
+        i, j = find_pairs(positions, self.box, self.r_list)
+        order = np.argsort(i, kind="stable")
+        self.neighbors = j[order]
+        counts = np.bincount(i, minlength=len(positions))
+        self.offsets = np.zeros(len(positions) + 1, dtype=np.intp)
+        np.cumsum(counts, out=self.offsets[1:])
+
+        # Expanded first indices, kept with the list so pairs() does not allocate
+        self.first = np.repeat(np.arange(len(positions)), counts)
+
+        self.reference_positions = positions.copy()
+        self.build_count += 1
+
+    def needs_rebuild(self, positions):
+        if self.reference_positions is None or len(positions) != len(self.reference_positions):
+            return True
+        d = minimum_image(positions - self.reference_positions, self.box)
+        max_disp2 = np.max(np.einsum("ij,ij->i", d, d)) if len(d) else 0.0
+        return max_disp2 > (self.skin / 2)**2
+
+    def update(self, positions, box=None):
+        """Rebuild if needed; return True when the list was rebuilt"""
+        if box is not None and (self.box is None or np.any(np.asarray(box) != self.box)):
+            self.build(positions, box)
+            return True
+        if self.needs_rebuild(positions):
+            self.build(positions, self.box)
+            return True
+        return False
+
+    def pairs(self):
+        """The CSR list as (i, j) index arrays, expanded once per build"""
+        return self.first, self.neighbors
+
+def pair_block(positions, box, i, j, r_cut):
+    """(i, j, d, r2) of the candidate pairs (i, j) that lie within r_cut"""
+    d = minimum_image(positions[j] - positions[i], box)
+    r2 = np.einsum("ij,ij->i", d, d)
+    inside = r2 < r_cut * r_cut
+    if not inside.all():
+        i, j, d, r2 = i[inside], j[inside], d[inside], r2[inside]
+    return i, j, d, r2
+
+def pair_energy_and_forces(model, positions, box, i, j, r_cut):
+    """Total energy and per-particle forces from the pairs (i, j) within r_cut"""
+    positions = np.asarray(positions, dtype=float)
+    box = np.asarray(box, dtype=float)
+    i, j, d, r2 = pair_block(positions, box, i, j, r_cut)
+
+    r = np.sqrt(r2)
+    V, F = model.energy_and_force(r)
+    # Force on j along +d is F(r)·d/r; i receives the opposite
+    w = F / r
+    forces = np.empty_like(positions)
+    n = len(positions)
+    for k in range(positions.shape[1]):
+        fk = w * d[:, k]
+        forces[:, k] = np.bincount(j, fk, n) - np.bincount(i, fk, n)
+    return float(np.sum(V)), forces
+
+def energy_and_forces(model, positions, box, neighbor_list):
+    """Total energy and per-particle forces using a VerletList.
+
+    The list is refreshed first (rebuilding only when particles have moved
+    more than half the skin), so the cost per call is O(N).
+    """
+    neighbor_list.update(positions, box)
+    i, j = neighbor_list.pairs()
+    return pair_energy_and_forces(model, positions, box, i, j, neighbor_list.r_cut)
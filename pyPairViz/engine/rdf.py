@@ -0,0 +1,128 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+from engine.neighbors import iter_pair_blocks
+from engine.trajectory import read_trajectory
+
+class RDFAccumulator:
+    """Pair-distance histogram summed over frames, normalized to g(r) on demand.
+
+    Pairs are found with the cell list of ``iter_pair_blocks`` and binned a
+    block at a time with ``np.bincount``. Accumulators for different frames
+    combine with ``merge``, so workers can each fill one and the results be
+    reduced at the end.
+    """
+    def __init__(self, r_max, num_bins=200):
+        self.r_max = float(r_max)
+        self.num_bins = num_bins
+        self.edges = np.linspace(0.0, self.r_max, num_bins + 1)
+        self.counts = np.zeros(num_bins, dtype=np.int64)
+        self.n_frames = 0
+        # Sum over frames of N(N-1)/2V, the ideal-gas pair density
+        self.pair_density = 0.0
+
+    @property
+    def r(self):
+        """Bin centers (Å)"""
+        return 0.5 * (self.edges[1:] + self.edges[:-1])
+
+    def add_frame(self, positions, box):
+        positions = np.asarray(positions, dtype=float)
+        box = np.asarray(box, dtype=float)
+        if self.r_max > 0.5 * box.min():
+            raise ValueError(f"r_max = {self.r_max:g} Å exceeds half the smallest box "
+                             f"length ({0.5 * box.min():g} Å)")
+        scale = self.num_bins / self.r_max
+        for _, _, _, r2 in iter_pair_blocks(positions, box, self.r_max):
+            bins = (np.sqrt(r2) * scale).astype(np.intp)
+            self.counts += np.bincount(bins, minlength=self.num_bins)[:self.num_bins]
+        n = len(positions)
+        self.pair_density += 0.5 * n * (n - 1) / np.prod(box)
+        self.n_frames += 1
+
+    def merge(self, other):
+        if other.num_bins != self.num_bins or other.r_max != self.r_max:
+            raise ValueError("cannot merge histograms with different bins")
+        self.counts += other.counts
+        self.n_frames += other.n_frames
+        self.pair_density += other.pair_density
+        return self
+
+    def g(self):
+        """g(r) at the bin centers: pair counts over the ideal-gas expectation"""
+        if self.n_frames == 0:
+            return np.zeros(self.num_bins)
+        shell_volumes = (4/3) * np.pi * np.diff(self.edges**3)
+        return self.counts / (self.pair_density * shell_volumes)
+
+def accumulate(path, r_max, num_bins, format, box, start, stop, step,
+               progress=None, cancel=None):
+    """Histogram frames start:stop:step of ``path`` into a new RDFAccumulator"""
+    accumulator = RDFAccumulator(r_max, num_bins)
+    for frame in read_trajectory(path, format, box, start, stop, step):
+        if cancel is not None and cancel.is_set():
+            break
+        if frame.box is None:
+            raise ValueError(f"{path} gives no box; pass the box lengths")
+        accumulator.add_frame(frame.positions, frame.box)
+        if progress is not None:
+            progress(accumulator.n_frames)
+    return accumulator
+
+def accumulate_frames(r_max, num_bins, frames):
+    """Histogram a batch of (positions, box) pairs into a new RDFAccumulator"""
+    accumulator = RDFAccumulator(r_max, num_bins)
+    for positions, box in frames:
+        accumulator.add_frame(positions, box)
+    return accumulator
+
+def compute_rdf(path, r_max, num_bins=200, format=None, box=None, start=0, stop=None,
+                step=1, max_workers=1, batch_size=8, progress=None, cancel=None):
+    """g(r) of a trajectory file, streamed frame by frame.
+
+    Returns the filled RDFAccumulator; ``accumulator.r`` and
+    ``accumulator.g()`` give the curve. With ``max_workers`` > 1 (None for
+    all cores) this process alone reads the file, once, and hands batches of
+    ``batch_size`` frames to the workers, which fill one histogram per batch;
+    the histograms are summed as they come back. At most two batches per
+    worker are in flight, so memory stays bounded however long the file is.
+
+    ``progress(frames)`` is called as frames are histogrammed and setting
+    ``cancel`` (anything with ``is_set()``) stops reading, returning the
+    frames histogrammed so far.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1:
+        return accumulate(path, r_max, num_bins, format, box, start, stop, step,
+                          progress, cancel)
+
+    total = RDFAccumulator(r_max, num_bins)
+
+    def collect(futures):
+        for future in futures:
+            total.merge(future.result())
+        if progress is not None:
+            progress(total.n_frames)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        batch = []
+        for frame in read_trajectory(path, format, box, start, stop, step):
+            if cancel is not None and cancel.is_set():
+                break
+            if frame.box is None:
+                raise ValueError(f"{path} gives no box; pass the box lengths")
+            batch.append((frame.positions, frame.box))
+            if len(batch) < batch_size:
+                continue
+            pending.add(executor.submit(accumulate_frames, r_max, num_bins, batch))
+            batch = []
+            while len(pending) >= 2 * max_workers:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(finished)
+        if batch:
+            pending.add(executor.submit(accumulate_frames, r_max, num_bins, batch))
+        collect(pending)
+    return total
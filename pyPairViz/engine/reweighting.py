@@ -0,0 +1,191 @@
+"""Re-score stored configurations under new potential parameters.
+
+Configurations sampled with a reference model U₀ at temperature T are reused
+for any other model U₁ through free-energy perturbation (Zwanzig):
+
+    ΔF = F₁ - F₀ = -T ln ⟨exp(-(U₁ - U₀)/T)⟩₀
+
+and reweighted averages ⟨A⟩₁ = Σ w_k A_k / Σ w_k with w_k = exp(-(U₁ - U₀)_k/T).
+Energies are in K, so T is too. The estimate is only trustworthy while the
+effective sample size (Σw)²/Σw² stays a sizeable fraction of the frames.
+"""
+import numpy as np
+
+from engine.moments import PowerMoments, frame_sums
+from engine.neighbors import iter_pair_blocks
+from engine.trajectory import read_trajectory
+
+class PairDistanceCache:
+    """Pair distances below ``r_cut`` of a set of frames, found once.
+
+    The distances of all frames are kept in one flat array, frame k owning
+    ``distances[offsets[k]:offsets[k + 1]]``, so the energies of every frame
+    under a new model take a single vectorized ``model.calculate`` over the
+    array and one ``np.add.reduceat``. ``energies(model, num_bins=...)``
+    instead bins the distances per frame once and evaluates the model only at
+    the bin centers, a (frames x bins) matrix product that is approximate
+    (error O(Δr²)) but independent of the number of pairs.
+
+    Models that are sums of power laws (LennardJones, MiePotential) skip
+    the per-pair evaluation: their energies come from the cached moment
+    sums of ``moments`` (see PowerMoments), which is O(frames) per model.
+
+    Energies are plain sums over pairs closer than ``r_cut``, as in
+    MonteCarloSimulation; pass a smaller ``r_cut`` to ``energies`` to use a
+    shorter cutoff without rebuilding the cache.
+    """
+    def __init__(self, r_cut):
+        self.r_cut = float(r_cut)
+        self.chunks = []
+        self.distances = np.zeros(0)
+        self.offsets = np.zeros(1, dtype=np.intp)
+        self.n_particles = []
+        self.histograms = {}
+        self.moments = PowerMoments(self.distances, self.offsets)
+
+    def __len__(self):
+        return len(self.n_particles)
+
+    @property
+    def pair_counts(self):
+        return np.diff(self.offsets)
+
+    def add_frame(self, positions, box):
+        positions = np.asarray(positions, dtype=float)
+        box = np.asarray(box, dtype=float)
+        if self.r_cut > 0.5 * box.min():
+            raise ValueError(f"r_cut = {self.r_cut:g} Å exceeds half the smallest box "
+                             f"length ({0.5 * box.min():g} Å)")
+        blocks = [np.sqrt(r2) for _, _, _, r2 in iter_pair_blocks(positions, box, self.r_cut)]
+        self.chunks.append(np.concatenate(blocks) if blocks else np.zeros(0))
+        self.n_particles.append(len(positions))
+
+    def finalize(self):
+        """Join the frames added so far into the flat array; called by ``energies``"""
+        if not self.chunks:
+            return
+        counts = [len(chunk) for chunk in self.chunks]
+        self.distances = np.concatenate([self.distances] + self.chunks)
+        self.offsets = np.concatenate([self.offsets, self.offsets[-1] + np.cumsum(counts)])
+        self.chunks = []
+        self.histograms = {}
+        self.moments = PowerMoments(self.distances, self.offsets)
+
+    def histogram(self, num_bins):
+        """Per-frame pair counts in ``num_bins`` bins on [0, r_cut), cached; returns (centers, counts)"""
+        self.finalize()
+        if num_bins not in self.histograms:
+            edges = np.linspace(0.0, self.r_cut, num_bins + 1)
+            frame = np.repeat(np.arange(len(self)), self.pair_counts)
+            bins = np.minimum((self.distances * (num_bins / self.r_cut)).astype(np.intp),
+                              num_bins - 1)
+            counts = np.bincount(frame * num_bins + bins, minlength=len(self) * num_bins)
+            self.histograms[num_bins] = (0.5 * (edges[1:] + edges[:-1]),
+                                         counts.reshape(len(self), num_bins).astype(float))
+        return self.histograms[num_bins]
+
+    def energies(self, model, r_cut=None, num_bins=None):
+        """Total potential energy (K) of every frame under ``model``"""
+        self.finalize()
+        r_cut = self.r_cut if r_cut is None else r_cut
+        if r_cut > self.r_cut:
+            raise ValueError(f"r_cut = {r_cut:g} Å exceeds the cached {self.r_cut:g} Å")
+
+        if num_bins is not None:
+            centers, counts = self.histogram(num_bins)
+            V = np.where(centers < r_cut, model.calculate(centers), 0.0)
+            # An infinite bin only counts when it holds pairs (0·∞ is NaN)
+            finite = np.isfinite(V)
+            energies = counts[:, finite] @ V[finite]
+            energies[counts[:, ~finite].any(axis=1)] = np.inf
+            return energies
+
+        if r_cut == self.r_cut and model.power_terms() is not None:
+            return self.moments.energies(model)
+
+        if len(self.distances) == 0:
+            return np.zeros(len(self))
+        V = np.asarray(model.calculate(self.distances), dtype=float)
+        if r_cut < self.r_cut:
+            V = np.where(self.distances < r_cut, V, 0.0)
+        return frame_sums(V, self.offsets)
+
+def build_distance_cache(path, r_cut, format=None, box=None, start=0, stop=None, step=1,
+                         progress=None, cancel=None):
+    """PairDistanceCache of frames start:stop:step of a trajectory file.
+
+    ``progress(frames)`` is called after each frame and setting ``cancel``
+    (anything with ``is_set()``) stops early, keeping the frames read so far.
+    """
+    cache = PairDistanceCache(r_cut)
+    for frame in read_trajectory(path, format, box, start, stop, step):
+        if cancel is not None and cancel.is_set():
+            break
+        if frame.box is None:
+            raise ValueError(f"{path} gives no box; pass the box lengths")
+        cache.add_frame(frame.positions, frame.box)
+        if progress is not None:
+            progress(len(cache))
+    cache.finalize()
+    return cache
+
+class ReweightingResult:
+    """Free-energy perturbation estimate for one target model.
+
+    ``free_energy`` is ΔF (K) from the reference, ``energy`` the reweighted
+    ⟨U⟩ (K) of the target, ``weights`` the normalized frame weights and
+    ``effective_samples`` (Σw)²/Σw², between 1 and the number of frames.
+    """
+    def __init__(self, free_energy, energy, weights, effective_samples):
+        self.free_energy = free_energy
+        self.energy = energy
+        self.weights = weights
+        self.effective_samples = effective_samples
+
+class Reweighting:
+    """Estimate free energies and averages of other models from reference frames.
+
+    ``cache`` holds the frames, sampled with ``reference_model`` at
+    ``temperature`` (K). Each ``estimate`` evaluates the new model over the
+    cached distances (or histograms, with ``num_bins``) and never touches
+    the trajectory again.
+    """
+    def __init__(self, cache, reference_model, temperature, r_cut=None, num_bins=None):
+        if temperature <= 0:
+            raise ValueError("temperature must be positive")
+        self.cache = cache
+        self.temperature = float(temperature)
+        self.r_cut = r_cut
+        self.num_bins = num_bins
+        self.reference_energies = cache.energies(reference_model, r_cut, num_bins)
+        if not np.all(np.isfinite(self.reference_energies)):
+            raise ValueError("the reference model is infinite on some frames; "
+                             "were they sampled with it?")
+
+    def energies(self, model):
+        return self.cache.energies(model, self.r_cut, self.num_bins)
+
+    def estimate(self, model):
+        energies = self.energies(model)
+        if len(energies) == 0:
+            raise ValueError("no frames to reweight")
+        log_weights = -(energies - self.reference_energies) / self.temperature
+        # Log-sum-exp: shift by the largest exponent before exponentiating
+        shift = log_weights.max()
+        if not np.isfinite(shift):
+            # The target is infinite on every frame
+            return ReweightingResult(np.inf, np.nan, np.zeros(len(energies)), 0.0)
+        w = np.exp(log_weights - shift)
+        total = w.sum()
+        free_energy = -self.temperature * (shift + np.log(total / len(w)))
+        weights = w / total
+        sampled = weights > 0
+        energy = float(weights[sampled] @ energies[sampled])
+        return ReweightingResult(float(free_energy), energy, weights,
+                                 float(total**2 / np.dot(w, w)))
+
+    def average(self, model, values):
+        """Reweighted average under ``model`` of one value per frame"""
+        result = self.estimate(model)
+        sampled = result.weights > 0
+        return result.weights[sampled] @ np.asarray(values, dtype=float)[sampled]
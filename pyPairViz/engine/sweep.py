@@ -0,0 +1,218 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from models.virial import second_virial
+
+QUANTITIES = ("r_min", "well_depth", "b2", "curve")
+
+class ParameterGrid:
+    """Cartesian grid over model parameters.
+
+    ``axes`` maps names from ``model_class.parameters`` (``epsilon_over_kB``,
+    ``sigma``, Mie ``n`` and ``m``, ...) to 1-D arrays of values; ``fixed``
+    holds parameters kept constant. Unknown names and out-of-bounds values
+    are rejected here rather than in the workers. Points are numbered in C
+    order over the axes.
+    """
+    def __init__(self, model_class, axes, fixed=None):
+        self.model_class = model_class
+        self.names = tuple(axes)
+        self.axes = tuple(np.asarray(values, dtype=float) for values in axes.values())
+        self.fixed = dict(fixed or {})
+
+        schema = {parameter.name: parameter for parameter in model_class.parameters}
+        unknown = (set(self.names) | set(self.fixed)) - set(schema)
+        if unknown:
+            raise ValueError(f"{model_class.name} has no parameters {sorted(unknown)}; "
+                             f"choose from {sorted(schema)}")
+        for name, values in zip(self.names, self.axes):
+            for value in values:
+                schema[name].check(value)
+        for name, value in self.fixed.items():
+            schema[name].check(value)
+
+    @property
+    def shape(self):
+        return tuple(len(values) for values in self.axes)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def point(self, index):
+        """Parameter values of grid point ``index``"""
+        position = np.unravel_index(index, self.shape)
+        params = dict(self.fixed)
+        params.update((name, float(values[k]))
+                      for name, values, k in zip(self.names, self.axes, position))
+        return params
+
+    def model(self, index):
+        """Model at grid point ``index``; parameters off the grid keep their defaults"""
+        return self.model_class(**self.point(index))
+
+def sweep_columns(quantities, curve_r):
+    columns = []
+    for quantity in quantities:
+        if quantity == "curve":
+            columns += [f"V[{k}]" for k in range(len(curve_r))]
+        else:
+            columns.append(quantity)
+    return columns
+
+def find_minimum(model, num_points=512):
+    """Position and depth (-V) of the global minimum of V(r).
+
+    A grid search over 0.5σ to 5σ is polished with Newton steps on the
+    analytic force and curvature; discontinuous models keep the grid value,
+    which sits on the discontinuity.
+    """
+    r = np.linspace(0.5 * model.sigma, 5.0 * model.sigma, num_points)
+    with np.errstate(all="ignore"):
+        V = np.asarray(model.calculate(r), dtype=float)
+    V = np.where(np.isfinite(V), V, np.inf)
+    k = int(np.argmin(V))
+    r_min, V_min = r[k], V[k]
+
+    if not model.discontinuities() and 0 < k < num_points - 1:
+        step = r[1] - r[0]
+        for _ in range(8):
+            _, F = model.energy_and_force(r_min)
+            curvature = model.second_derivative(r_min)
+            if not curvature > 0:
+                break
+            # dV/dr = -F, so the Newton step is F / V''
+            delta = float(np.clip(F / curvature, -step, step))
+            r_min += delta
+            if abs(delta) < 1e-12 * r_min:
+                break
+        V_min = float(model.calculate(r_min))
+    return float(r_min), float(-V_min)
+
+def evaluate_chunk(grid, quantities, temperature, curve_r, start, stop, shm_name, shape):
+    """Evaluate grid points [start, stop) into the shared results array"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        results = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        for index in range(start, stop):
+            model = grid.model(index)
+            row = results[index]
+            column = 0
+            minimum = None
+            for quantity in quantities:
+                if quantity in ("r_min", "well_depth"):
+                    if minimum is None:
+                        minimum = find_minimum(model)
+                    row[column] = minimum[0] if quantity == "r_min" else minimum[1]
+                    column += 1
+                elif quantity == "b2":
+                    row[column] = second_virial(model, temperature)
+                    column += 1
+                else:
+                    with np.errstate(all="ignore"):
+                        row[column:column + len(curve_r)] = model.calculate(curve_r)
+                    column += len(curve_r)
+    finally:
+        shm.close()
+    return start, stop
+
+class SweepResult:
+    """Values of each quantity on the grid; unevaluated points are NaN"""
+    def __init__(self, grid, columns, values, completed, cancelled):
+        self.grid = grid
+        self.columns = columns
+        self.values = values
+        self.completed = completed
+        self.cancelled = cancelled
+
+    def column(self, name):
+        """One quantity reshaped to the grid"""
+        return self.values[:, self.columns.index(name)].reshape(self.grid.shape)
+
+    def curves(self):
+        """Sampled V(r) curves, shape grid.shape + (len(curve_r),)"""
+        indices = [k for k, name in enumerate(self.columns) if name.startswith("V[")]
+        return self.values[:, indices].reshape(self.grid.shape + (len(indices),))
+
+def run_sweep(grid, quantities=("r_min", "well_depth"), temperature=None, curve_r=None,
+              chunk_size=None, max_workers=None, progress=None, cancel=None):
+    """Evaluate ``quantities`` at every grid point across a process pool.
+
+    The grid is split into chunks of ``chunk_size`` points. Workers write
+    straight into a ``multiprocessing.shared_memory`` array, one row per point,
+    so only chunk bounds travel between processes. ``progress(done, total)``
+    is called as chunks finish. Setting ``cancel`` (a threading.Event or
+    anything with ``is_set()``) or a KeyboardInterrupt drops the pending
+    chunks; chunks already running finish, and the partial result is
+    returned with ``cancelled`` set.
+
+    ``b2`` needs ``temperature`` (K) and ``curve`` needs the ``curve_r`` grid (Å).
+    """
+    unknown = set(quantities) - set(QUANTITIES)
+    if unknown:
+        raise ValueError(f"unknown quantities {sorted(unknown)}; choose from {QUANTITIES}")
+    if "b2" in quantities and temperature is None:
+        raise ValueError("b2 needs a temperature")
+    curve_r = np.asarray(curve_r if curve_r is not None else [], dtype=float)
+    if "curve" in quantities and len(curve_r) == 0:
+        raise ValueError("curve needs curve_r")
+
+    columns = sweep_columns(quantities, curve_r)
+    n_points = grid.size
+    shape = (n_points, len(columns))
+    max_workers = max_workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = int(np.clip(n_points // (8 * max_workers), 1, 4096))
+    chunks = [(start, min(start + chunk_size, n_points))
+              for start in range(0, n_points, chunk_size)]
+
+    shm = shared_memory.SharedMemory(create=True, size=max(8 * shape[0] * shape[1], 1))
+    try:
+        results = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        results.fill(np.nan)
+        completed = np.zeros(n_points, dtype=bool)
+        cancelled = False
+        done = 0
+
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+
+        def submit(chunk):
+            return executor.submit(evaluate_chunk, grid, quantities, temperature,
+                                   curve_r, *chunk, shm.name, shape)
+
+        try:
+            # Keep a bounded number of chunks queued so cancellation is prompt
+            queue = iter(chunks)
+            pending = {submit(chunk) for chunk in itertools.islice(queue, 2 * max_workers)}
+            while pending:
+                finished, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    if future.cancelled():
+                        continue
+                    start, stop = future.result()
+                    completed[start:stop] = True
+                    done += stop - start
+                    if progress is not None:
+                        progress(done, n_points)
+                    if not cancelled:
+                        pending.update(submit(chunk) for chunk in itertools.islice(queue, 1))
+                if not cancelled and cancel is not None and cancel.is_set():
+                    cancelled = True
+                    for future in pending:
+                        future.cancel()
+        except KeyboardInterrupt:
+            cancelled = True
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        values = results.copy()
+        del results
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return SweepResult(grid, columns, values, completed, cancelled)
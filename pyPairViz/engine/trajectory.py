@@ -0,0 +1,171 @@
+import gzip
+import itertools
+import os
+import re
+
+import numpy as np
+
+TRAJECTORY_FORMATS = ("xyz", "lammps", "binary")
+
+# Extended XYZ comment lines give the cell as Lattice="ax ay az bx by bz cx cy cz"
+# and may record the energy and time step
+LATTICE_PATTERN = re.compile(r'Lattice="([^"]*)"')
+ENERGY_PATTERN = re.compile(r'(?:^|\s)energy=(\S+)')
+STEP_PATTERN = re.compile(r'(?:^|\s)step=(\d+)')
+
+class Frame:
+    """One configuration: positions (N, 3) in Å, orthorhombic box lengths
+    (3,) in Å or None, per-particle species labels or None, and the time
+    step and potential energy (K) when the file records them."""
+    def __init__(self, positions, box=None, species=None, step=None, energy=None):
+        self.positions = positions
+        self.box = box
+        self.species = species
+        self.step = step
+        self.energy = energy
+
+    def __len__(self):
+        return len(self.positions)
+
+def open_text(path):
+    """Open a text trajectory, decompressing .gz files on the fly"""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt")
+    return open(path)
+
+def guess_format(path):
+    name = path[:-3] if path.endswith(".gz") else path
+    extension = os.path.splitext(name)[1].lower()
+    if extension in (".xyz", ".extxyz"):
+        return "xyz"
+    if extension in (".dump", ".lammpstrj", ".lammps"):
+        return "lammps"
+    if extension == ".pvtraj":
+        return "binary"
+    raise ValueError(f"cannot tell the format of {path}; pass one of {TRAJECTORY_FORMATS}")
+
+def selected(index, start, stop, step):
+    """Whether frame ``index`` belongs to the slice start:stop:step"""
+    return index >= start and (index - start) % step == 0
+
+def parse_lattice(comment):
+    """Box lengths from an extended-XYZ comment line, or None"""
+    match = LATTICE_PATTERN.search(comment)
+    if match is None:
+        return None
+    cell = np.array(match.group(1).split(), dtype=float).reshape(3, 3)
+    if np.count_nonzero(cell - np.diag(np.diag(cell))):
+        raise ValueError("only orthorhombic (diagonal) lattices are supported")
+    return np.diag(cell).copy()
+
+def read_xyz(path, box=None, start=0, stop=None, step=1):
+    """Yield the frames of an XYZ or extended-XYZ file one at a time.
+
+    Each frame is a particle count, a comment line and one ``species x y z``
+    line per particle. The box comes from an extended-XYZ ``Lattice`` in
+    the comment line, else from ``box``; ``energy=`` and ``step=`` entries
+    in the comment line are read too. Frames outside start:stop:step are
+    skipped without parsing their coordinates.
+    """
+    default_box = None if box is None else np.asarray(box, dtype=float)
+    with open_text(path) as f:
+        for index in itertools.count():
+            if stop is not None and index >= stop:
+                return
+            header = f.readline()
+            if not header.strip():
+                return
+            n = int(header)
+            comment = f.readline()
+            lines = list(itertools.islice(f, n))
+            if len(lines) < n:
+                raise ValueError(f"{path}: frame {index} is truncated")
+            if not selected(index, start, stop, step):
+                continue
+
+            fields = [line.split(None, 4) for line in lines]
+            species = np.array([row[0] for row in fields])
+            positions = np.array([row[1:4] for row in fields], dtype=float)
+            frame_box = parse_lattice(comment)
+            energy = ENERGY_PATTERN.search(comment)
+            step_match = STEP_PATTERN.search(comment)
+            yield Frame(positions, default_box if frame_box is None else frame_box, species,
+                        None if step_match is None else int(step_match.group(1)),
+                        None if energy is None else float(energy.group(1)))
+
+def read_lammps_dump(path, start=0, stop=None, step=1):
+    """Yield the frames of a LAMMPS text dump one at a time.
+
+    Atoms are sorted by ``id`` when the dump has that column. Wrapped
+    (``x y z``), unwrapped (``xu yu zu``) or scaled (``xs ys zs``)
+    coordinates are accepted; positions are shifted so the box starts at
+    the origin. Triclinic boxes are not supported.
+    """
+    with open_text(path) as f:
+        for index in itertools.count():
+            if stop is not None and index >= stop:
+                return
+            line = f.readline()
+            if not line:
+                return
+            timestep = None
+            n = None
+            bounds = None
+            # Header items up to and including ITEM: ATOMS
+            while True:
+                if not line:
+                    raise ValueError(f"{path}: frame {index} is truncated")
+                if line.startswith("ITEM: TIMESTEP"):
+                    timestep = int(f.readline())
+                elif line.startswith("ITEM: NUMBER OF ATOMS"):
+                    n = int(f.readline())
+                elif line.startswith("ITEM: BOX BOUNDS"):
+                    if len(line.split()) > 3 and "xy" in line.split():
+                        raise ValueError("triclinic LAMMPS boxes are not supported")
+                    bounds = np.array([f.readline().split()[:2] for _ in range(3)], dtype=float)
+                elif line.startswith("ITEM: ATOMS"):
+                    columns = line.split()[2:]
+                    break
+                line = f.readline()
+            if n is None or bounds is None:
+                raise ValueError(f"{path}: frame {index} lacks the atom count or box bounds")
+
+            lines = list(itertools.islice(f, n))
+            if len(lines) < n:
+                raise ValueError(f"{path}: frame {index} is truncated")
+            if not selected(index, start, stop, step):
+                continue
+
+            table = np.array([line.split() for line in lines])
+            box = bounds[:, 1] - bounds[:, 0]
+            for names, scaled in ((("x", "y", "z"), False), (("xu", "yu", "zu"), False),
+                                  (("xs", "ys", "zs"), True)):
+                if all(name in columns for name in names):
+                    positions = table[:, [columns.index(name) for name in names]].astype(float)
+                    positions = positions * box if scaled else positions - bounds[:, 0]
+                    break
+            else:
+                raise ValueError(f"{path}: no x/y/z, xu/yu/zu or xs/ys/zs columns in {columns}")
+
+            species = table[:, columns.index("type")] if "type" in columns else None
+            if "id" in columns:
+                order = np.argsort(table[:, columns.index("id")].astype(int), kind="stable")
+                positions = positions[order]
+                species = None if species is None else species[order]
+            yield Frame(positions, box, species, timestep)
+
+def read_trajectory(path, format=None, box=None, start=0, stop=None, step=1):
+    """Yield the frames of a trajectory file lazily, so memory does not grow
+    with its length. ``format`` is guessed from the extension when None;
+    ``box`` is used for XYZ frames that do not give a Lattice."""
+    if step < 1 or start < 0:
+        raise ValueError("start must be >= 0 and step >= 1")
+    format = format or guess_format(path)
+    if format == "xyz":
+        return read_xyz(path, box, start, stop, step)
+    if format == "lammps":
+        return read_lammps_dump(path, start, stop, step)
+    if format == "binary":
+        from engine.binary_trajectory import BinaryTrajectory
+        return BinaryTrajectory(path).frames(start, stop, step)
+    raise ValueError(f"format must be one of {TRAJECTORY_FORMATS}, not {format!r}")
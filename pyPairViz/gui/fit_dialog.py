@@ -0,0 +1,152 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+from concurrent.futures import ProcessPoolExecutor
+
+from models.fitting import fit_model, load_reference
+
+class FitDialog:
+    """Fit several models to reference V(r) or B2(T) data and apply the best.
+
+    Each selected model is fitted in its own worker process, starting from
+    the ε and σ currently entered in the main window; results are collected
+    by polling so the GUI stays responsive.
+    """
+    data_kinds = {
+        "V(r): r (Å), V (K)": "potential",
+        "B₂(T): T (K), B₂ (cm³/mol)": "virial"
+    }
+
+    def __init__(self, parent, models, start_parameters, on_apply):
+        self.models = models
+        self.start_parameters = start_parameters
+        self.on_apply = on_apply
+        self.executor = None
+        self.futures = {}
+        self.results = {}
+        self.closed = False
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Fit Parameters to Reference Data")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        # Data file and kind
+        file_frame = ttk.LabelFrame(self.window, text="Reference Data")
+        file_frame.pack(fill="x", padx=10, pady=5)
+
+        self.path_var = tk.StringVar()
+        ttk.Entry(file_frame, textvariable=self.path_var, width=50).grid(row=0, column=0, padx=5, pady=5)
+        ttk.Button(file_frame, text="Browse...", command=self.browse).grid(row=0, column=1, padx=5, pady=5)
+
+        self.kind_var = tk.StringVar(value=next(iter(self.data_kinds)))
+        ttk.Combobox(file_frame, textvariable=self.kind_var, values=list(self.data_kinds),
+                     state="readonly", width=30).grid(row=1, column=0, padx=5, pady=5, sticky="w")
+
+        # Models to fit
+        model_frame = ttk.LabelFrame(self.window, text="Models")
+        model_frame.pack(fill="x", padx=10, pady=5)
+        self.model_vars = {}
+        for index, name in enumerate(self.models):
+            self.model_vars[name] = tk.BooleanVar(value=name != "Hard Sphere")
+            ttk.Checkbutton(model_frame, text=name, variable=self.model_vars[name]).grid(
+                row=index // 4, column=index % 4, padx=5, pady=2, sticky="w")
+
+        self.fit_button = ttk.Button(self.window, text="Fit", command=self.start_fit)
+        self.fit_button.pack(pady=5)
+
+        # Results, best fit first
+        self.tree = ttk.Treeview(self.window, columns=("rms", "parameters"), height=8)
+        self.tree.heading("#0", text="Model")
+        self.tree.heading("rms", text="RMS deviation")
+        self.tree.heading("parameters", text="Parameters")
+        self.tree.column("#0", width=120)
+        self.tree.column("rms", width=110)
+        self.tree.column("parameters", width=420)
+        self.tree.pack(fill="both", expand=True, padx=10, pady=5)
+
+        self.status_var = tk.StringVar()
+        ttk.Label(self.window, textvariable=self.status_var).pack(padx=10, anchor="w")
+        ttk.Button(self.window, text="Apply Selected", command=self.apply).pack(pady=5)
+
+    def browse(self):
+        path = filedialog.askopenfilename(
+            parent=self.window,
+            filetypes=[("Data files", "*.txt *.dat *.csv"), ("All files", "*")]
+        )
+        if path:
+            self.path_var.set(path)
+
+    def start_fit(self):
+        try:
+            data = load_reference(self.path_var.get(), self.data_kinds[self.kind_var.get()])
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Fit", f"Could not read reference data:\n{error}", parent=self.window)
+            return
+        names = [name for name, var in self.model_vars.items() if var.get()]
+        if not names:
+            return
+
+        start = self.start_parameters()
+        self.tree.delete(*self.tree.get_children())
+        self.results.clear()
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor()
+        self.futures = {
+            name: self.executor.submit(
+                fit_model,
+                self.models[name](epsilon_over_kB=start['epsilon_over_kB'], sigma=start['sigma']),
+                data
+            )
+            for name in names
+        }
+        self.fit_button.state(["disabled"])
+        self.poll()
+
+    def poll(self):
+        if self.closed:
+            return
+        for name, future in list(self.futures.items()):
+            if future.done():
+                del self.futures[name]
+                # Any failure, including a plugin model without
+                # parameter_jacobian, is listed in place of the result
+                try:
+                    self.results[name] = future.result()
+                except Exception as error:
+                    self.results[name] = error
+        self.status_var.set(f"{len(self.results)} fitted, {len(self.futures)} running")
+        self.show_results()
+        if self.futures:
+            self.window.after(100, self.poll)
+        else:
+            self.fit_button.state(["!disabled"])
+
+    def show_results(self):
+        self.tree.delete(*self.tree.get_children())
+        fitted = [(name, result) for name, result in self.results.items()
+                  if not isinstance(result, Exception)]
+        for name, result in sorted(fitted, key=lambda item: item[1].rms):
+            parameters = ", ".join(f"{key} = {value:.5g}" for key, value in result.parameters.items())
+            if not result.converged:
+                parameters += " (not converged)"
+            self.tree.insert("", "end", iid=name, text=name,
+                             values=(f"{result.rms:.4g}", parameters))
+        for name, result in self.results.items():
+            if isinstance(result, Exception):
+                message = str(result) or type(result).__name__
+                self.tree.insert("", "end", iid=name, text=name, values=("-", message))
+
+    def apply(self):
+        selection = self.tree.selection()
+        if not selection or isinstance(self.results.get(selection[0]), Exception):
+            return
+        name = selection[0]
+        self.on_apply(name, self.results[name].parameters)
+
+    def close(self):
+        self.closed = True
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        self.window.destroy()
@@ -6,10 +6,9 @@ class ModelSelector:
         self.frame = ttk.Frame(parent)
         self.frame.pack(pady=10, padx=10, fill="x")
 
-        # Create model instances with default parameters
-        self.model_instances = {
-            name: model_class() for name, model_class in models.items()
-        }
+        # Model classes by name; the tooltip reads their class attributes,
+        # so no model is instantiated here
+        self.models = models
 
         # Model selection dropdown (simplified - remove categories)
         ttk.Label(self.frame, text="Interaction Model:").pack(side="left", padx=5)
@@ -56,7 +55,7 @@ class ModelSelector:
 
         def show_tooltip(event):
             model_name = self.get_current_model()
-            model = self.model_instances[model_name]
+            model = self.models[model_name]
             text.delete(1.0, tk.END)
             text.insert(tk.END, f"Model: {model_name}\n\n")
             text.insert(tk.END, f"Equation:\n{model.equation}\n\n")
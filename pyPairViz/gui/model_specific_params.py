@@ -2,7 +2,12 @@
 import tkinter as tk
 from tkinter import ttk
 
+from models.potential_models import PotentialModel
+
 class ModelSpecificParams:
+    # ε and σ are entered in the ParameterFrame, so they get no widgets here
+    shared_parameters = {parameter.name for parameter in PotentialModel.parameters}
+
     def __init__(self, parent, update_callback):
         self.frame = ttk.LabelFrame(parent, text="Model Information and Parameters")
         self.frame.pack(pady=10, padx=10, fill="x")
@@ -16,64 +21,59 @@ class ModelSpecificParams:
         self.param_frame = ttk.Frame(self.frame)
         self.param_frame.pack(fill="x", pady=5, padx=5)
         
-        # Dictionary to store parameter variables
+        # Parameter schemas and entry variables of the shown model, by name
+        self.schema = {}
         self.param_vars = {}
         
         # Store current model name
         self.current_model = None
 
-    def create_parameter_widgets(self, model_name):
+    def create_parameter_widgets(self, model_class):
+        """Create an entry for each parameter the model declares beyond ε and σ"""
         # Clear existing parameter widgets
         for widget in self.param_frame.winfo_children():
             widget.destroy()
+        self.schema.clear()
         self.param_vars.clear()
 
-        # Create specific parameter inputs based on model
-        if model_name == "Morse":
-            self.create_parameter("morse_a", "Width parameter (a):", "1.0")
-        elif model_name == "Buckingham":
-            self.create_parameter("buck_A", "Repulsive strength (A):", "1000.0")
-            self.create_parameter("buck_B", "Repulsive range (B):", "2.0")
-        elif model_name == "Yukawa":
-            self.create_parameter("yukawa_kappa", "Screening length (κ):", "1.0")
-        elif model_name == "Mie":
-            self.create_parameter("mie_n", "Repulsive exponent (n):", "12")
-            self.create_parameter("mie_m", "Attractive exponent (m):", "6")
+        for parameter in model_class.parameters:
+            if parameter.name not in self.shared_parameters:
+                self.create_parameter(parameter)
 
-    def create_parameter(self, name, label, default):
+    def create_parameter(self, parameter):
         """Create a labeled entry for a parameter"""
         frame = ttk.Frame(self.param_frame)
         frame.pack(side="left", padx=5)
         
-        ttk.Label(frame, text=label).pack(side="left", padx=2)
-        var = tk.StringVar(value=default)
+        ttk.Label(frame, text=parameter.display_label).pack(side="left", padx=2)
+        var = tk.StringVar(value=f"{parameter.default:g}")
         entry = ttk.Entry(frame, textvariable=var, width=10)
         entry.pack(side="left")
         entry.bind('<Return>', lambda e: self.update_callback())
         
-        self.param_vars[name] = var
+        self.schema[parameter.name] = parameter
+        self.param_vars[parameter.name] = var
 
-    def update_for_model(self, model_name, description):
+    def update_for_model(self, model_class):
         """Update the display for a new model"""
-        self.current_model = model_name
-        self.desc_label.config(text=description)
-        self.create_parameter_widgets(model_name)
+        self.current_model = model_class.name
+        self.desc_label.config(text=model_class.description)
+        self.create_parameter_widgets(model_class)
+
+    def set_parameters(self, values):
+        """Fill the entries from parameter values, e.g. fitted ones"""
+        for name, var in self.param_vars.items():
+            if name in values:
+                var.set(f"{values[name]:.6g}")
 
     def get_parameters(self):
         """Get current model-specific parameters"""
         params = {}
         for name, var in self.param_vars.items():
+            parameter = self.schema[name]
             try:
-                params[name] = float(var.get())
+                params[name] = parameter.check(var.get())
             except ValueError:
-                # If conversion fails, use default values
-                defaults = {
-                    "morse_a": 1.0,
-                    "buck_A": 1000.0,
-                    "buck_B": 2.0,
-                    "yukawa_kappa": 1.0,
-                    "mie_n": 12,
-                    "mie_m": 6
-                }
-                params[name] = defaults[name]
-        return params
\ No newline at end of file
+                # If conversion fails or the value is out of bounds, use the default
+                params[name] = parameter.default
+        return params
@@ -5,6 +5,13 @@ class MoleculeCanvas:
         self.canvas = tk.Canvas(parent, height=height)
         self.canvas.pack(fill="both", expand=True, padx=10, pady=5)
 
+        # Shade colors are reused by every sphere, so convert them only once
+        self.color_cache = {}
+
+        # Layout the persistent items were built for and the right molecule position
+        self.layout_key = None
+        self.right_x = None
+
     def hex_to_rgb(self, hex_color):
         hex_color = hex_color.lstrip('#')
         return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
@@ -13,14 +20,20 @@ class MoleculeCanvas:
         return '#{:02x}{:02x}{:02x}'.format(*rgb)
         
     def adjust_color(self, hex_color, factor):
-        r, g, b = self.hex_to_rgb(hex_color)
-        new_r = min(255, int(r * factor))
-        new_g = min(255, int(g * factor))
-        new_b = min(255, int(b * factor))
-        return self.rgb_to_hex((new_r, new_g, new_b))
-
-    def draw_sphere(self, x, y, radius, base_color):
-        """Helper function to draw a sphere-like circle with improved 3D effect"""
+        key = (hex_color, factor)
+        if key not in self.color_cache:
+            r, g, b = self.hex_to_rgb(hex_color)
+            new_r = min(255, int(r * factor))
+            new_g = min(255, int(g * factor))
+            new_b = min(255, int(b * factor))
+            self.color_cache[key] = self.rgb_to_hex((new_r, new_g, new_b))
+        return self.color_cache[key]
+
+    def draw_sphere(self, x, y, radius, base_color, tag):
+        """Helper function to draw a sphere-like circle with improved 3D effect.
+
+        All items of the sphere share ``tag`` so they can be moved as a group.
+        """
         # Create darker shade for shadow
         darker = self.adjust_color(base_color, 0.7)
         # Create lighter shade for highlight
@@ -33,14 +46,14 @@ class MoleculeCanvas:
             y - radius + shadow_offset,
             x + radius + shadow_offset,
             y + radius + shadow_offset,
-            fill='gray20', outline=''
+            fill='gray20', outline='', tags=tag
         )
 
         # Main sphere
         self.canvas.create_oval(
             x - radius, y - radius,
             x + radius, y + radius,
-            fill=base_color, outline=darker
+            fill=base_color, outline=darker, tags=tag
         )
 
         # Create gradient effect for 3D appearance
@@ -55,7 +68,8 @@ class MoleculeCanvas:
                 y + inner_radius - offset,
                 fill=lighter if i == 0 else '',
                 outline=lighter,
-                stipple='gray50'
+                stipple='gray50',
+                tags=tag
             )
 
         # Add highlight
@@ -67,7 +81,8 @@ class MoleculeCanvas:
             x + highlight_radius - highlight_offset,
             y + highlight_radius - highlight_offset,
             fill='white', outline='white',
-            stipple='gray25'
+            stipple='gray25',
+            tags=tag
         )
 
         # Draw center point (small dot)
@@ -75,16 +90,18 @@ class MoleculeCanvas:
         self.canvas.create_oval(
             x - dot_radius, y - dot_radius,
             x + dot_radius, y + dot_radius,
-            fill='black', outline='black'
+            fill='black', outline='black', tags=tag
         )
 
     def update_visualization(self, current_distance, sigma):
-        """Update the molecule visualization"""
+        """Update the molecule visualization.
+
+        Canvas items are rebuilt only when sigma or the canvas size changes;
+        otherwise the right molecule, bond line and label are moved in place.
+        """
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
 
-        self.canvas.delete("all")
-
         # Calculate margins and usable space
         margin = 40
         usable_width = canvas_width - 2 * margin
@@ -109,32 +126,57 @@ class MoleculeCanvas:
         left_x = margin + usable_width * 0.2
         right_x = left_x + (current_distance * distance_scale)
 
+        # Display distance value
+        mid_x = (left_x + right_x) / 2
+        text_y = center_y - molecule_radius - 20
+        label = f"r = {current_distance:.2f} Å"
+
+        layout_key = (canvas_width, canvas_height, sigma)
+        if layout_key != self.layout_key:
+            self.build_items(left_x, right_x, center_y, molecule_radius,
+                             mid_x, text_y, label)
+            self.layout_key = layout_key
+        else:
+            # Only the distance changed: move the existing items
+            self.canvas.move('right', right_x - self.right_x, 0)
+            self.canvas.coords('bond', left_x, center_y, right_x, center_y)
+            self.canvas.coords('label_bg',
+                               mid_x - 45, text_y - 10,
+                               mid_x + 45, text_y + 10)
+            self.canvas.coords('label', mid_x, text_y)
+            self.canvas.itemconfigure('label', text=label)
+        self.right_x = right_x
+
+    def build_items(self, left_x, right_x, center_y, molecule_radius,
+                    mid_x, text_y, label):
+        """Create all canvas items from scratch"""
+        self.canvas.delete("all")
+
         # Draw molecules (which will now appear on top of the line)
-        self.draw_sphere(left_x, center_y, molecule_radius, '#4169E1')  # Left molecule
-        self.draw_sphere(right_x, center_y, molecule_radius, '#DC143C')  # Right molecule
+        self.draw_sphere(left_x, center_y, molecule_radius, '#4169E1', 'left')  # Left molecule
+        self.draw_sphere(right_x, center_y, molecule_radius, '#DC143C', 'right')  # Right molecule
         
         
         # Draw the dashed line after spheres (so it appears on top)
         self.canvas.create_line(
             left_x, center_y,
             right_x, center_y,
-            dash=(4, 2), fill='gray40', width=1.5
+            dash=(4, 2), fill='gray40', width=1.5,
+            tags='bond'
         )
         
-        # Display distance value
-        mid_x = (left_x + right_x) / 2
-        text_y = center_y - molecule_radius - 20
-        
         # Background for text
         self.canvas.create_rectangle(
             mid_x - 45, text_y - 10,
             mid_x + 45, text_y + 10,
-            fill='white', outline='gray80'
+            fill='white', outline='gray80',
+            tags='label_bg'
         )
         
         # Distance text
         self.canvas.create_text(
             mid_x, text_y,
-            text=f"r = {current_distance:.2f} Å",
-            font=('Helvetica', 10), fill='black'
+            text=label,
+            font=('Helvetica', 10), fill='black',
+            tags='label'
         )
\ No newline at end of file
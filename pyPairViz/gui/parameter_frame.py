@@ -2,19 +2,29 @@ import tkinter as tk
 from tkinter import ttk
 
 class ParameterFrame:
-    def __init__(self, parent, update_callback):
+    # Display names for the TruncatedPotential modes
+    truncation_modes = {
+        "None": None,
+        "Cut": "cut",
+        "Shifted": "shift",
+        "Force-shifted": "force_shift",
+        "Switched": "switch"
+    }
+
+    def __init__(self, parent, update_callback, fit_callback=None, rdf_callback=None,
+                 reweight_callback=None):
         self.frame = ttk.LabelFrame(parent, text="Potential Parameters")
         self.frame.pack(pady=10, padx=10, fill="x")
         self.update_callback = update_callback
+        self.fit_callback = fit_callback
+        self.rdf_callback = rdf_callback
+        self.reweight_callback = reweight_callback
         
         # Dictionary to store all parameter variables
         self.param_vars = {}
         
         # Create parameter entries
         self.create_parameter_entries()
-        
-        # Create additional parameter frames that can be shown/hidden
-        self.create_model_specific_parameters()
 
     def create_parameter_entries(self):
         # Base parameters (always visible)
@@ -33,64 +43,79 @@ class ParameterFrame:
         # Update button
         ttk.Button(self.frame, text="Update Parameters", 
                   command=self.update_callback).grid(row=0, column=4, padx=5, pady=5)
+        if self.fit_callback is not None:
+            ttk.Button(self.frame, text="Fit to Data...",
+                       command=self.fit_callback).grid(row=0, column=5, padx=5, pady=5)
+        if self.rdf_callback is not None:
+            ttk.Button(self.frame, text="g(r) from Trajectory...",
+                       command=self.rdf_callback).grid(row=0, column=6, padx=5, pady=5)
+        if self.reweight_callback is not None:
+            ttk.Button(self.frame, text="Reweight Trajectory...",
+                       command=self.reweight_callback).grid(row=2, column=6, padx=5, pady=5)
 
-    def create_model_specific_parameters(self):
-        # Create frames for model-specific parameters
-        self.model_frames = {}
-        
-        # Morse potential parameters
-        morse_frame = ttk.Frame(self.frame)
-        ttk.Label(morse_frame, text="a (width):").grid(row=0, column=0, padx=5, pady=5)
-        self.param_vars['morse_a'] = tk.StringVar(value="1.0")
-        ttk.Entry(morse_frame, textvariable=self.param_vars['morse_a']).grid(row=0, column=1, padx=5, pady=5)
-        self.model_frames['Morse'] = morse_frame
+        # Optional truncation overlay
+        self.truncation_vars = {}
+        ttk.Label(self.frame, text="Truncation:").grid(row=2, column=0, padx=5, pady=5)
+        self.truncation_vars['mode'] = tk.StringVar(value="None")
+        mode_box = ttk.Combobox(self.frame, textvariable=self.truncation_vars['mode'],
+                                values=list(self.truncation_modes), state="readonly")
+        mode_box.grid(row=2, column=1, padx=5, pady=5)
+        mode_box.bind('<<ComboboxSelected>>', lambda e: self.update_callback())
 
-        # Buckingham potential parameters
-        buckingham_frame = ttk.Frame(self.frame)
-        ttk.Label(buckingham_frame, text="A:").grid(row=0, column=0, padx=5, pady=5)
-        self.param_vars['buck_A'] = tk.StringVar(value="1000.0")
-        ttk.Entry(buckingham_frame, textvariable=self.param_vars['buck_A']).grid(row=0, column=1, padx=5, pady=5)
-        ttk.Label(buckingham_frame, text="B:").grid(row=0, column=2, padx=5, pady=5)
-        self.param_vars['buck_B'] = tk.StringVar(value="2.0")
-        ttk.Entry(buckingham_frame, textvariable=self.param_vars['buck_B']).grid(row=0, column=3, padx=5, pady=5)
-        self.model_frames['Buckingham'] = buckingham_frame
+        ttk.Label(self.frame, text="r_c (Å):").grid(row=2, column=2, padx=5, pady=5)
+        self.truncation_vars['r_cut'] = tk.StringVar(value="8.5")
+        r_cut_entry = ttk.Entry(self.frame, textvariable=self.truncation_vars['r_cut'])
+        r_cut_entry.grid(row=2, column=3, padx=5, pady=5)
+        r_cut_entry.bind('<Return>', lambda e: self.update_callback())
 
-        # Yukawa potential parameters
-        yukawa_frame = ttk.Frame(self.frame)
-        ttk.Label(yukawa_frame, text="κ:").grid(row=0, column=0, padx=5, pady=5)
-        self.param_vars['yukawa_kappa'] = tk.StringVar(value="1.0")
-        ttk.Entry(yukawa_frame, textvariable=self.param_vars['yukawa_kappa']).grid(row=0, column=1, padx=5, pady=5)
-        self.model_frames['Yukawa'] = yukawa_frame
+        # Optional B2(T) panel
+        self.virial_vars = {}
+        self.virial_vars['show'] = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.frame, text="Show B₂(T)", variable=self.virial_vars['show'],
+                        command=self.update_callback).grid(row=3, column=0, padx=5, pady=5)
 
-        # Mie potential parameters
-        mie_frame = ttk.Frame(self.frame)
-        ttk.Label(mie_frame, text="n:").grid(row=0, column=0, padx=5, pady=5)
-        self.param_vars['mie_n'] = tk.StringVar(value="12")
-        ttk.Entry(mie_frame, textvariable=self.param_vars['mie_n']).grid(row=0, column=1, padx=5, pady=5)
-        ttk.Label(mie_frame, text="m:").grid(row=0, column=2, padx=5, pady=5)
-        self.param_vars['mie_m'] = tk.StringVar(value="6")
-        ttk.Entry(mie_frame, textvariable=self.param_vars['mie_m']).grid(row=0, column=3, padx=5, pady=5)
-        self.model_frames['Mie'] = mie_frame
-
-    def update_visible_parameters(self, model_name):
-        # Hide all model-specific frames
-        for frame in self.model_frames.values():
-            frame.grid_remove()
-        
-        # Show frame for selected model if it exists
-        if model_name in self.model_frames:
-            self.model_frames[model_name].grid(row=1, column=0, columnspan=5, padx=5, pady=5)
+        ttk.Label(self.frame, text="T range (K):").grid(row=3, column=1, padx=5, pady=5)
+        self.virial_vars['T_min'] = tk.StringVar(value="30")
+        T_min_entry = ttk.Entry(self.frame, textvariable=self.virial_vars['T_min'])
+        T_min_entry.grid(row=3, column=2, padx=5, pady=5)
+        T_min_entry.bind('<Return>', lambda e: self.update_callback())
+        self.virial_vars['T_max'] = tk.StringVar(value="3000")
+        T_max_entry = ttk.Entry(self.frame, textvariable=self.virial_vars['T_max'])
+        T_max_entry.grid(row=3, column=3, padx=5, pady=5)
+        T_max_entry.bind('<Return>', lambda e: self.update_callback())
 
     def get_parameters(self):
         """Get current parameter values"""
-        params = {
+        return {
             'epsilon_over_kB': float(self.param_vars['epsilon_over_kB'].get()),
             'sigma': float(self.param_vars['sigma'].get())
         }
-        
-        # Add model-specific parameters
-        for key, var in self.param_vars.items():
-            if key not in ['epsilon_over_kB', 'sigma']:
-                params[key] = float(var.get())
-                
-        return params
\ No newline at end of file
+
+    def set_parameters(self, params):
+        """Fill the ε and σ entries, e.g. with fitted values"""
+        for key in ('epsilon_over_kB', 'sigma'):
+            if key in params:
+                self.param_vars[key].set(f"{params[key]:.6g}")
+
+    def get_truncation(self):
+        """Get the selected truncation as (mode, r_cut), or None when disabled"""
+        mode = self.truncation_modes[self.truncation_vars['mode'].get()]
+        if mode is None:
+            return None
+        try:
+            return mode, float(self.truncation_vars['r_cut'].get())
+        except ValueError:
+            return None
+
+    def get_virial_range(self):
+        """Get the B2(T) temperature range as (T_min, T_max), or None when hidden"""
+        if not self.virial_vars['show'].get():
+            return None
+        try:
+            T_min = float(self.virial_vars['T_min'].get())
+            T_max = float(self.virial_vars['T_max'].get())
+        except ValueError:
+            return None
+        if not 0 < T_min < T_max:
+            return None
+        return T_min, T_max
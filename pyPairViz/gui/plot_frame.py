@@ -1,171 +1,85 @@
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
 
-class PlotFrame:
+from gui.plot_renderer import PlotRenderer, apply_style
+
+class PlotFrame(PlotRenderer):
     def __init__(self, parent):
         self.frame = ttk.Frame(parent)
         self.frame.pack(fill="both", expand=True)
 
-        # Set up matplotlib with LaTeX support
-        plt.rcParams.update({
-            "text.usetex": False,  
-            "font.family": "serif",
-            "font.serif": ["DejaVu Serif"],
-            "mathtext.fontset": "dejavuserif"
-        })
-
-        # Create matplotlib figure
-        self.fig = Figure(figsize=(6, 4), dpi=100)
-        self.ax = self.fig.add_subplot(111)
+        # matplotlib and its Tk backend are imported by ensure_canvas on the
+        # first draw, so the window can appear before they load
+        self.canvas = None
+        self.placeholder = ttk.Label(self.frame, text="Loading plot...")
+        self.placeholder.pack(expand=True)
+
+        # Current-point marker is animated so it is left out of full redraws
+        # and can be blitted over the cached background on slider moves
+        self.marker = None
+        self.background = None
+
+    def ensure_canvas(self):
+        """Build the figure and Tk canvas on first use"""
+        if self.canvas is not None:
+            return
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        # Set up matplotlib fonts and style before any artist exists
+        apply_style()
+
+        super().__init__(Figure(figsize=(6, 4), dpi=100))
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.frame)
-        self.canvas.draw()
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+        self.placeholder.destroy()
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
-        # Define plot colors
-        self.plot_colors = {
-            'Lennard-Jones': '#2E86C1',
-            'Hard Sphere': '#28B463',
-            'Square Well': '#E67E22',
-            'Sutherland': '#8E44AD',
-            'Morse': '#D35400',
-            'Buckingham': '#2980B9',
-            'Yukawa': '#8E44AD',
-            'Mie': '#16A085'
-        }
-
-    def configure_plot_style(self):
-        """Configure the plot style settings"""
-        plt.style.use('seaborn-v0_8-darkgrid')
-        
-        self.fig.set_facecolor('#f8f9fa')
-        self.ax.set_facecolor('#ffffff')
-        
-        self.ax.spines['top'].set_visible(False)
-        self.ax.spines['right'].set_visible(False)
-        self.ax.spines['left'].set_linewidth(1.5)
-        self.ax.spines['bottom'].set_linewidth(1.5)
-        
-        self.ax.tick_params(axis='both', which='major', labelsize=10, width=1.5, length=6)
-        self.ax.tick_params(axis='both', which='minor', width=1, length=4)
-        
-        self.ax.grid(True, linestyle='--', alpha=0.7, color='gray', linewidth=0.5)
-
-    def update_plot(self, model, r, V, current_distance, current_V, equation):
-        """Update the potential plot"""
-        self.ax.clear()
-        self.configure_plot_style()
-
-        model_color = self.plot_colors[model.name]
-        y_max = model.epsilon_over_kB * 10
-        y_min = -2 * model.epsilon_over_kB
-
-        # Add horizontal line at V = 0
-        self.ax.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
-
-        # Plot the potential based on model type
-        if model.name == 'Square Well':
-            self.plot_square_well(model, r, V, y_max, model_color)
-        elif model.name in ['Hard Sphere', 'Sutherland']:
-            self.plot_hard_sphere_type(model, r, V, y_max, model_color)
-        else:  # Continuous potentials
-            valid_mask = ~np.isinf(V)
-            self.ax.plot(r[valid_mask], V[valid_mask], '-', 
-                        color=model_color, linewidth=2.5, alpha=0.8)
-
-        # Plot current point if not in infinite region
-        if not np.isinf(current_V):
-            self.ax.plot(current_distance, current_V, 'o', 
-                        color='#e74c3c', markersize=8, 
-                        markeredgecolor='white', markeredgewidth=1.5)
-
-        # Labels and title
-        self.ax.set_xlabel('Distance (Å)', fontsize=12, fontweight='bold')
-        self.ax.set_ylabel('Potential Energy (ε/kB, K)', fontsize=12, fontweight='bold')
-        self.ax.set_title(f'{model.name} Potential', fontsize=14, fontweight='bold', pad=15)
-
-        # Equation display
-        self.display_equation(equation)
-
-        # Set axis limits based on model type
-        self.set_axis_limits(model)
-
-        # Update canvas
+    def set_virial_panel(self, visible):
+        self.ensure_canvas()
+        super().set_virial_panel(visible)
+
+    def update_plot(self, model, r, V, current_distance, current_V, equation,
+                    truncated=None, rdf=None):
+        """Rebuild the potential plot after a model or parameter change.
+
+        ``truncated`` optionally holds (r, V_truncated, r_cut) to overlay and
+        ``rdf`` optionally (r, g, label) for a g(r) curve.
+        """
+        self.ensure_canvas()
+        self.draw_potential(model, r, V, equation, truncated, rdf)
+
+        # Current point marker, positioned by update_marker
+        self.marker, = self.ax.plot([], [], 'o',
+                                    color='#e74c3c', markersize=8,
+                                    markeredgecolor='white', markeredgewidth=1.5,
+                                    animated=True)
+        self.set_marker_data(current_distance, current_V)
+
+        # Update canvas (on_draw caches the background and draws the marker)
         self.canvas.draw()
 
-    def plot_square_well(self, model, r, V, y_max, color):
-        well_position = model.sigma * model.well_width
-        well_depth = -model.epsilon_over_kB * model.well_depth
-        
-        # Add high-value line segment for r < sigma
-        r_repulsive = r[r < model.sigma]
-        if len(r_repulsive) > 0:
-            V_repulsive = np.full_like(r_repulsive, y_max)
-            self.ax.plot(r_repulsive, V_repulsive, '-', 
-                       color=color, linewidth=2, alpha=0.5)
-            
-            # Add vertical connection line
-            self.ax.plot([model.sigma, model.sigma], [well_depth, y_max], '-',
-                       color=color, linewidth=2, alpha=0.8)
-        
-        # Plot well region and outer region
-        r_well = r[(r >= model.sigma) & (r < well_position)]
-        V_well = np.full_like(r_well, well_depth)
-        self.ax.plot(r_well, V_well, '-', color=color, linewidth=2.5, alpha=0.8)
-        
-        r_outer = r[r >= well_position]
-        V_outer = np.zeros_like(r_outer)
-        self.ax.plot(r_outer, V_outer, '-', color=color, linewidth=2.5, alpha=0.8)
-        
-        # Add vertical connection at well edge
-        self.ax.plot([well_position, well_position], [well_depth, 0], '-',
-                    color=color, linewidth=2.5, alpha=0.8)
-
-    def plot_hard_sphere_type(self, model, r, V, y_max, color):
-        valid_mask = ~np.isinf(V)
-        self.ax.plot(r[valid_mask], V[valid_mask], '-', 
-                    color=color, linewidth=2.5, alpha=0.8)
-
-        # Add high-value line segment for r < sigma
-        r_repulsive = r[r < model.sigma]
-        if len(r_repulsive) > 0:
-            V_repulsive = np.full_like(r_repulsive, y_max)
-            self.ax.plot(r_repulsive, V_repulsive, '-', 
-                       color=color, linewidth=2, alpha=0.5)
-
-        # Find the value of the potential just after sigma
-        r_after_sigma = r[r >= model.sigma][0]
-        V_after_sigma = V[r >= model.sigma][0]
-        
-        # Add vertical connection line
-        self.ax.plot([model.sigma, model.sigma], [V_after_sigma, y_max], '-',
-                    color=color, linewidth=2, alpha=0.8)
-
-    def display_equation(self, equation):
-        bbox_props = dict(boxstyle="round,pad=0.5", fc="#f8f9fa", ec="gray", 
-                         alpha=0.9, linewidth=1.5)
-        
-        # Split equation into multiple lines if needed
-        equation_parts = equation.split(', ')
-        equation_text = '\n'.join(equation_parts)
-        
-        self.ax.text(0.98, 0.95, equation_text, 
-                    transform=self.ax.transAxes, 
-                    fontsize=11,
-                    bbox=bbox_props,
-                    horizontalalignment='right',
-                    verticalalignment='top',
-                    math_fontfamily='dejavuserif')
-
-    def set_axis_limits(self, model):
-        y_min = -model.epsilon_over_kB * 1.5
-        if model.name in ['Yukawa', 'Morse']:
-            y_max = model.epsilon_over_kB * 5
+    def set_marker_data(self, current_distance, current_V):
+        """Move the current point marker, hiding it in infinite regions"""
+        if np.isinf(current_V):
+            self.marker.set_visible(False)
         else:
-            y_max = model.epsilon_over_kB * 10
-        
-        self.ax.set_ylim([y_min, y_max])
-        self.ax.set_xlim(0.5 * model.sigma, 10.0)
\ No newline at end of file
+            self.marker.set_data([current_distance], [current_V])
+            self.marker.set_visible(True)
+
+    def update_marker(self, current_distance, current_V):
+        """Move only the current point marker using blitting"""
+        if self.marker is None or self.background is None:
+            return
+        self.set_marker_data(current_distance, current_V)
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(self.marker)
+        self.canvas.blit(self.ax.bbox)
+
+    def on_draw(self, event):
+        """Cache the static background after every full draw (including resizes)"""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self.marker is not None:
+            self.ax.draw_artist(self.marker)
@@ -0,0 +1,284 @@
+import numpy as np
+
+from models.virial import A3_TO_CM3_PER_MOL
+
+# rcParams of the serif font setup followed by the 'seaborn-v0_8-darkgrid'
+# style, merged ahead of time so applying them needs no style-file lookup.
+# Later entries win, as when the style was applied after the fonts.
+PLOT_STYLE = {
+    "text.usetex": False,
+    "font.family": ["sans-serif"],
+    "font.serif": ["DejaVu Serif"],
+    "font.sans-serif": ["Arial", "Liberation Sans", "DejaVu Sans", "Bitstream Vera Sans", "sans-serif"],
+    "mathtext.fontset": "dejavuserif",
+    "axes.axisbelow": True,
+    "axes.edgecolor": "white",
+    "axes.facecolor": "#EAEAF2",
+    "axes.grid": True,
+    "axes.labelcolor": ".15",
+    "axes.linewidth": 0.0,
+    "figure.facecolor": "white",
+    "grid.color": "white",
+    "grid.linestyle": "-",
+    "image.cmap": "Greys",
+    "legend.frameon": False,
+    "legend.numpoints": 1,
+    "legend.scatterpoints": 1,
+    "lines.solid_capstyle": "round",
+    "text.color": ".15",
+    "xtick.color": ".15",
+    "xtick.direction": "out",
+    "xtick.major.size": 0.0,
+    "xtick.minor.size": 0.0,
+    "ytick.color": ".15",
+    "ytick.direction": "out",
+    "ytick.major.size": 0.0,
+    "ytick.minor.size": 0.0
+}
+
+_style_applied = False
+
+def apply_style():
+    """Apply PLOT_STYLE once per process.
+
+    The style only affects artists created afterwards, so it must run before
+    the first Figure is built. matplotlib is imported here rather than at
+    module level so importing the GUI does not pull it in.
+    """
+    global _style_applied
+    if _style_applied:
+        return
+    from matplotlib import rcParams
+    rcParams.update(PLOT_STYLE)
+    _style_applied = True
+
+class PlotRenderer:
+    """Styled potential and B2(T) plots drawn into any matplotlib Figure.
+
+    Holds no GUI state, so the same drawing serves the Tk PlotFrame and
+    headless rendering on the Agg backend.
+    """
+    plot_colors = {
+        'Lennard-Jones': '#2E86C1',
+        'Hard Sphere': '#28B463',
+        'Square Well': '#E67E22',
+        'Sutherland': '#8E44AD',
+        'Morse': '#D35400',
+        'Buckingham': '#2980B9',
+        'Yukawa': '#8E44AD',
+        'Mie': '#16A085'
+    }
+    # Color of registered models without an entry above
+    default_color = '#2C3E50'
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.ax = self.fig.add_subplot(111)
+        # Optional B2(T) panel below the potential, see set_virial_panel
+        self.virial_ax = None
+        # Optional g(r) overlay on a second y axis, see plot_rdf
+        self.rdf_ax = None
+
+    def draw_potential(self, model, r, V, equation, truncated=None, rdf=None):
+        """Redraw the potential axes.
+
+        ``truncated`` optionally holds (r, V_truncated, r_cut) to overlay and
+        ``rdf`` optionally (r, g, label) to draw on a second y axis.
+        """
+        self.ax.clear()
+        self.configure_plot_style()
+
+        model_color = self.plot_colors.get(model.name, self.default_color)
+        y_max = model.epsilon_over_kB * 10
+
+        # Add horizontal line at V = 0
+        self.ax.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
+
+        # Plot the potential based on model type
+        if model.name == 'Square Well':
+            self.plot_square_well(model, r, V, y_max, model_color)
+        elif model.name in ['Hard Sphere', 'Sutherland']:
+            self.plot_hard_sphere_type(model, r, V, y_max, model_color)
+        else:  # Continuous potentials
+            valid_mask = ~np.isinf(V)
+            self.ax.plot(r[valid_mask], V[valid_mask], '-', 
+                        color=model_color, linewidth=2.5, alpha=0.8)
+
+        if truncated is not None:
+            self.plot_truncated(*truncated)
+
+        # Labels and title
+        self.ax.set_xlabel('Distance (Å)', fontsize=12, fontweight='bold')
+        self.ax.set_ylabel('Potential Energy (ε/kB, K)', fontsize=12, fontweight='bold')
+        self.ax.set_title(f'{model.name} Potential', fontsize=14, fontweight='bold', pad=15)
+
+        # Equation display
+        self.display_equation(equation)
+
+        # Set axis limits based on model type
+        self.set_axis_limits(model)
+
+        if rdf is not None:
+            self.plot_rdf(*rdf)
+        else:
+            self.remove_rdf_axes()
+
+    def configure_plot_style(self):
+        """Configure the plot style settings"""
+        self.fig.set_facecolor('#f8f9fa')
+        self.ax.set_facecolor('#ffffff')
+        
+        self.ax.spines['top'].set_visible(False)
+        self.ax.spines['right'].set_visible(False)
+        self.ax.spines['left'].set_linewidth(1.5)
+        self.ax.spines['bottom'].set_linewidth(1.5)
+        
+        self.ax.tick_params(axis='both', which='major', labelsize=10, width=1.5, length=6)
+        self.ax.tick_params(axis='both', which='minor', width=1, length=4)
+        
+        self.ax.grid(True, linestyle='--', alpha=0.7, color='gray', linewidth=0.5)
+
+    def set_virial_panel(self, visible):
+        """Show or hide the B2(T) panel below the potential plot"""
+        if visible == (self.virial_ax is not None):
+            return
+        # The g(r) axes do not follow the potential axes to a new layout;
+        # the next draw_potential recreates them
+        self.remove_rdf_axes()
+        if visible:
+            grid = self.fig.add_gridspec(2, 1, height_ratios=(3, 2), hspace=0.45)
+            self.ax.set_subplotspec(grid[0])
+            self.virial_ax = self.fig.add_subplot(grid[1])
+        else:
+            self.fig.delaxes(self.virial_ax)
+            self.virial_ax = None
+            self.ax.set_subplotspec(self.fig.add_gridspec(1, 1)[0])
+
+    def plot_virial(self, model, T, B2):
+        """Draw B2(T) in cm³/mol into the virial panel (call before update_plot)"""
+        if self.virial_ax is None:
+            return
+        ax = self.virial_ax
+        ax.clear()
+        ax.set_facecolor('#ffffff')
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.grid(True, linestyle='--', alpha=0.7, color='gray', linewidth=0.5)
+        ax.axhline(y=0, color='k', linestyle='-', linewidth=0.5)
+
+        valid_mask = np.isfinite(B2)
+        ax.plot(T[valid_mask], B2[valid_mask] * A3_TO_CM3_PER_MOL, '-',
+                color=self.plot_colors.get(model.name, self.default_color), linewidth=2.5, alpha=0.8)
+        ax.set_xscale('log')
+        ax.set_xlabel('Temperature (K)', fontsize=11, fontweight='bold')
+        ax.set_ylabel('B₂ (cm³/mol)', fontsize=11, fontweight='bold')
+
+        # Keep the deep low-temperature plunge from flattening the rest
+        if valid_mask.any():
+            B2_valid = B2[valid_mask] * A3_TO_CM3_PER_MOL
+            top = max(B2_valid.max(), 0.0)
+            span = top if top > 0 else abs(B2_valid.min())
+            ax.set_ylim(max(B2_valid.min(), -4 * span) - 0.1 * span, top + 0.2 * span)
+
+    def plot_rdf(self, r, g, label):
+        """Draw g(r) against a second y axis sharing the distance axis"""
+        if self.rdf_ax is None:
+            self.rdf_ax = self.ax.twinx()
+        ax = self.rdf_ax
+        ax.clear()
+        # clear() moves the ticks and label back to the left
+        ax.yaxis.tick_right()
+        ax.yaxis.set_label_position('right')
+        ax.grid(False)
+        ax.spines['top'].set_visible(False)
+        ax.axhline(y=1, color='#7f8c8d', linestyle=':', linewidth=1)
+        ax.plot(r, g, '-', color='#7f8c8d', linewidth=1.8, alpha=0.9, label=label)
+        ax.set_ylabel('g(r)', fontsize=12, fontweight='bold')
+        ax.set_ylim(0, max(1.5, 1.1 * np.max(g)))
+        ax.legend(loc='lower right', fontsize=9)
+
+    def remove_rdf_axes(self):
+        if self.rdf_ax is not None:
+            self.fig.delaxes(self.rdf_ax)
+            self.rdf_ax = None
+
+    def plot_square_well(self, model, r, V, y_max, color):
+        well_position = model.sigma * model.well_width
+        well_depth = -model.epsilon_over_kB * model.well_depth
+        
+        # Add high-value line segment for r < sigma
+        r_repulsive = r[r < model.sigma]
+        if len(r_repulsive) > 0:
+            V_repulsive = np.full_like(r_repulsive, y_max)
+            self.ax.plot(r_repulsive, V_repulsive, '-', 
+                       color=color, linewidth=2, alpha=0.5)
+            
+            # Add vertical connection line
+            self.ax.plot([model.sigma, model.sigma], [well_depth, y_max], '-',
+                       color=color, linewidth=2, alpha=0.8)
+        
+        # Plot well region and outer region
+        r_well = r[(r >= model.sigma) & (r < well_position)]
+        V_well = np.full_like(r_well, well_depth)
+        self.ax.plot(r_well, V_well, '-', color=color, linewidth=2.5, alpha=0.8)
+        
+        r_outer = r[r >= well_position]
+        V_outer = np.zeros_like(r_outer)
+        self.ax.plot(r_outer, V_outer, '-', color=color, linewidth=2.5, alpha=0.8)
+        
+        # Add vertical connection at well edge
+        self.ax.plot([well_position, well_position], [well_depth, 0], '-',
+                    color=color, linewidth=2.5, alpha=0.8)
+
+    def plot_hard_sphere_type(self, model, r, V, y_max, color):
+        valid_mask = ~np.isinf(V)
+        self.ax.plot(r[valid_mask], V[valid_mask], '-', 
+                    color=color, linewidth=2.5, alpha=0.8)
+
+        # Add high-value line segment for r < sigma
+        r_repulsive = r[r < model.sigma]
+        if len(r_repulsive) > 0:
+            V_repulsive = np.full_like(r_repulsive, y_max)
+            self.ax.plot(r_repulsive, V_repulsive, '-', 
+                       color=color, linewidth=2, alpha=0.5)
+
+        # Find the value of the potential just after sigma
+        r_after_sigma = r[r >= model.sigma][0]
+        V_after_sigma = V[r >= model.sigma][0]
+        
+        # Add vertical connection line
+        self.ax.plot([model.sigma, model.sigma], [V_after_sigma, y_max], '-',
+                    color=color, linewidth=2, alpha=0.8)
+
+    def plot_truncated(self, r, V, r_cut):
+        """Overlay a truncated potential curve and mark the cutoff"""
+        valid_mask = ~np.isinf(V)
+        self.ax.plot(r[valid_mask], V[valid_mask], '--',
+                     color='#34495e', linewidth=1.8, alpha=0.9)
+        self.ax.axvline(x=r_cut, color='#34495e', linestyle=':', linewidth=1)
+
+    def display_equation(self, equation):
+        bbox_props = dict(boxstyle="round,pad=0.5", fc="#f8f9fa", ec="gray", 
+                         alpha=0.9, linewidth=1.5)
+        
+        # Split equation into multiple lines if needed
+        equation_parts = equation.split(', ')
+        equation_text = '\n'.join(equation_parts)
+        
+        self.ax.text(0.98, 0.95, equation_text, 
+                    transform=self.ax.transAxes, 
+                    fontsize=11,
+                    bbox=bbox_props,
+                    horizontalalignment='right',
+                    verticalalignment='top',
+                    math_fontfamily='dejavuserif')
+
+    def set_axis_limits(self, model):
+        y_min = -model.epsilon_over_kB * 1.5
+        if model.name in ['Yukawa', 'Morse']:
+            y_max = model.epsilon_over_kB * 5
+        else:
+            y_max = model.epsilon_over_kB * 10
+        
+        self.ax.set_ylim([y_min, y_max])
+        self.ax.set_xlim(0.5 * model.sigma, 10.0)
\ No newline at end of file
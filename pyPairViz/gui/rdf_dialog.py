@@ -0,0 +1,130 @@
+import threading
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from engine.rdf import compute_rdf
+
+class RDFDialog:
+    """Compute g(r) from a trajectory file and overlay it on the potential plot.
+
+    The trajectory is streamed frame by frame in a background thread (and,
+    with more than one worker, across processes); the dialog polls for the
+    result so the GUI stays responsive.
+    """
+    def __init__(self, parent, on_result):
+        self.on_result = on_result
+        self.thread = None
+        self.cancel = None
+        self.frames_done = 0
+        self.result = None
+        self.closed = False
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Radial Distribution Function")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        file_frame = ttk.LabelFrame(self.window, text="Trajectory (XYZ, LAMMPS dump or .pvtraj)")
+        file_frame.pack(fill="x", padx=10, pady=5)
+        self.path_var = tk.StringVar()
+        ttk.Entry(file_frame, textvariable=self.path_var, width=50).grid(row=0, column=0, padx=5, pady=5)
+        ttk.Button(file_frame, text="Browse...", command=self.browse).grid(row=0, column=1, padx=5, pady=5)
+
+        options = ttk.LabelFrame(self.window, text="Options")
+        options.pack(fill="x", padx=10, pady=5)
+        self.option_vars = {}
+        for row, (key, label, default) in enumerate((
+                ('box', "Box Lx Ly Lz (Å), if not in file:", ""),
+                ('r_max', "r_max (Å):", "10.0"),
+                ('num_bins', "Bins:", "200"),
+                ('step', "Use every n-th frame:", "1"),
+                ('workers', "Worker processes:", "1"))):
+            ttk.Label(options, text=label).grid(row=row, column=0, padx=5, pady=2, sticky="w")
+            self.option_vars[key] = tk.StringVar(value=default)
+            ttk.Entry(options, textvariable=self.option_vars[key]).grid(row=row, column=1, padx=5, pady=2)
+
+        buttons = ttk.Frame(self.window)
+        buttons.pack(pady=5)
+        self.compute_button = ttk.Button(buttons, text="Compute", command=self.start)
+        self.compute_button.pack(side="left", padx=5)
+        ttk.Button(buttons, text="Clear Overlay",
+                   command=lambda: self.on_result(None)).pack(side="left", padx=5)
+
+        self.status_var = tk.StringVar()
+        ttk.Label(self.window, textvariable=self.status_var).pack(padx=10, pady=5, anchor="w")
+
+    def browse(self):
+        path = filedialog.askopenfilename(
+            parent=self.window,
+            filetypes=[("Trajectories", "*.xyz *.extxyz *.dump *.lammpstrj *.gz *.pvtraj"),
+                       ("All files", "*")]
+        )
+        if path:
+            self.path_var.set(path)
+
+    def get_options(self):
+        values = {key: var.get().strip() for key, var in self.option_vars.items()}
+        box = [float(value) for value in values['box'].split()] or None
+        if box is not None and len(box) != 3:
+            raise ValueError("give three box lengths")
+        return dict(
+            box=box,
+            r_max=float(values['r_max']),
+            num_bins=int(values['num_bins']),
+            step=int(values['step']),
+            max_workers=int(values['workers'])
+        )
+
+    def start(self):
+        try:
+            options = self.get_options()
+        except ValueError as error:
+            messagebox.showerror("g(r)", f"Invalid option:\n{error}", parent=self.window)
+            return
+        path = self.path_var.get()
+        self.frames_done = 0
+        self.result = None
+        self.cancel = threading.Event()
+
+        def progress(frames):
+            self.frames_done = frames
+
+        def run():
+            # Any failure becomes the result, so poll always has one to report
+            try:
+                self.result = compute_rdf(path, progress=progress, cancel=self.cancel, **options)
+            except Exception as error:
+                self.result = error
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        self.compute_button.state(["disabled"])
+        self.poll()
+
+    def poll(self):
+        if self.closed:
+            return
+        if self.thread.is_alive():
+            self.status_var.set(f"{self.frames_done} frames processed...")
+            self.window.after(100, self.poll)
+            return
+
+        self.compute_button.state(["!disabled"])
+        if isinstance(self.result, Exception):
+            self.status_var.set("")
+            message = str(self.result) or type(self.result).__name__
+            messagebox.showerror("g(r)", f"Could not compute g(r):\n{message}", parent=self.window)
+            return
+        accumulator = self.result
+        self.status_var.set(f"g(r) from {accumulator.n_frames} frames")
+        if accumulator.n_frames:
+            label = f"g(r), {accumulator.n_frames} frames"
+            self.on_result((accumulator.r, accumulator.g(), label))
+
+    def close(self):
+        self.closed = True
+        if self.cancel is not None:
+            self.cancel.set()
+        self.window.destroy()
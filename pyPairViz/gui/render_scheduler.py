@@ -0,0 +1,75 @@
+import time
+
+class RenderScheduler:
+    """Coalesce UI update requests into at most one render per display frame"""
+
+    def __init__(self, widget, target_fps=60):
+        self.widget = widget
+        self.target_fps = target_fps
+
+        # Latest pending (callback, args) per request key, in arrival order
+        self.pending = {}
+        self.after_id = None
+        self.last_frame_time = 0.0
+
+        # Counters for verifying responsiveness under rapid input
+        self.requested_count = 0
+        self.rendered_count = 0
+        self.dropped_count = 0
+        self.coalesced_count = 0
+        self.frame_count = 0
+
+    @property
+    def frame_interval(self):
+        return 1.0 / self.target_fps if self.target_fps else 0.0
+
+    def request(self, key, callback, *args):
+        """Schedule callback(*args), replacing any pending request with the same key"""
+        self.requested_count += 1
+        if key in self.pending:
+            # An intermediate value superseded before it was rendered; each
+            # replaced request is counted once, and only for its own key
+            self.dropped_count += 1
+            self.coalesced_count += 1
+        self.pending[key] = (callback, args)
+
+        if self.after_id is None:
+            elapsed = time.perf_counter() - self.last_frame_time
+            delay = self.frame_interval - elapsed
+            if delay > 0:
+                self.after_id = self.widget.after(int(delay * 1000), self.flush)
+            else:
+                self.after_id = self.widget.after_idle(self.flush)
+
+    def flush(self):
+        """Run the latest pending request for every key"""
+        self.after_id = None
+        self.last_frame_time = time.perf_counter()
+        pending, self.pending = self.pending, {}
+        for callback, args in pending.values():
+            callback(*args)
+            self.rendered_count += 1
+        self.frame_count += 1
+
+    def cancel(self):
+        """Discard pending requests without rendering them"""
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+        self.dropped_count += len(self.pending)
+        self.pending.clear()
+
+    def stats(self):
+        """Return request, render, dropped and coalesced event counts.
+
+        ``coalesced`` counts requests replaced by a newer one with the same
+        key; ``dropped`` also includes requests discarded by ``cancel``.
+        """
+        return {
+            'requested': self.requested_count,
+            'rendered': self.rendered_count,
+            'dropped': self.dropped_count,
+            'coalesced': self.coalesced_count,
+            'frames': self.frame_count,
+            'target_fps': self.target_fps
+        }
@@ -0,0 +1,163 @@
+import copy
+import threading
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+import numpy as np
+
+from engine.reweighting import Reweighting, build_distance_cache
+
+class ReweightDialog:
+    """Free-energy perturbation from a stored trajectory to the current model.
+
+    Loading reads the trajectory once in a background thread and caches the
+    pair distances of every frame, taking the model selected at that moment
+    as the one the frames were sampled with. Afterwards ``update_model`` is
+    called on every parameter change and re-scores the cached frames without
+    reading the file again. For Lennard-Jones and Mie models this only
+    combines cached moment sums, so even a single frame of 10⁵ particles
+    updates its total energy instantly.
+    """
+    def __init__(self, parent, get_model, on_close):
+        self.get_model = get_model
+        self.on_close = on_close
+        self.thread = None
+        self.cancel = None
+        self.frames_done = 0
+        self.result = None
+        self.reweighting = None
+        self.reference_name = None
+        self.closed = False
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("Reweight Trajectory")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        file_frame = ttk.LabelFrame(self.window, text="Trajectory (XYZ, LAMMPS dump or .pvtraj)")
+        file_frame.pack(fill="x", padx=10, pady=5)
+        self.path_var = tk.StringVar()
+        ttk.Entry(file_frame, textvariable=self.path_var, width=50).grid(row=0, column=0, padx=5, pady=5)
+        ttk.Button(file_frame, text="Browse...", command=self.browse).grid(row=0, column=1, padx=5, pady=5)
+
+        options = ttk.LabelFrame(self.window, text="Options")
+        options.pack(fill="x", padx=10, pady=5)
+        self.option_vars = {}
+        for row, (key, label, default) in enumerate((
+                ('box', "Box Lx Ly Lz (Å), if not in file:", ""),
+                ('temperature', "Sampling temperature (K):", "150"),
+                ('r_cut', "r_cut (Å):", "8.5"),
+                ('step', "Use every n-th frame:", "1"))):
+            ttk.Label(options, text=label).grid(row=row, column=0, padx=5, pady=2, sticky="w")
+            self.option_vars[key] = tk.StringVar(value=default)
+            ttk.Entry(options, textvariable=self.option_vars[key]).grid(row=row, column=1, padx=5, pady=2)
+
+        self.load_button = ttk.Button(self.window, text="Load with Current Model as Reference",
+                                      command=self.start)
+        self.load_button.pack(pady=5)
+
+        self.status_var = tk.StringVar()
+        ttk.Label(self.window, textvariable=self.status_var).pack(padx=10, pady=2, anchor="w")
+        self.estimate_var = tk.StringVar()
+        ttk.Label(self.window, textvariable=self.estimate_var,
+                  font=("Courier", 10)).pack(padx=10, pady=5, anchor="w")
+
+    def browse(self):
+        path = filedialog.askopenfilename(
+            parent=self.window,
+            filetypes=[("Trajectories", "*.xyz *.extxyz *.dump *.lammpstrj *.gz *.pvtraj"),
+                       ("All files", "*")]
+        )
+        if path:
+            self.path_var.set(path)
+
+    def get_options(self):
+        values = {key: var.get().strip() for key, var in self.option_vars.items()}
+        box = [float(value) for value in values['box'].split()] or None
+        if box is not None and len(box) != 3:
+            raise ValueError("give three box lengths")
+        return dict(
+            box=box,
+            temperature=float(values['temperature']),
+            r_cut=float(values['r_cut']),
+            step=int(values['step'])
+        )
+
+    def start(self):
+        try:
+            options = self.get_options()
+        except ValueError as error:
+            messagebox.showerror("Reweighting", f"Invalid option:\n{error}", parent=self.window)
+            return
+        path = self.path_var.get()
+        temperature = options.pop('temperature')
+        # The model keeps changing in place while the frames load
+        reference = copy.deepcopy(self.get_model())
+        self.reference_name = reference.name
+        self.frames_done = 0
+        self.result = None
+        self.reweighting = None
+        self.estimate_var.set("")
+        self.cancel = threading.Event()
+
+        def progress(frames):
+            self.frames_done = frames
+
+        def run():
+            # Any failure becomes the result, so poll always has one to report
+            try:
+                cache = build_distance_cache(path, progress=progress, cancel=self.cancel, **options)
+                self.result = Reweighting(cache, reference, temperature)
+            except Exception as error:
+                self.result = error
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        self.load_button.state(["disabled"])
+        self.poll()
+
+    def poll(self):
+        if self.closed:
+            return
+        if self.thread.is_alive():
+            self.status_var.set(f"{self.frames_done} frames read...")
+            self.window.after(100, self.poll)
+            return
+
+        self.load_button.state(["!disabled"])
+        if isinstance(self.result, Exception):
+            self.status_var.set("")
+            message = str(self.result) or type(self.result).__name__
+            messagebox.showerror("Reweighting", f"Could not load the trajectory:\n{message}",
+                                 parent=self.window)
+            return
+        self.reweighting = self.result
+        cache = self.reweighting.cache
+        self.status_var.set(f"{len(cache)} frames, {len(cache.distances)} pairs; "
+                            f"reference: {self.reference_name}")
+        self.update_model(self.get_model())
+
+    def update_model(self, model):
+        """Show the perturbation estimate from the reference to ``model``"""
+        if self.reweighting is None or len(self.reweighting.cache) == 0:
+            return
+        result = self.reweighting.estimate(model)
+        cache = self.reweighting.cache
+        n_frames = len(cache)
+        self.estimate_var.set(
+            f"{model.name}\n"
+            f"ΔF        = {result.free_energy:12.4g} K\n"
+            f"⟨U⟩       = {result.energy:12.4g} K\n"
+            f"⟨U⟩/N     = {result.energy / np.mean(cache.n_particles):12.4g} K\n"
+            f"⟨U⟩ ref   = {self.reweighting.reference_energies.mean():12.4g} K\n"
+            f"Effective frames: {result.effective_samples:.1f} of {n_frames}"
+        )
+
+    def close(self):
+        self.closed = True
+        if self.cancel is not None:
+            self.cancel.set()
+        self.window.destroy()
+        self.on_close()
@@ -1,16 +1,17 @@
+import multiprocessing
 import tkinter as tk
 from tkinter import ttk
-import numpy as np
 
-from models.potential_models import (
-    LennardJones, HardSphere, SquareWell, Sutherland,
-    MorsePotential, BuckinghamPotential, YukawaPotential, MiePotential
-)
+from models.potential_models import LennardJones, MiePotential
+from models.registry import model_classes
+from models.truncation import TruncatedPotential
 from gui.molecule_canvas import MoleculeCanvas
 from gui.plot_frame import PlotFrame
 from gui.parameter_frame import ParameterFrame
 from gui.model_selector import ModelSelector
 from gui.model_specific_params import ModelSpecificParams
+from gui.render_scheduler import RenderScheduler
+from utils.curve_cache import CurveCache
 
 class PotentialVisualizer(tk.Tk):
     def __init__(self):
@@ -19,34 +20,47 @@ class PotentialVisualizer(tk.Tk):
         self.title("Molecular Interaction Potential Visualizer")
         self.geometry("1000x800")
 
-        # Initialize models dictionary
-        self.models = {
-            "Lennard-Jones": LennardJones,
-            "Hard Sphere": HardSphere,
-            "Square Well": SquareWell,
-            "Sutherland": Sutherland,
-            "Morse": MorsePotential,
-            "Buckingham": BuckinghamPotential,
-            "Yukawa": YukawaPotential,
-            "Mie": MiePotential
-        }
+        # Registered model classes by name (built-in and plugin models)
+        self.models = model_classes()
 
         # Initialize current model
         self.current_model = LennardJones()
         self.current_distance = 10.0
 
+        # Optional (r, g, label) g(r) curve overlaid on the potential
+        self.rdf_overlay = None
+
+        # Open ReweightDialog, re-scored on every parameter change
+        self.reweight_dialog = None
+
+        # Cache of plotted curves, reused across slider moves and model switches
+        self.curve_cache = CurveCache(max_size=32)
+
+        # Coalesces slider and parameter events into one redraw per frame
+        self.render_scheduler = RenderScheduler(self, target_fps=60)
+
         self.create_widgets()
-        self.update_visualization()
+
+        # Draw the first plot once the window is on screen, so matplotlib is
+        # imported after the window appears rather than before it
+        self.bind('<Map>', self.on_first_map)
+
+    def on_first_map(self, event):
+        if event.widget is self:
+            self.unbind('<Map>')
+            self.after_idle(self.update_visualization)
 
     def create_widgets(self):
         # Create model selector
         self.model_selector = ModelSelector(self, self.models, self.on_model_change)
 
         # Create parameter frame
-        self.param_frame = ParameterFrame(self, self.update_parameters)
+        self.param_frame = ParameterFrame(self, self.request_parameter_update,
+                                          self.open_fit_dialog, self.open_rdf_dialog,
+                                          self.open_reweight_dialog)
 
         # Create model-specific parameters frame
-        self.model_specific_params = ModelSpecificParams(self, self.update_parameters)
+        self.model_specific_params = ModelSpecificParams(self, self.request_parameter_update)
 
         # Create molecule visualization
         self.molecule_canvas = MoleculeCanvas(self)
@@ -62,59 +76,84 @@ class PotentialVisualizer(tk.Tk):
             to=10.0,
             orient="horizontal",
             variable=self.distance_var,
-            command=lambda v: self.after_idle(lambda: self.on_slider_change(v))
+            command=lambda v: self.render_scheduler.request(
+                'distance', self.on_slider_change, v
+            )
         )
         self.distance_slider.pack(fill="x", padx=10, pady=5)
 
         # Create plot frame
         self.plot_frame = PlotFrame(self)
-        self.model_specific_params.update_for_model("Lennard-Jones", self.current_model.description)
+        self.model_specific_params.update_for_model(LennardJones)
 
     def on_model_change(self, model_name):
 #         print(f"Model changed to: {model_name}")  # Debug print
         
-        # Get model instance for description
-        model_instance = self.models[model_name]()
-        
         # Update model description and specific parameters
-        self.model_specific_params.update_for_model(model_name, model_instance.description)
+        self.model_specific_params.update_for_model(self.models[model_name])
         
         # Update current model with parameters
-        self.update_parameters()
+        self.request_parameter_update()
+
+    def open_fit_dialog(self):
+        # Imported on demand: fitting pulls in the multiprocessing machinery
+        from gui.fit_dialog import FitDialog
+        FitDialog(self, self.models, self.param_frame.get_parameters, self.apply_fit)
+
+    def open_rdf_dialog(self):
+        # Imported on demand, like the fit dialog
+        from gui.rdf_dialog import RDFDialog
+        RDFDialog(self, self.set_rdf_overlay)
+
+    def open_reweight_dialog(self):
+        if self.reweight_dialog is not None:
+            self.reweight_dialog.window.lift()
+            return
+        from gui.reweight_dialog import ReweightDialog
+        self.reweight_dialog = ReweightDialog(self, lambda: self.current_model,
+                                              self.close_reweight_dialog)
+
+    def close_reweight_dialog(self):
+        self.reweight_dialog = None
+
+    def set_rdf_overlay(self, rdf):
+        """Overlay ``rdf`` = (r, g, label) on the potential plot, or remove it with None"""
+        self.rdf_overlay = rdf
+        self.update_visualization()
+
+    def apply_fit(self, model_name, params):
+        """Select ``model_name`` and fill the entries with fitted parameters"""
+        if model_name != self.model_selector.get_current_model():
+            self.model_selector.model_var.set(model_name)
+            self.model_specific_params.update_for_model(self.models[model_name])
+        self.param_frame.set_parameters(params)
+        self.model_specific_params.set_parameters(params)
+        self.request_parameter_update()
+
+    def request_parameter_update(self):
+        """Schedule a parameter update for the next render frame"""
+        self.render_scheduler.request('parameters', self.update_parameters)
 
     def update_parameters(self):
         # Get current model name (without category indentation)
         model_name = self.model_selector.get_current_model()
 #         print(f"Updating parameters for: {model_name}")  # Debug print
         
-        # Get basic parameters
-        base_params = self.param_frame.get_parameters()
-        specific_params = self.model_specific_params.get_parameters()
-#         print(f"Base parameters: {base_params}")  # Debug print
-#         print(f"Specific parameters: {specific_params}")  # Debug print
-        
-        # Create new model instance
+        # Build a model only when the model changes; otherwise update the
+        # current one in place
         model_class = self.models[model_name]
-        self.current_model = model_class(
-            epsilon_over_kB=base_params['epsilon_over_kB'],
-            sigma=base_params['sigma']
-        )
-        
-        # Set model-specific parameters
-        if model_name == "Morse" and 'morse_a' in specific_params:
-            self.current_model.a = specific_params['morse_a']
-        elif model_name == "Buckingham":
-            if 'buck_A' in specific_params:
-                self.current_model.A = specific_params['buck_A']
-            if 'buck_B' in specific_params:
-                self.current_model.B = specific_params['buck_B']
-        elif model_name == "Yukawa" and 'yukawa_kappa' in specific_params:
-            self.current_model.kappa = specific_params['yukawa_kappa']
-        elif model_name == "Mie":
-            if 'mie_n' in specific_params:
-                self.current_model.n = specific_params['mie_n']
-            if 'mie_m' in specific_params:
-                self.current_model.m = specific_params['mie_m']
+        try:
+            params = self.param_frame.get_parameters()
+            params.update(self.model_specific_params.get_parameters())
+            if type(self.current_model) is model_class:
+                self.current_model.set_parameters(**params)
+            else:
+                self.current_model = model_class(**params)
+        except ValueError:
+            return  # Keep the previous model until the entries are valid
+
+        if self.reweight_dialog is not None:
+            self.reweight_dialog.update_model(self.current_model)
         
         # Update visualization
         self.update_visualization()
@@ -146,7 +185,7 @@ class PotentialVisualizer(tk.Tk):
             else:
                 self.current_distance = value
                 
-            self.update_visualization()
+            self.update_distance()
             
         except tk.TclError:
             pass  # Ignore any Tcl errors during slider updates
@@ -158,11 +197,34 @@ class PotentialVisualizer(tk.Tk):
             self.current_model.sigma
         )
 
-        # Generate points for the plot
-        r = np.linspace(0.5*self.current_model.sigma, 10.0, 1000)
-        V = self.current_model.calculate(r)
+        # Generate points for the plot (cached per model and parameter set)
+        r, V = self.curve_cache.get_curve(
+            self.current_model, 0.5*self.current_model.sigma, 10.0, 1000
+        )
         current_V = self.current_model.calculate(self.current_distance)
 
+        # Optional truncated curve overlay
+        truncated = None
+        truncation = self.param_frame.get_truncation()
+        if truncation is not None:
+            mode, r_cut = truncation
+            try:
+                truncated_model = TruncatedPotential(self.current_model, r_cut, mode)
+            except ValueError:
+                truncated_model = None
+            if truncated_model is not None:
+                r_trunc, V_trunc = self.curve_cache.get_curve(
+                    truncated_model, 0.5*self.current_model.sigma, 10.0, 1000
+                )
+                truncated = (r_trunc, V_trunc, r_cut)
+
+        # Optional B2(T) panel
+        virial_range = self.param_frame.get_virial_range()
+        self.plot_frame.set_virial_panel(virial_range is not None)
+        if virial_range is not None:
+            T, B2 = self.curve_cache.get_virial_curve(self.current_model, *virial_range)
+            self.plot_frame.plot_virial(self.current_model, T, B2)
+
         # Update plot
         self.plot_frame.update_plot(
             self.current_model,
@@ -170,9 +232,23 @@ class PotentialVisualizer(tk.Tk):
             V,
             self.current_distance,
             current_V,
-            self.current_model.equation
+            self.current_model.equation,
+            truncated,
+            self.rdf_overlay
         )
 
+    def update_distance(self):
+        """Update only the distance-dependent parts of the visualization"""
+        self.molecule_canvas.update_visualization(
+            self.current_distance,
+            self.current_model.sigma
+        )
+
+        current_V = self.current_model.calculate(self.current_distance)
+        self.plot_frame.update_marker(self.current_distance, current_V)
+
 if __name__ == "__main__":
+    # Frozen (PyInstaller) workers re-run this script; let them do their work
+    multiprocessing.freeze_support()
     app = PotentialVisualizer()
     app.mainloop()
\ No newline at end of file
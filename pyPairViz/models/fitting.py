@@ -0,0 +1,209 @@
+import copy
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from models.virial import A3_TO_CM3_PER_MOL, second_virial_jacobian
+
+REFERENCE_KINDS = ("potential", "virial")
+
+class ReferenceData:
+    """Tabulated reference data to fit against.
+
+    ``kind`` is ``potential`` for V(r) (x in Å, y in K) or ``virial`` for
+    B2(T) (x in K, y in Å³ per molecule). ``uncertainty`` optionally weights
+    each point by 1/uncertainty.
+    """
+    def __init__(self, kind, x, y, uncertainty=None):
+        if kind not in REFERENCE_KINDS:
+            raise ValueError(f"kind must be one of {REFERENCE_KINDS}, not {kind!r}")
+        self.kind = kind
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.uncertainty = (np.ones_like(self.y) if uncertainty is None
+                            else np.asarray(uncertainty, dtype=float))
+
+    def __len__(self):
+        return len(self.x)
+
+def load_reference(path, kind):
+    """Read two or three whitespace- or comma-separated columns: x, y[, uncertainty].
+
+    Lines starting with ``#`` are skipped. V(r) data is r (Å) and V (K);
+    B2(T) data is T (K) and B2 in cm³/mol, as tabulated experimentally.
+    """
+    with open(path) as f:
+        text = f.read()
+    delimiter = "," if "," in text else None
+    table = np.loadtxt(path, comments="#", delimiter=delimiter, ndmin=2)
+    if table.shape[1] < 2:
+        raise ValueError(f"{path} needs at least two columns")
+    x, y = table[:, 0], table[:, 1]
+    uncertainty = table[:, 2] if table.shape[1] > 2 else None
+    if kind == "virial":
+        y = y / A3_TO_CM3_PER_MOL
+        if uncertainty is not None:
+            uncertainty = uncertainty / A3_TO_CM3_PER_MOL
+    return ReferenceData(kind, x, y, uncertainty)
+
+class FitResult:
+    """Fitted model, parameter values and standard errors, and fit quality"""
+    def __init__(self, model, parameters, errors, rms, chi2, n_points,
+                 iterations, converged, message):
+        self.model = model
+        self.name = model.name
+        self.parameters = parameters
+        self.errors = errors
+        self.rms = rms
+        self.chi2 = chi2
+        self.n_points = n_points
+        self.iterations = iterations
+        self.converged = converged
+        self.message = message
+
+    @property
+    def reduced_chi2(self):
+        dof = self.n_points - len(self.parameters)
+        return self.chi2 / dof if dof > 0 else np.nan
+
+def residuals_and_jacobian(model, names, data):
+    """Weighted residuals (model - data)/uncertainty and their Jacobian.
+
+    The Jacobian is with respect to log|parameter|: steps in log space keep
+    every fitted parameter away from zero and its sign unchanged.
+    """
+    if data.kind == "potential":
+        values = np.asarray(model.calculate(data.x), dtype=float)
+        full = np.array(model.parameter_jacobian(data.x), dtype=float)
+    else:
+        values, full = second_virial_jacobian(model, data.x)
+
+    indices = [model.parameter_names.index(name) for name in names]
+    scale = np.array([getattr(model, name) for name in names])
+    residuals = (values - data.y) / data.uncertainty
+    jacobian = (full[indices] * scale[:, None] / data.uncertainty[None, :]).T
+    return residuals, jacobian
+
+def fit_model(model, data, parameters=None, max_iterations=200, tolerance=1e-10):
+    """Least-squares fit of ``parameters`` (default: all of ``model.parameter_names``).
+
+    Levenberg-Marquardt on log|parameter| using the models' analytic
+    parameter Jacobians, so each parameter keeps the sign of its starting
+    value (a negative Yukawa ε stays negative). Steps are clipped to the ``Parameter.bounds`` of
+    the model schema; a fit that ends on a bound is reported with
+    ``converged=False``. ``model`` provides the starting values and is left
+    unchanged; the fitted copy is returned in a FitResult.
+    """
+    model = copy.deepcopy(model)
+    names = tuple(model.parameter_names if parameters is None else parameters)
+    unknown = set(names) - set(model.parameter_names)
+    if unknown:
+        raise ValueError(f"{model.name} has no fittable parameters {sorted(unknown)}")
+
+    start = np.array([getattr(model, name) for name in names], dtype=float)
+    if np.any(start == 0):
+        zero = [name for name, value in zip(names, start) if value == 0]
+        raise ValueError(f"cannot fit {', '.join(zero)} starting from 0")
+    signs = np.sign(start)
+
+    # Limits of log|parameter|: the schema bounds, or what exp() can
+    # represent without underflowing to 0 or overflowing
+    schema = {parameter.name: parameter for parameter in model.parameters}
+    log_low = np.full(len(names), np.log(np.finfo(float).tiny))
+    log_high = np.full(len(names), np.log(np.finfo(float).max))
+    for i, name in enumerate(names):
+        low, high = schema[name].bounds if name in schema else (None, None)
+        if signs[i] < 0:
+            low, high = (None if high is None else -high), (None if low is None else -low)
+        if low is not None and low > 0:
+            log_low[i] = np.log(low)
+        if high is not None:
+            log_high[i] = min(log_high[i], np.log(high))
+
+    def set_log_parameters(log_values):
+        for name, value in zip(names, signs * np.exp(log_values)):
+            setattr(model, name, float(value))
+
+    x = np.log(np.abs(start))
+    with np.errstate(all="ignore"):
+        residuals, jacobian = residuals_and_jacobian(model, names, data)
+    cost = residuals @ residuals
+    if not np.isfinite(cost):
+        raise ValueError(f"{model.name} is not finite at every reference point "
+                         "for the starting parameters")
+
+    damping = 1e-3
+    converged = False
+    message = "maximum iterations reached"
+    iteration = 0
+    for iteration in range(1, max_iterations + 1):
+        gradient = jacobian.T @ residuals
+        normal = jacobian.T @ jacobian
+        diagonal = np.maximum(np.diag(normal), 1e-30)
+        try:
+            step = np.linalg.solve(normal + damping * np.diag(diagonal), -gradient)
+        except np.linalg.LinAlgError:
+            damping *= 10
+            continue
+
+        step = np.clip(x + step, log_low, log_high) - x
+        set_log_parameters(x + step)
+        with np.errstate(all="ignore"):
+            trial_residuals, trial_jacobian = residuals_and_jacobian(model, names, data)
+        trial_cost = trial_residuals @ trial_residuals
+
+        if np.isfinite(trial_cost) and trial_cost < cost:
+            improvement = (cost - trial_cost) / max(cost, 1e-300)
+            x = x + step
+            residuals, jacobian, cost = trial_residuals, trial_jacobian, trial_cost
+            damping = max(damping / 10, 1e-12)
+            if improvement < tolerance or np.max(np.abs(step)) < tolerance:
+                converged = True
+                message = "converged"
+                break
+        else:
+            set_log_parameters(x)
+            damping *= 10
+            if damping > 1e12:
+                converged = True
+                message = "no further improvement"
+                break
+
+    set_log_parameters(x)
+    values = {name: getattr(model, name) for name in names}
+    at_bound = [name for i, name in enumerate(names)
+                if x[i] <= log_low[i] or x[i] >= log_high[i]
+                or (name in schema and not schema[name].in_bounds(values[name]))]
+    if at_bound:
+        converged = False
+        message = f"{', '.join(at_bound)} reached the parameter bounds"
+
+    # Standard errors from the covariance (JᵀJ)⁻¹ scaled by the residual
+    # variance, mapped back from log space
+    dof = max(len(residuals) - len(names), 1)
+    try:
+        covariance = np.linalg.inv(jacobian.T @ jacobian) * cost / dof
+        log_errors = np.sqrt(np.abs(np.diag(covariance)))
+    except np.linalg.LinAlgError:
+        log_errors = np.full(len(names), np.nan)
+    errors = {name: abs(values[name]) * err for name, err in zip(names, log_errors)}
+
+    rms = float(np.sqrt(np.mean((residuals * data.uncertainty)**2)))
+    return FitResult(model, values, errors, rms, float(cost), len(data),
+                     iteration, converged, message)
+
+def fit_models(models, data, max_workers=None):
+    """Fit several models to the same data in parallel worker processes.
+
+    Returns one FitResult per model in the same order; a model that cannot
+    be fitted yields the exception describing why instead.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fit_model, model, data) for model in models]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as error:
+                results.append(error)
+    return results
@@ -0,0 +1,254 @@
+"""Optional compiled kernels for evaluating pair potentials on large arrays.
+
+Each kernel below is a single loop over the distances that writes V (and F)
+straight into the output arrays, without the full-size temporaries of the
+NumPy expressions. With Numba installed the loops are JIT-compiled;
+otherwise ``kernel`` returns None and the models use their NumPy code.
+
+The backend is chosen on first use from the ``PYPAIRVIZ_KERNELS``
+environment variable:
+
+    auto    Numba for the kernels in AUTO_KERNELS when it is installed,
+            NumPy for everything else (default)
+    numba   every kernel through Numba (fails when it is not installed)
+    numpy   the models' NumPy expressions only
+    python  the kernel loops uncompiled; very slow, for checking kernels
+            without Numba
+
+Numba's scalar exp/log/pow are slower than NumPy's vectorized ones, so
+under ``auto`` only the kernels that beat NumPy in
+benchmarks/bench_kernels.py run compiled: LJ, and the fused V+F kernels
+of integer-exponent Mie and Buckingham, which save several NumPy
+temporaries. ``hermite_lookup`` evaluates TabulatedPotential tables, whose
+NumPy path is bound by its gathers and index arithmetic.
+
+``set_backend`` switches at run time. Arrays with fewer than
+``KERNEL_MIN_SIZE`` elements always take the NumPy path, where the call
+and compilation overheads of a kernel are not repaid.
+"""
+import importlib.util
+import math
+import os
+
+import numpy as np
+
+BACKENDS = ("auto", "numba", "numpy", "python")
+
+KERNEL_MIN_SIZE = 4096
+
+_backend = None
+_compiled = {}
+
+def lennard_jones_energy(r, epsilon, sigma, V):
+    for i in range(r.size):
+        sr2 = (sigma / r[i])**2
+        sr6 = sr2 * sr2 * sr2
+        V[i] = 4 * epsilon * sr6 * (sr6 - 1)
+
+def lennard_jones_energy_force(r, epsilon, sigma, V, F):
+    for i in range(r.size):
+        sr2 = (sigma / r[i])**2
+        sr6 = sr2 * sr2 * sr2
+        V[i] = 4 * epsilon * sr6 * (sr6 - 1)
+        F[i] = 24 * epsilon * sr6 * (2*sr6 - 1) / r[i]
+
+def mie_integer_energy(r, epsilon, sigma, n, m, V):
+    # Integral n >= m: sr^m and sr^(n-m) by repeated squaring, V = ε·sr^m·(sr^(n-m) - 1)
+    m_bits = int(m)
+    d_bits = int(n) - m_bits
+    for i in range(r.size):
+        x = sigma / r[i]
+        srm = 1.0
+        srd = 1.0
+        km = m_bits
+        kd = d_bits
+        while km or kd:
+            if km & 1:
+                srm *= x
+            if kd & 1:
+                srd *= x
+            km >>= 1
+            kd >>= 1
+            x *= x
+        V[i] = epsilon * srm * (srd - 1)
+
+def mie_integer_energy_force(r, epsilon, sigma, n, m, V, F):
+    m_bits = int(m)
+    d_bits = int(n) - m_bits
+    for i in range(r.size):
+        x = sigma / r[i]
+        srm = 1.0
+        srd = 1.0
+        km = m_bits
+        kd = d_bits
+        while km or kd:
+            if km & 1:
+                srm *= x
+            if kd & 1:
+                srd *= x
+            km >>= 1
+            kd >>= 1
+            x *= x
+        srn = srm * srd
+        V[i] = epsilon * (srn - srm)
+        F[i] = epsilon * (n*srn - m*srm) / r[i]
+
+def mie_energy(r, epsilon, sigma, n, m, V):
+    for i in range(r.size):
+        log_sr = math.log(sigma / r[i])
+        V[i] = epsilon * (math.exp(n * log_sr) - math.exp(m * log_sr))
+
+def mie_energy_force(r, epsilon, sigma, n, m, V, F):
+    for i in range(r.size):
+        log_sr = math.log(sigma / r[i])
+        srn = math.exp(n * log_sr)
+        srm = math.exp(m * log_sr)
+        V[i] = epsilon * (srn - srm)
+        F[i] = epsilon * (n*srn - m*srm) / r[i]
+
+def morse_energy(r, epsilon, sigma, a, V):
+    for i in range(r.size):
+        one_minus_x = 1 - math.exp(-a * (r[i] - sigma))
+        V[i] = epsilon * one_minus_x * one_minus_x
+
+def morse_energy_force(r, epsilon, sigma, a, V, F):
+    for i in range(r.size):
+        x = math.exp(-a * (r[i] - sigma))
+        V[i] = epsilon * (1 - x) * (1 - x)
+        F[i] = -2 * epsilon * a * x * (1 - x)
+
+def buckingham_energy(r, epsilon, sigma, A, B, V):
+    for i in range(r.size):
+        sr2 = (sigma / r[i])**2
+        V[i] = A * math.exp(-B * r[i]) - epsilon * sr2 * sr2 * sr2
+
+def buckingham_energy_force(r, epsilon, sigma, A, B, V, F):
+    for i in range(r.size):
+        repulsion = A * math.exp(-B * r[i])
+        sr2 = (sigma / r[i])**2
+        attraction = epsilon * sr2 * sr2 * sr2
+        V[i] = repulsion - attraction
+        F[i] = B * repulsion - 6 * attraction / r[i]
+
+def yukawa_energy(r, epsilon, kappa, V):
+    for i in range(r.size):
+        V[i] = epsilon / r[i] * math.exp(-kappa * r[i])
+
+def yukawa_energy_force(r, epsilon, kappa, V, F):
+    for i in range(r.size):
+        inv_r = 1 / r[i]
+        energy = epsilon * inv_r * math.exp(-kappa * r[i])
+        V[i] = energy
+        F[i] = energy * (kappa + inv_r)
+
+def hermite_lookup(x, segment_start, segment_inv_dx, segment_offset, segment_intervals,
+                   segment_infinite, coefficients, x_min, x_max, V, dV_dx, inside):
+    # Cubic Hermite table lookup (see TabulatedPotential). Points outside
+    # [x_min, x_max) are flagged in ``inside`` and left for the caller.
+    last_segment = segment_start.size - 1
+    for i in range(x.size):
+        xi = x[i]
+        if not (xi >= x_min and xi < x_max):
+            inside[i] = False
+            V[i] = 0.0
+            dV_dx[i] = 0.0
+            continue
+        inside[i] = True
+        k = 0
+        while k < last_segment and xi >= segment_start[k + 1]:
+            k += 1
+        u = (xi - segment_start[k]) * segment_inv_dx[k]
+        j = min(max(int(u), 0), segment_intervals[k] - 1)
+        t = u - j
+        j += segment_offset[k]
+        c0 = coefficients[j, 0]
+        c1 = coefficients[j, 1]
+        c2 = coefficients[j, 2]
+        c3 = coefficients[j, 3]
+        V[i] = math.inf if segment_infinite[k] else ((c3*t + c2)*t + c1)*t + c0
+        dV_dx[i] = ((3*c3*t + 2*c2)*t + c1) * segment_inv_dx[k]
+
+KERNELS = {
+    function.__name__: function for function in (
+        lennard_jones_energy, lennard_jones_energy_force,
+        mie_integer_energy, mie_integer_energy_force,
+        mie_energy, mie_energy_force,
+        morse_energy, morse_energy_force,
+        buckingham_energy, buckingham_energy_force,
+        yukawa_energy, yukawa_energy_force,
+        hermite_lookup
+    )
+}
+
+# Kernels that are faster than the NumPy expressions, used by ``auto``
+AUTO_KERNELS = frozenset((
+    "lennard_jones_energy", "lennard_jones_energy_force",
+    "mie_integer_energy_force", "buckingham_energy_force",
+    "hermite_lookup"
+))
+
+def available_backends():
+    """Backends usable in this environment"""
+    backends = ["numpy", "python"]
+    if importlib.util.find_spec("numba") is not None:
+        backends.insert(0, "numba")
+    return backends
+
+def set_backend(name):
+    """Select the kernel backend (see the module docstring)"""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, not {name!r}")
+    if name == "auto" and "numba" not in available_backends():
+        name = "numpy"
+    if name == "numba" and "numba" not in available_backends():
+        raise ValueError("the numba backend needs Numba installed")
+    _backend = name
+    _compiled.clear()
+
+def get_backend():
+    if _backend is None:
+        set_backend(os.environ.get("PYPAIRVIZ_KERNELS", "auto"))
+    return _backend
+
+def kernel(name):
+    """The kernel ``name`` for the current backend, or None for NumPy"""
+    backend = get_backend()
+    if backend == "numpy" or (backend == "auto" and name not in AUTO_KERNELS):
+        return None
+    if name not in _compiled:
+        if backend in ("numba", "auto"):
+            import numba
+            # Compiled code is cached on disk, so only the first run pays for it
+            _compiled[name] = numba.njit(cache=True)(KERNELS[name])
+        else:
+            _compiled[name] = KERNELS[name]
+    return _compiled[name]
+
+def evaluate(name, r, params, out=None, with_force=False):
+    """Run kernel ``name`` over ``r`` with scalar ``params``.
+
+    Returns V (or (V, F) when ``with_force``) shaped like ``r``, with V
+    written to ``out`` when given, or None when the NumPy path should be
+    used instead: no kernel backend, or fewer than KERNEL_MIN_SIZE points.
+    """
+    if np.size(r) < KERNEL_MIN_SIZE:
+        return None
+    function = kernel(name)
+    if function is None:
+        return None
+
+    r = np.asarray(r, dtype=float)
+    flat_r = np.ascontiguousarray(r).reshape(-1)
+    V = np.empty(r.shape) if out is None else out
+    # Kernels write to 1-D contiguous arrays; copy back for any other layout
+    flat_V = V.reshape(-1) if V.flags.c_contiguous else np.empty(r.size)
+    params = tuple(float(value) for value in params)
+    if with_force:
+        F = np.empty(r.shape)
+        function(flat_r, *params, flat_V, F.reshape(-1))
+    else:
+        function(flat_r, *params, flat_V)
+    if not V.flags.c_contiguous:
+        V[...] = flat_V.reshape(r.shape)
+    return (V, F) if with_force else V
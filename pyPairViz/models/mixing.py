@@ -0,0 +1,264 @@
+import numpy as np
+
+from models.potential_models import integer_powers, is_integral
+from models.tabulated import TabulatedPotential
+
+def lorentz_berthelot(epsilon, sigma, n=12, m=6):
+    """ε_ij = √(ε_i ε_j), σ_ij = (σ_i + σ_j)/2"""
+    return np.sqrt(np.outer(epsilon, epsilon)), 0.5 * (sigma[:, None] + sigma[None, :])
+
+def geometric(epsilon, sigma, n=12, m=6):
+    """ε_ij = √(ε_i ε_j), σ_ij = √(σ_i σ_j)"""
+    return np.sqrt(np.outer(epsilon, epsilon)), np.sqrt(np.outer(sigma, sigma))
+
+def kong(epsilon, sigma, n=12, m=6):
+    """Kong (1973) rule for n-m power laws (12-6 in the original).
+
+    The attractive coefficients εσ^m combine geometrically and the repulsive
+    ones εσ^n as ((a_i^(1/(n+1)) + a_j^(1/(n+1)))/2)^(n+1); ε_ij and σ_ij
+    are solved from the two.
+    """
+    repulsion = epsilon * sigma**n
+    attraction = epsilon * sigma**m
+    root = repulsion ** (1 / (n + 1))
+    repulsion_ij = (0.5 * (root[:, None] + root[None, :])) ** (n + 1)
+    attraction_ij = np.sqrt(np.outer(attraction, attraction))
+    sigma_ij = (repulsion_ij / attraction_ij) ** (1 / (n - m))
+    return attraction_ij / sigma_ij**m, sigma_ij
+
+MIXING_RULES = {
+    "lorentz-berthelot": lorentz_berthelot,
+    "geometric": geometric,
+    "kong": kong
+}
+
+class Mixture:
+    """Pair potential of a multi-component system built by a mixing rule.
+
+    Each species has its own ``epsilon_over_kB`` and ``sigma``; ``rule``
+    (a key of MIXING_RULES) combines them into S×S matrices, and every
+    unordered species pair gets its own ``model_class`` instance. Other
+    parameters (Morse ``a``, Mie ``n`` and ``m``, ...) are shared by all
+    pairs. The Kong rule needs a power-law model and uses its exponents.
+
+    Pairs are evaluated from the species indices of their two particles:
+    ``pair_type`` numbers the unordered pairs, and per-pair parameters are
+    gathered from contiguous arrays indexed by it, so there is no Python
+    lookup per pair. For sums of power laws (LennardJones, MiePotential) the
+    coefficients of each r^-k term form one array and V = Σ c_k[type]·r^-k
+    is a single vectorized expression. Other models are evaluated once per
+    pair type on the pairs sorted by type.
+    """
+    def __init__(self, model_class, epsilon_over_kB, sigma, rule="lorentz-berthelot",
+                 species=None, **params):
+        epsilon = np.atleast_1d(np.asarray(epsilon_over_kB, dtype=float))
+        sigma = np.atleast_1d(np.asarray(sigma, dtype=float))
+        if epsilon.ndim != 1 or epsilon.shape != sigma.shape:
+            raise ValueError("give one epsilon_over_kB and one sigma per species")
+        if rule not in MIXING_RULES:
+            raise ValueError(f"rule must be one of {tuple(MIXING_RULES)}, not {rule!r}")
+        n_species = len(epsilon)
+        self.species = ([str(k) for k in range(n_species)] if species is None
+                        else [str(name) for name in species])
+        if len(self.species) != n_species or len(set(self.species)) != n_species:
+            raise ValueError("species needs one unique name per parameter")
+        self.index = {name: k for k, name in enumerate(self.species)}
+        self.model_class = model_class
+        self.rule = rule
+
+        # Checks the shared parameters and gives the exponents for Kong
+        terms = model_class(epsilon[0], sigma[0], **params).power_terms()
+        if terms is not None:
+            (n, _), (m, _) = sorted(((k, c) for c, k in terms), reverse=True)[:2]
+            exponents = {"n": n, "m": m}
+        elif rule == "kong":
+            raise ValueError(f"the Kong rule needs a power-law model, not {model_class.name}")
+        else:
+            exponents = {}
+        self.epsilon_matrix, self.sigma_matrix = MIXING_RULES[rule](epsilon, sigma, **exponents)
+
+        first, second = np.triu_indices(n_species)
+        self.pair_type = np.empty((n_species, n_species), dtype=np.intp)
+        self.pair_type[first, second] = np.arange(len(first))
+        self.pair_type[second, first] = np.arange(len(first))
+        self.pair_type_flat = self.pair_type.ravel()
+        self.models = [model_class(self.epsilon_matrix[a, b], self.sigma_matrix[a, b], **params)
+                       for a, b in zip(first, second)]
+
+        # Rows of per-type coefficients, one contiguous row per r^-k term
+        self.exponents = None
+        self.coefficients = None
+        if terms is not None:
+            all_terms = [model.power_terms() for model in self.models]
+            self.exponents = tuple(k for _, k in all_terms[0])
+            self.coefficients = np.ascontiguousarray(
+                np.array([[c for c, _ in model_terms] for model_terms in all_terms]).T
+            )
+
+    @property
+    def n_species(self):
+        return len(self.species)
+
+    def species_indices(self, names):
+        """Species index of every particle from its species name"""
+        unique, inverse = np.unique(np.asarray(names, dtype=str), return_inverse=True)
+        unknown = [str(name) for name in unique if name not in self.index]
+        if unknown:
+            raise ValueError(f"unknown species {unknown}; the mixture has {self.species}")
+        return np.array([self.index[name] for name in unique], dtype=np.intp)[inverse]
+
+    def types(self, si, sj):
+        """Pair type of each pair from the species indices of its particles"""
+        return np.take(self.pair_type_flat, np.asarray(si) * self.n_species + np.asarray(sj))
+
+    def pair_model(self, a, b):
+        """The model of the pair of species ``a`` and ``b`` (names or indices)"""
+        a = self.index.get(a, a)
+        b = self.index.get(b, b)
+        return self.models[self.pair_type[a, b]]
+
+    def powers(self, r):
+        inv_r = 1.0 / r
+        if all(is_integral(k) for k in self.exponents):
+            outs = [np.empty_like(inv_r) for _ in self.exponents]
+            integer_powers(inv_r, [int(k) for k in self.exponents], outs, np.empty_like(inv_r))
+            return outs, inv_r
+        return [inv_r**k for k in self.exponents], inv_r
+
+    def by_type(self, types):
+        """Yield (type, indices of its pairs) for every pair type in ``types``"""
+        order = np.argsort(types, kind="stable")
+        sorted_types = types[order]
+        present = np.unique(sorted_types)
+        starts = np.searchsorted(sorted_types, present)
+        stops = np.append(starts[1:], len(order))
+        for t, start, stop in zip(present, starts, stops):
+            yield t, order[start:stop]
+
+    def energy_and_force(self, r, si, sj):
+        """(V, F) of pairs at distances ``r`` between species ``si`` and ``sj``"""
+        r = np.asarray(r, dtype=float)
+        types = self.types(si, sj)
+        if self.coefficients is not None:
+            V = np.zeros_like(r)
+            F = np.zeros_like(r)
+            powers, inv_r = self.powers(r)
+            for k, row, power in zip(self.exponents, self.coefficients, powers):
+                power *= np.take(row, types)
+                V += power
+                F += k * power
+            F *= inv_r
+            return V, F
+
+        V = np.empty_like(r)
+        F = np.empty_like(r)
+        for t, pairs in self.by_type(types):
+            V[pairs], F[pairs] = self.models[t].energy_and_force(r[pairs])
+        return V, F
+
+    def calculate(self, r, si, sj):
+        return self.energy_and_force(r, si, sj)[0]
+
+    def tabulate(self, r_min=None, r_max=10.0, num_points=2000, spacing="r"):
+        return TabulatedMixture(self, r_min, r_max, num_points, spacing)
+
+class TabulatedMixture:
+    """One TabulatedPotential per species pair, stacked for gathered lookups.
+
+    The spline coefficient rows of all tables are concatenated into one
+    (intervals × 4) block, and the per-segment data (start, 1/dx, interval offset,
+    hard cores) into (types × segments) arrays padded with empty segments.
+    A query then gathers its table by pair type, exactly as Mixture gathers
+    parameters, and interpolates all pairs in one pass. Points outside a
+    table's range fall back to the analytic pair model.
+
+    ``r_min`` defaults to half of each pair's σ_ij; the other arguments are
+    those of TabulatedPotential and shared by all tables.
+    """
+    def __init__(self, mixture, r_min=None, r_max=10.0, num_points=2000, spacing="r"):
+        self.mixture = mixture
+        self.species = mixture.species
+        self.spacing = spacing
+        self.tables = [TabulatedPotential(model, r_min, r_max, num_points, spacing)
+                       for model in mixture.models]
+
+        n_types = len(self.tables)
+        self.max_segments = max(len(table.segment_start) for table in self.tables)
+        shape = (n_types, self.max_segments)
+        self.segment_start = np.full(shape, np.inf)
+        self.segment_inv_dx = np.zeros(shape)
+        self.segment_offset = np.zeros(shape, dtype=np.intp)
+        self.segment_intervals = np.ones(shape, dtype=np.intp)
+        self.segment_infinite = np.zeros(shape, dtype=bool)
+        self.x_min = np.array([table.x_min for table in self.tables])
+        self.x_max = np.array([table.x_max for table in self.tables])
+
+        offset = 0
+        for t, table in enumerate(self.tables):
+            k = len(table.segment_start)
+            self.segment_start[t, :k] = table.segment_start
+            self.segment_inv_dx[t, :k] = table.segment_inv_dx
+            self.segment_offset[t, :k] = table.segment_offset + offset
+            self.segment_intervals[t, :k] = table.segment_intervals
+            self.segment_infinite[t, :k] = table.segment_infinite
+            offset += table.coefficients.shape[0]
+        self.coefficients = np.ascontiguousarray(
+            np.concatenate([table.coefficients for table in self.tables], axis=0))
+
+    def species_indices(self, names):
+        return self.mixture.species_indices(names)
+
+    def types(self, si, sj):
+        return self.mixture.types(si, sj)
+
+    def energy_and_force(self, r, si, sj):
+        r = np.asarray(r, dtype=float)
+        types = self.types(si, sj)
+        x = r * r if self.spacing == "r2" else r
+        x_min = np.take(self.x_min, types)
+        inside = (x >= x_min) & (x < np.take(self.x_max, types))
+        x = np.where(inside, x, x_min)
+
+        if self.max_segments == 1:
+            flat = types * 1
+        else:
+            segment = (x[:, None] >= self.segment_start[types]).sum(axis=1) - 1
+            flat = types * self.max_segments + segment
+        u = x - np.take(self.segment_start.ravel(), flat)
+        u *= np.take(self.segment_inv_dx.ravel(), flat)
+        i = u.astype(np.intp)
+        np.clip(i, 0, np.take(self.segment_intervals.ravel(), flat) - 1, out=i)
+        u -= i
+        i += np.take(self.segment_offset.ravel(), flat)
+        c0, c1, c2, c3 = np.take(self.coefficients, i, axis=0).T
+
+        V = c3 * u
+        V += c2
+        V *= u
+        V += c1
+        V *= u
+        V += c0
+        dV_dx = 3*c3*u
+        dV_dx += 2*c2
+        dV_dx *= u
+        dV_dx += c1
+        dV_dx *= np.take(self.segment_inv_dx.ravel(), flat)
+        F = -dV_dx
+        if self.spacing == "r2":
+            F *= 2*r
+        infinite = np.take(self.segment_infinite.ravel(), flat) & inside
+        if np.any(infinite):
+            V[infinite] = np.inf
+            F[infinite] = 0.0
+
+        # Fall back to the analytic pair models outside the tables
+        outside = ~inside
+        if np.any(outside):
+            index = np.flatnonzero(outside)
+            for t, pairs in self.mixture.by_type(types[index]):
+                pairs = index[pairs]
+                V[pairs], F[pairs] = self.mixture.models[t].energy_and_force(r[pairs])
+        return V, F
+
+    def calculate(self, r, si, sj):
+        return self.energy_and_force(r, si, sj)[0]
@@ -1,72 +1,475 @@
 import numpy as np
 
+from models import kernels
+from models.registry import Parameter, register_model
+
+class WorkBuffers:
+    """Reusable scratch arrays so repeated evaluations on same-sized inputs
+    do not allocate. Only the most recent shape/dtype is kept."""
+    def __init__(self):
+        self.key = None
+        self.arrays = []
+
+    def get(self, shape, dtype, count):
+        key = (shape, np.dtype(dtype))
+        if key != self.key or len(self.arrays) < count:
+            self.key = key
+            self.arrays = [np.empty(shape, dtype) for _ in range(count)]
+        return self.arrays[:count]
+
+def integer_powers(x, exponents, outs, work):
+    """Compute x**k for several non-negative integers k by repeated squaring.
+
+    The squares of ``x`` are shared between all exponents. Each result is
+    written to the matching array in ``outs``; ``work`` is scratch space and
+    ``x`` is left unchanged.
+    """
+    exponents = list(exponents)
+    started = [False] * len(exponents)
+    np.copyto(work, x)
+    while any(exponents):
+        for i, k in enumerate(exponents):
+            if k & 1:
+                if started[i]:
+                    np.multiply(outs[i], work, out=outs[i])
+                else:
+                    np.copyto(outs[i], work)
+                    started[i] = True
+            exponents[i] = k >> 1
+        if any(exponents):
+            work *= work
+    for out, done in zip(outs, started):
+        if not done:
+            out.fill(1.0)
+    return outs
+
+def is_integral(value):
+    return float(value).is_integer() and value >= 0
+
 class PotentialModel:
-    def __init__(self, epsilon_over_kB, sigma):
-        self.epsilon_over_kB = epsilon_over_kB
-        self.sigma = sigma
+    """Base class for pair potentials.
+
+    Subclasses provide ``calculate(r)`` for the energy V(r) and
+    ``energy_and_force(r)`` returning ``(V, F)`` with ``F = -dV/dr`` from a
+    single pass, plus ``second_derivative(r)`` for d²V/dr².
+
+    ``parameters`` declares the adjustable parameters (name, default,
+    bounds, units); the constructor and ``set_parameters`` accept them by
+    name. ``parameter_names`` lists the attributes V(r) depends on and
+    ``parameter_jacobian(r)`` returns dV/dp for each of them, in that order.
+
+    ``name``, ``description`` and ``equation`` are class attributes, so the
+    registry can list models without instantiating them.
+    """
+    name = None
+    description = ""
+    equation = ""
+
+    parameters = (
+        Parameter("epsilon_over_kB", 120.0, "Well depth", "ε/kB", "K", bounds=(0, None)),
+        Parameter("sigma", 3.4, "Size", "σ", "Å", bounds=(0, None))
+    )
+    parameter_names = ("epsilon_over_kB", "sigma")
+
+    def __init__(self, epsilon_over_kB=120.0, sigma=3.4, **params):
+        for parameter in self.parameters:
+            setattr(self, parameter.name, parameter.default)
+        self.set_parameters(epsilon_over_kB=epsilon_over_kB, sigma=sigma, **params)
+
+    def set_parameters(self, **params):
+        """Update parameters in place after checking every name and bound"""
+        schema = {parameter.name: parameter for parameter in self.parameters}
+        unknown = set(params) - set(schema)
+        if unknown:
+            raise ValueError(f"{self.name} has no parameters {sorted(unknown)}")
+        values = {name: schema[name].check(value) for name, value in params.items()}
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def force(self, r):
+        """Radial force F(r) = -dV/dr (positive is repulsive)"""
+        return self.energy_and_force(r)[1]
+
+    def energy_and_force(self, r):
+        raise NotImplementedError
+
+    def second_derivative(self, r):
+        raise NotImplementedError
+
+    def parameter_jacobian(self, r):
+        raise NotImplementedError
+
+    def discontinuities(self):
+        """Distances where V(r) jumps; the value at each point is the right limit"""
+        return []
+
+    def power_terms(self):
+        """(c, k) pairs with V(r) = Σ c·r^-k, or None when V is not such a sum"""
+        return None
 
 class LennardJones(PotentialModel):
-    def __init__(self, epsilon_over_kB=120.0, sigma=3.4):
-        super().__init__(epsilon_over_kB, sigma)
-        self.name = "Lennard-Jones"
-        self.description = "Most commonly used for noble gases and simple molecules. Combines short-range repulsion (r⁻¹²) with longer-range attraction (r⁻⁶). The r⁻⁶ term represents van der Waals forces."
-        self.equation = r"$V(r) = 4\varepsilon[(\sigma/r)^{12} - (\sigma/r)^6]$"
+    name = "Lennard-Jones"
+    description = "Most commonly used for noble gases and simple molecules. Combines short-range repulsion (r⁻¹²) with longer-range attraction (r⁻⁶). The r⁻⁶ term represents van der Waals forces."
+    equation = r"$V(r) = 4\varepsilon[(\sigma/r)^{12} - (\sigma/r)^6]$"
 
-    def calculate(self, r):
-        return 4 * self.epsilon_over_kB * ((self.sigma/r)**12 - (self.sigma/r)**6)
+    def __init__(self, epsilon_over_kB=120.0, sigma=3.4, **params):
+        super().__init__(epsilon_over_kB, sigma, **params)
+        self.work_buffers = WorkBuffers()
+
+    def calculate(self, r, out=None):
+        """V(r) from sr6 = (sigma/r)**6 built by multiplication; V = 4ε·sr6·(sr6 - 1).
+
+        Array results are written to ``out`` when given, so repeated calls on
+        large arrays do not allocate.
+        """
+        if out is None and np.ndim(r) == 0:
+            sr2 = (self.sigma/r)**2
+            sr6 = sr2 * sr2 * sr2
+            return 4 * self.epsilon_over_kB * sr6 * (sr6 - 1)
+
+        V = kernels.evaluate("lennard_jones_energy", r, (self.epsilon_over_kB, self.sigma), out)
+        if V is not None:
+            return V
+
+        sr = np.divide(self.sigma, r, out=out)
+        work, = self.work_buffers.get(sr.shape, sr.dtype, 1)
+        np.multiply(sr, sr, out=sr)       # sr2
+        np.multiply(sr, sr, out=work)     # sr4
+        np.multiply(sr, work, out=sr)     # sr6
+        np.subtract(sr, 1, out=work)
+        np.multiply(sr, work, out=sr)
+        sr *= 4 * self.epsilon_over_kB
+        return sr
+
+    def energy_and_force(self, r):
+        result = kernels.evaluate("lennard_jones_energy_force", r,
+                                  (self.epsilon_over_kB, self.sigma), with_force=True)
+        if result is not None:
+            return result
+
+        sr2 = (self.sigma/r)**2
+        sr6 = sr2 * sr2 * sr2
+        sr12 = sr6 * sr6
+        V = 4 * self.epsilon_over_kB * (sr12 - sr6)
+        F = 24 * self.epsilon_over_kB * (2*sr12 - sr6) / r
+        return V, F
+
+    def second_derivative(self, r):
+        sr2 = (self.sigma/r)**2
+        sr6 = sr2 * sr2 * sr2
+        return 4 * self.epsilon_over_kB * (156*sr6*sr6 - 42*sr6) / (r*r)
+
+    def power_terms(self):
+        sigma6 = self.sigma**6
+        return ((4 * self.epsilon_over_kB * sigma6 * sigma6, 12),
+                (-4 * self.epsilon_over_kB * sigma6, 6))
+
+    def parameter_jacobian(self, r):
+        sr2 = (self.sigma/r)**2
+        sr6 = sr2 * sr2 * sr2
+        sr12 = sr6 * sr6
+        dV_deps = 4 * (sr12 - sr6)
+        dV_dsigma = 24 * self.epsilon_over_kB * (2*sr12 - sr6) / self.sigma
+        return dV_deps, dV_dsigma
+
+    def tail_energy(self, r_cut, density):
+        """Energy per particle (K) beyond r_cut for a uniform fluid of density ρ (Å⁻³)"""
+        sr3 = (self.sigma/r_cut)**3
+        return (8/3) * np.pi * density * self.epsilon_over_kB * self.sigma**3 * (sr3**3/3 - sr3)
+
+    def tail_pressure(self, r_cut, density):
+        """Pressure (K/Å³) beyond r_cut for a uniform fluid of density ρ (Å⁻³)"""
+        sr3 = (self.sigma/r_cut)**3
+        return (16/3) * np.pi * density**2 * self.epsilon_over_kB * self.sigma**3 * (2*sr3**3/3 - sr3)
 
 class MorsePotential(PotentialModel):
-    def __init__(self, epsilon_over_kB=120.0, sigma=3.4):
-        super().__init__(epsilon_over_kB, sigma)
-        self.name = "Morse"
-        self.a = 1.0  # width parameter
-        self.description = "Common for diatomic molecules. Provides more realistic behavior for molecular vibrations than Lennard-Jones."
-        self.equation = r"$V(r) = D_e[1 - e^{-a(r-r_e)}]^2$"
+    name = "Morse"
+    description = "Common for diatomic molecules. Provides more realistic behavior for molecular vibrations than Lennard-Jones."
+    equation = r"$V(r) = D_e[1 - e^{-a(r-r_e)}]^2$"
+
+    parameters = PotentialModel.parameters + (
+        Parameter("a", 1.0, "Width parameter", "a", "Å⁻¹", bounds=(0, None)),
+    )
+    parameter_names = ("epsilon_over_kB", "sigma", "a")
 
     def calculate(self, r):
+        V = kernels.evaluate("morse_energy", r, (self.epsilon_over_kB, self.sigma, self.a))
+        if V is not None:
+            return V
         return self.epsilon_over_kB * (1 - np.exp(-self.a * (r - self.sigma)))**2
 
+    def energy_and_force(self, r):
+        result = kernels.evaluate("morse_energy_force", r,
+                                  (self.epsilon_over_kB, self.sigma, self.a), with_force=True)
+        if result is not None:
+            return result
+
+        x = np.exp(-self.a * (r - self.sigma))
+        one_minus_x = 1 - x
+        V = self.epsilon_over_kB * one_minus_x**2
+        F = -2 * self.epsilon_over_kB * self.a * x * one_minus_x
+        return V, F
+
+    def second_derivative(self, r):
+        x = np.exp(-self.a * (r - self.sigma))
+        return 2 * self.epsilon_over_kB * self.a**2 * x * (2*x - 1)
+
+    def parameter_jacobian(self, r):
+        x = np.exp(-self.a * (r - self.sigma))
+        one_minus_x = 1 - x
+        dV_deps = one_minus_x**2
+        dV_dsigma = -2 * self.epsilon_over_kB * self.a * x * one_minus_x
+        dV_da = 2 * self.epsilon_over_kB * (r - self.sigma) * x * one_minus_x
+        return dV_deps, dV_dsigma, dV_da
+
 class BuckinghamPotential(PotentialModel):
-    def __init__(self, epsilon_over_kB=120.0, sigma=3.4):
-        super().__init__(epsilon_over_kB, sigma)
-        self.name = "Buckingham"
-        self.A = 1000.0  # repulsive strength
-        self.B = 2.0     # repulsive range
-        self.description = "Alternative to Lennard-Jones with exponential repulsion. Often more accurate at short ranges."
-        self.equation = r"$V(r) = A e^{-Br} - C/r^6$"
+    name = "Buckingham"
+    description = "Alternative to Lennard-Jones with exponential repulsion. Often more accurate at short ranges."
+    equation = r"$V(r) = A e^{-Br} - C/r^6$"
 
-    def calculate(self, r):
-        return self.A * np.exp(-self.B * r) - self.epsilon_over_kB * (self.sigma/r)**6
+    parameters = PotentialModel.parameters + (
+        Parameter("A", 1000.0, "Repulsive strength", "A", "K", bounds=(0, None)),
+        Parameter("B", 2.0, "Repulsive range", "B", "Å⁻¹", bounds=(0, None))
+    )
+    parameter_names = ("epsilon_over_kB", "sigma", "A", "B")
+
+    def __init__(self, epsilon_over_kB=120.0, sigma=3.4, **params):
+        super().__init__(epsilon_over_kB, sigma, **params)
+        self.work_buffers = WorkBuffers()
+
+    def calculate(self, r, out=None):
+        """V(r) evaluated in place: one exp() and (sigma/r)**6 by multiplication.
+
+        Array results are written to ``out`` when given.
+        """
+        if out is None and np.ndim(r) == 0:
+            return self.A * np.exp(-self.B * r) - self.epsilon_over_kB * (self.sigma/r)**6
+
+        params = (self.epsilon_over_kB, self.sigma, self.A, self.B)
+        V = kernels.evaluate("buckingham_energy", r, params, out)
+        if V is not None:
+            return V
+
+        # The exponential reads r, so it is built before ``out`` (which may
+        # be r itself) is overwritten
+        r = np.asarray(r)
+        repulsion, work = self.work_buffers.get(r.shape, np.result_type(r, 1.0), 2)
+        np.multiply(r, -self.B, out=repulsion)
+        np.exp(repulsion, out=repulsion)
+        repulsion *= self.A
+        sr = np.divide(self.sigma, r, out=out)
+        np.multiply(sr, sr, out=sr)       # sr2
+        np.multiply(sr, sr, out=work)     # sr4
+        np.multiply(sr, work, out=sr)     # sr6
+        sr *= -self.epsilon_over_kB
+        sr += repulsion
+        return sr
+
+    def energy_and_force(self, r):
+        result = kernels.evaluate("buckingham_energy_force", r,
+                                  (self.epsilon_over_kB, self.sigma, self.A, self.B),
+                                  with_force=True)
+        if result is not None:
+            return result
+
+        repulsion = self.A * np.exp(-self.B * r)
+        sr2 = (self.sigma/r)**2
+        attraction = self.epsilon_over_kB * sr2 * sr2 * sr2
+        V = repulsion - attraction
+        F = self.B * repulsion - 6 * attraction / r
+        return V, F
+
+    def second_derivative(self, r):
+        repulsion = self.A * np.exp(-self.B * r)
+        sr2 = (self.sigma/r)**2
+        attraction = self.epsilon_over_kB * sr2 * sr2 * sr2
+        return self.B**2 * repulsion - 42 * attraction / (r*r)
+
+    def parameter_jacobian(self, r):
+        exp_Br = np.exp(-self.B * r)
+        sr2 = (self.sigma/r)**2
+        sr6 = sr2 * sr2 * sr2
+        dV_deps = -sr6
+        dV_dsigma = -6 * self.epsilon_over_kB * sr6 / self.sigma
+        dV_dA = exp_Br
+        dV_dB = -r * self.A * exp_Br
+        return dV_deps, dV_dsigma, dV_dA, dV_dB
 
 class YukawaPotential(PotentialModel):
-    def __init__(self, epsilon_over_kB=120.0, sigma=3.4):
-        super().__init__(epsilon_over_kB, sigma)
-        self.name = "Yukawa"
-        self.kappa = 1.0  # screening length
-        self.description = "Used in plasma physics and colloidal systems. Represents screened electrostatic interactions."
-        self.equation = r"$V(r) = (\varepsilon/r)e^{-\kappa r}$"
+    name = "Yukawa"
+    description = "Used in plasma physics and colloidal systems. Represents screened electrostatic interactions."
+    equation = r"$V(r) = (\varepsilon/r)e^{-\kappa r}$"
 
-    def calculate(self, r):
-        return (self.epsilon_over_kB/r) * np.exp(-self.kappa * r)
+    # ε < 0 gives the attractive screened potential
+    parameters = (
+        Parameter("epsilon_over_kB", 120.0, "Well depth", "ε/kB", "K"),
+        PotentialModel.parameters[1],
+        Parameter("kappa", 1.0, "Screening length", "κ", "Å⁻¹", bounds=(0, None)),
+    )
+    parameter_names = ("epsilon_over_kB", "kappa")
+
+    def __init__(self, epsilon_over_kB=120.0, sigma=3.4, **params):
+        super().__init__(epsilon_over_kB, sigma, **params)
+        self.work_buffers = WorkBuffers()
+
+    def calculate(self, r, out=None):
+        """V(r) evaluated in place; array results are written to ``out`` when given"""
+        if out is None and np.ndim(r) == 0:
+            return (self.epsilon_over_kB/r) * np.exp(-self.kappa * r)
+
+        V = kernels.evaluate("yukawa_energy", r, (self.epsilon_over_kB, self.kappa), out)
+        if V is not None:
+            return V
+
+        # ε/r is taken before ``out`` (which may be r itself) is overwritten
+        r = np.asarray(r)
+        eps_over_r, = self.work_buffers.get(r.shape, np.result_type(r, 1.0), 1)
+        np.divide(self.epsilon_over_kB, r, out=eps_over_r)
+        V = np.multiply(r, -self.kappa, out=out)
+        np.exp(V, out=V)
+        V *= eps_over_r
+        return V
+
+    def energy_and_force(self, r):
+        result = kernels.evaluate("yukawa_energy_force", r, (self.epsilon_over_kB, self.kappa),
+                                  with_force=True)
+        if result is not None:
+            return result
+
+        V = (self.epsilon_over_kB/r) * np.exp(-self.kappa * r)
+        F = V * (self.kappa + 1/r)
+        return V, F
+
+    def second_derivative(self, r):
+        V = (self.epsilon_over_kB/r) * np.exp(-self.kappa * r)
+        inv_r = 1/r
+        return V * ((self.kappa + inv_r)**2 + inv_r*inv_r)
+
+    def parameter_jacobian(self, r):
+        V = (self.epsilon_over_kB/r) * np.exp(-self.kappa * r)
+        return V / self.epsilon_over_kB, -r * V
 
 class MiePotential(PotentialModel):
-    def __init__(self, epsilon_over_kB=120.0, sigma=3.4):
-        super().__init__(epsilon_over_kB, sigma)
-        self.name = "Mie"
-        self.n = 12  # repulsive exponent
-        self.m = 6   # attractive exponent
-        self.description = "Generalized form of Lennard-Jones with adjustable exponents. Provides flexibility in modeling different types of interactions."
-        self.equation = r"$V(r) = \varepsilon[(\sigma/r)^n - (\sigma/r)^m]$"
+    name = "Mie"
+    description = "Generalized form of Lennard-Jones with adjustable exponents. Provides flexibility in modeling different types of interactions."
+    equation = r"$V(r) = \varepsilon[(\sigma/r)^n - (\sigma/r)^m]$"
 
-    def calculate(self, r):
-        return self.epsilon_over_kB * ((self.sigma/r)**self.n - (self.sigma/r)**self.m)
+    parameters = PotentialModel.parameters + (
+        Parameter("n", 12, "Repulsive exponent", "n", bounds=(0, None)),
+        Parameter("m", 6, "Attractive exponent", "m", bounds=(0, None))
+    )
+    parameter_names = ("epsilon_over_kB", "sigma", "n", "m")
+
+    def __init__(self, epsilon_over_kB=120.0, sigma=3.4, **params):
+        super().__init__(epsilon_over_kB, sigma, **params)
+        self.work_buffers = WorkBuffers()
+
+    def calculate(self, r, out=None):
+        """V(r) with integer-exponent and shared-logarithm fast paths.
+
+        Integral n and m use repeated squaring of sigma/r; other exponents
+        share one log(sigma/r) between the two exp() evaluations. Array
+        results are written to ``out`` when given.
+        """
+        if out is None and np.ndim(r) == 0:
+            sr = self.sigma/r
+            return self.epsilon_over_kB * (sr**self.n - sr**self.m)
+
+        V = kernels.evaluate(self.kernel_name("mie_energy"), r,
+                             (self.epsilon_over_kB, self.sigma, self.n, self.m), out)
+        if V is not None:
+            return V
+
+        sr = np.divide(self.sigma, r, out=out)
+        if is_integral(self.n) and is_integral(self.m) and self.n >= self.m:
+            n, m = int(self.n), int(self.m)
+            srm, srd, work = self.work_buffers.get(sr.shape, sr.dtype, 3)
+            integer_powers(sr, (m, n - m), (srm, srd), work)
+            # V = ε·srm·(sr^(n-m) - 1)
+            np.subtract(srd, 1, out=srd)
+            np.multiply(srm, srd, out=sr)
+        else:
+            srm, = self.work_buffers.get(sr.shape, sr.dtype, 1)
+            np.log(sr, out=sr)
+            np.multiply(sr, self.m, out=srm)
+            np.exp(srm, out=srm)
+            sr *= self.n
+            np.exp(sr, out=sr)
+            sr -= srm
+        sr *= self.epsilon_over_kB
+        return sr
+
+    def kernel_name(self, name):
+        """The integer-power variant of kernel ``name`` when n and m allow it"""
+        if is_integral(self.n) and is_integral(self.m) and self.n >= self.m:
+            return name.replace("mie_", "mie_integer_")
+        return name
+
+    def powers(self, r):
+        """Return ((sigma/r)**n, (sigma/r)**m), multiplying up integral exponents"""
+        sr = self.sigma/r
+        if np.ndim(sr) == 0 or not (
+                is_integral(self.n) and is_integral(self.m) and self.n >= self.m):
+            return sr**self.n, sr**self.m
+        srm, srd = np.empty_like(sr), np.empty_like(sr)
+        integer_powers(sr, (int(self.m), int(self.n - self.m)), (srm, srd),
+                       np.empty_like(sr))
+        return srm * srd, srm
+
+    def energy_and_force(self, r):
+        result = kernels.evaluate(self.kernel_name("mie_energy_force"), r,
+                                  (self.epsilon_over_kB, self.sigma, self.n, self.m),
+                                  with_force=True)
+        if result is not None:
+            return result
+
+        srn, srm = self.powers(r)
+        V = self.epsilon_over_kB * (srn - srm)
+        F = self.epsilon_over_kB * (self.n*srn - self.m*srm) / r
+        return V, F
+
+    def second_derivative(self, r):
+        srn, srm = self.powers(r)
+        return self.epsilon_over_kB * (
+            self.n*(self.n + 1)*srn - self.m*(self.m + 1)*srm
+        ) / (r*r)
+
+    def parameter_jacobian(self, r):
+        srn, srm = self.powers(r)
+        log_sr = np.log(self.sigma/r)
+        dV_deps = srn - srm
+        dV_dsigma = self.epsilon_over_kB * (self.n*srn - self.m*srm) / self.sigma
+        dV_dn = self.epsilon_over_kB * srn * log_sr
+        dV_dm = -self.epsilon_over_kB * srm * log_sr
+        return dV_deps, dV_dsigma, dV_dn, dV_dm
+
+    def power_terms(self):
+        return ((self.epsilon_over_kB * self.sigma**self.n, self.n),
+                (-self.epsilon_over_kB * self.sigma**self.m, self.m))
+
+    def tail_energy(self, r_cut, density):
+        """Energy per particle (K) beyond r_cut for a uniform fluid of density ρ (Å⁻³).
+
+        Requires n, m > 3 for the integrals to converge.
+        """
+        sr = self.sigma/r_cut
+        return 2 * np.pi * density * self.epsilon_over_kB * self.sigma**3 * (
+            sr**(self.n - 3)/(self.n - 3) - sr**(self.m - 3)/(self.m - 3)
+        )
+
+    def tail_pressure(self, r_cut, density):
+        """Pressure (K/Å³) beyond r_cut for a uniform fluid of density ρ (Å⁻³)"""
+        sr = self.sigma/r_cut
+        return (2/3) * np.pi * density**2 * self.epsilon_over_kB * self.sigma**3 * (
+            self.n * sr**(self.n - 3)/(self.n - 3) - self.m * sr**(self.m - 3)/(self.m - 3)
+        )
 
 class HardSphere(PotentialModel):
-    def __init__(self, epsilon_over_kB=120.0, sigma=3.4):
-        super().__init__(epsilon_over_kB, sigma)
-        self.name = "Hard Sphere"
-        self.description = "Simplest model where particles act as perfect rigid spheres. Used for studying entropy-driven phenomena and as a reference system for more complex fluids."
-        self.equation = r"$V(r) = \infty$ for $r < \sigma$, $0$ for $r \geq \sigma$"
+    name = "Hard Sphere"
+    description = "Simplest model where particles act as perfect rigid spheres. Used for studying entropy-driven phenomena and as a reference system for more complex fluids."
+    equation = r"$V(r) = \infty$ for $r < \sigma$, $0$ for $r \geq \sigma$"
+
+    parameter_names = ("sigma",)
 
     def calculate(self, r):
         mask = r < self.sigma
@@ -74,14 +477,28 @@ class HardSphere(PotentialModel):
         potential[mask] = np.inf
         return potential
 
+    def energy_and_force(self, r):
+        """Energy and force; the impulsive contact force is not representable,
+        so the force is zero everywhere (use event-driven dynamics instead)"""
+        return self.calculate(r), np.zeros_like(r, dtype=float)
+
+    def second_derivative(self, r):
+        return np.zeros_like(r, dtype=float)
+
+    def parameter_jacobian(self, r):
+        """dV/dsigma is a delta function at the core; zero elsewhere"""
+        return (np.zeros_like(r, dtype=float),)
+
+    def discontinuities(self):
+        return [self.sigma]
+
 class SquareWell(PotentialModel):
-    def __init__(self, epsilon_over_kB=120.0, sigma=3.4):
-        super().__init__(epsilon_over_kB, sigma)
-        self.name = "Square Well"
-        self.well_width = 1.5  # Fixed value
-        self.well_depth = 1.0  # Fixed value
-        self.description = "Combines hard sphere repulsion with a constant attractive well. Useful for studying phase transitions and as a simple model for colloidal systems."
-        self.equation = r"$V(r) = \infty$ for $r < \sigma$, $-\varepsilon$ for $\sigma \leq r < 1.5\sigma$, $0$ for $r \geq 1.5\sigma$"
+    name = "Square Well"
+    description = "Combines hard sphere repulsion with a constant attractive well. Useful for studying phase transitions and as a simple model for colloidal systems."
+    equation = r"$V(r) = \infty$ for $r < \sigma$, $-\varepsilon$ for $\sigma \leq r < 1.5\sigma$, $0$ for $r \geq 1.5\sigma$"
+
+    well_width = 1.5  # Fixed value
+    well_depth = 1.0  # Fixed value
 
     def calculate(self, r):
         well_position = self.sigma * self.well_width
@@ -93,13 +510,29 @@ class SquareWell(PotentialModel):
         potential[mask_well] = -self.epsilon_over_kB * self.well_depth
         return potential
 
+    def energy_and_force(self, r):
+        """Energy and force; the force is zero between the discontinuities at
+        sigma and well_width*sigma (use event-driven dynamics instead)"""
+        return self.calculate(r), np.zeros_like(r, dtype=float)
+
+    def second_derivative(self, r):
+        return np.zeros_like(r, dtype=float)
+
+    def parameter_jacobian(self, r):
+        """Derivatives away from the discontinuities"""
+        in_well = (r >= self.sigma) & (r < self.sigma * self.well_width)
+        dV_deps = np.where(in_well, -self.well_depth, 0.0)
+        return dV_deps, np.zeros_like(r, dtype=float)
+
+    def discontinuities(self):
+        return [self.sigma, self.sigma * self.well_width]
+
 class Sutherland(PotentialModel):
-    def __init__(self, epsilon_over_kB=120.0, sigma=3.4):
-        super().__init__(epsilon_over_kB, sigma)
-        self.name = "Sutherland"
-        self.n = 12  # Fixed value
-        self.description = "Historical potential with hard-core repulsion and power-law attraction. Used in theoretical studies and as a simplified model for molecular interactions."
-        self.equation = r"$V(r) = \infty$ for $r < \sigma$, $-\varepsilon(\sigma/r)^{12}$ for $r \geq \sigma$"
+    name = "Sutherland"
+    description = "Historical potential with hard-core repulsion and power-law attraction. Used in theoretical studies and as a simplified model for molecular interactions."
+    equation = r"$V(r) = \infty$ for $r < \sigma$, $-\varepsilon(\sigma/r)^{12}$ for $r \geq \sigma$"
+
+    n = 12  # Fixed value
 
     def calculate(self, r):
         if isinstance(r, np.ndarray):
@@ -111,4 +544,33 @@ class Sutherland(PotentialModel):
             if r < self.sigma:
                 return np.inf
             else:
-                return -self.epsilon_over_kB * (self.sigma/r)**self.n
\ No newline at end of file
+                return -self.epsilon_over_kB * (self.sigma/r)**self.n
+
+    def energy_and_force(self, r):
+        """Energy and force outside the hard core; the force is zero inside it"""
+        core = r < self.sigma
+        attraction = -self.epsilon_over_kB * (self.sigma/r)**self.n
+        V = np.where(core, np.inf, attraction)
+        F = np.where(core, 0.0, self.n * attraction / r)
+        return V, F
+
+    def second_derivative(self, r):
+        core = r < self.sigma
+        attraction = -self.epsilon_over_kB * (self.sigma/r)**self.n
+        return np.where(core, 0.0, self.n*(self.n + 1) * attraction / (r*r))
+
+    def parameter_jacobian(self, r):
+        """Derivatives outside the hard core; zero inside it"""
+        core = r < self.sigma
+        srn = (self.sigma/r)**self.n
+        dV_deps = np.where(core, 0.0, -srn)
+        dV_dsigma = np.where(core, 0.0, -self.n * self.epsilon_over_kB * srn / self.sigma)
+        return dV_deps, dV_dsigma
+
+    def discontinuities(self):
+        return [self.sigma]
+
+# Built-in models, registered in the order the model selector lists them
+for model_class in (LennardJones, HardSphere, SquareWell, Sutherland,
+                    MorsePotential, BuckinghamPotential, YukawaPotential, MiePotential):
+    register_model(model_class)
@@ -0,0 +1,97 @@
+import warnings
+
+# Models by display name, in registration order
+MODEL_REGISTRY = {}
+
+# Installed packages add models through entry points in this group; each
+# entry point names a PotentialModel subclass (or a module that registers
+# its models on import)
+ENTRY_POINT_GROUP = "pyPairViz.models"
+
+_plugins_loaded = False
+
+class Parameter:
+    """Declarative description of one model parameter.
+
+    ``bounds`` is an open interval (low, high); None leaves that side
+    unbounded, and the default accepts any value. ``symbol`` and ``units`` are used to label entry widgets.
+    """
+    def __init__(self, name, default, label, symbol, units="", bounds=(None, None)):
+        self.name = name
+        self.default = default
+        self.label = label
+        self.symbol = symbol
+        self.units = units
+        self.bounds = bounds
+
+    @property
+    def display_label(self):
+        """Widget label such as 'Width parameter (a, Å⁻¹):'"""
+        detail = f"{self.symbol}, {self.units}" if self.units else self.symbol
+        return f"{self.label} ({detail}):"
+
+    def in_bounds(self, value):
+        low, high = self.bounds
+        return (low is None or value > low) and (high is None or value < high)
+
+    def check(self, value):
+        """Return ``value`` as a float, raising ValueError when it is out of bounds"""
+        value = float(value)
+        if not self.in_bounds(value):
+            low, high = self.bounds
+            interval = f"({'-∞' if low is None else low}, {'∞' if high is None else high})"
+            raise ValueError(f"{self.name} = {value:g} is outside {interval}")
+        return value
+
+    def __repr__(self):
+        return f"Parameter({self.name!r}, {self.default!r})"
+
+def register_model(model_class):
+    """Class decorator adding a PotentialModel subclass to the registry under its ``name``"""
+    name = model_class.name
+    registered = MODEL_REGISTRY.get(name)
+    if registered is not None and registered is not model_class:
+        raise ValueError(f"a model named {name!r} is already registered "
+                         f"({registered.__module__}.{registered.__qualname__})")
+    MODEL_REGISTRY[name] = model_class
+    return model_class
+
+def load_plugins():
+    """Import the built-in models and any installed through entry points (once)"""
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+
+    # Built-in models register themselves when their module is imported
+    import models.potential_models  # noqa: F401
+
+    from importlib.metadata import entry_points
+    found = entry_points()
+    if hasattr(found, "select"):
+        found = found.select(group=ENTRY_POINT_GROUP)
+    else:
+        found = found.get(ENTRY_POINT_GROUP, [])
+    for entry_point in found:
+        try:
+            loaded = entry_point.load()
+        except Exception as error:
+            warnings.warn(f"could not load model plugin {entry_point.name!r}: {error}")
+            continue
+        if isinstance(loaded, type):
+            register_model(loaded)
+
+def model_classes():
+    """Registered model classes by display name; nothing is instantiated"""
+    load_plugins()
+    return dict(MODEL_REGISTRY)
+
+def get_model_class(name):
+    load_plugins()
+    if name not in MODEL_REGISTRY:
+        raise ValueError(f"unknown model {name!r}; choose from {sorted(MODEL_REGISTRY)}")
+    return MODEL_REGISTRY[name]
+
+def create_model(name, **params):
+    """Instantiate the model registered as ``name`` with the given parameters"""
+    return get_model_class(name)(**params)
@@ -0,0 +1,267 @@
+import numpy as np
+
+from models import kernels
+from models.potential_models import PotentialModel
+
+class TabulatedPotential(PotentialModel):
+    """Cubic Hermite table of any PotentialModel with O(1) lookups.
+
+    The wrapped model is sampled once on a uniform grid in ``r`` or, with
+    ``spacing="r2"``, in r² so callers holding squared distances can skip the
+    square root. Energies and exact analytic slopes at the nodes give a C¹
+    spline whose coefficients are stored one contiguous row per interval;
+    queries reduce to an index computation, one gather and a cubic
+    polynomial. Large arrays go through the fused ``hermite_lookup`` kernel
+    when a kernel backend is active.
+
+    Discontinuities reported by ``model.discontinuities()`` (hard cores and
+    well edges) are placed exactly on segment boundaries, so jumps are
+    reproduced without smearing. Segments where the model is infinite return
+    ``inf`` energy and zero force. Points outside ``[r_min, r_max)`` fall back
+    to the wrapped model.
+
+    The table is a snapshot: rebuild it after changing the model parameters.
+    """
+    def __init__(self, model, r_min=None, r_max=10.0, num_points=2000, spacing="r"):
+        super().__init__(model.epsilon_over_kB, model.sigma)
+        if spacing not in ("r", "r2"):
+            raise ValueError(f"spacing must be 'r' or 'r2', not {spacing!r}")
+
+        self.model = model
+        self.name = model.name
+        self.description = model.description
+        self.equation = model.equation
+        self.r_min = 0.5 * model.sigma if r_min is None else r_min
+        self.r_max = r_max
+        self.num_points = num_points
+        self.spacing = spacing
+
+        self.build()
+
+    def to_x(self, r):
+        return r * r if self.spacing == "r2" else r
+
+    def build(self):
+        """Sample the model and compute per-interval spline coefficients"""
+        x_min, x_max = self.to_x(self.r_min), self.to_x(self.r_max)
+        inner = sorted(
+            d for d in self.model.discontinuities()
+            if self.r_min < d < self.r_max
+        )
+        edges_r = [self.r_min] + inner + [self.r_max]
+        edges = [self.to_x(d) for d in edges_r]
+
+        self.x_min, self.x_max = x_min, x_max
+        self.segment_start = np.array(edges[:-1])
+        num_segments = len(self.segment_start)
+        self.segment_inv_dx = np.zeros(num_segments)
+        self.segment_offset = np.zeros(num_segments, dtype=np.intp)
+        self.segment_intervals = np.zeros(num_segments, dtype=np.intp)
+        self.segment_infinite = np.zeros(num_segments, dtype=bool)
+
+        coefficients = []
+        offset = 0
+        total_intervals = max(self.num_points - 1, num_segments)
+        for k, (left, right) in enumerate(zip(edges[:-1], edges[1:])):
+            n_intervals = max(1, int(round(total_intervals * (right - left) / (x_max - x_min))))
+            x = np.linspace(left, right, n_intervals + 1)
+            r = np.sqrt(x) if self.spacing == "r2" else x.copy()
+            # Pin the ends to the exact edges in r (sqrt may round across a
+            # discontinuity) and sample the left limit at the right edge
+            r[0] = edges_r[k]
+            r[-1] = np.nextafter(edges_r[k + 1], -np.inf)
+
+            V, F = self.model.energy_and_force(r)
+            V = np.asarray(V, dtype=float)
+            self.segment_infinite[k] = np.isinf(V[len(V) // 2])
+            if self.segment_infinite[k]:
+                V = np.zeros_like(V)
+                F = np.zeros_like(V)
+
+            # Node slopes in the tabulation variable: dV/dx
+            dV_dx = -np.asarray(F, dtype=float)
+            if self.spacing == "r2":
+                dV_dx = dV_dx / (2 * r)
+
+            dx = (right - left) / n_intervals
+            V0, V1 = V[:-1], V[1:]
+            m0, m1 = dV_dx[:-1] * dx, dV_dx[1:] * dx
+            coefficients.append(np.stack([
+                V0,
+                m0,
+                3*(V1 - V0) - 2*m0 - m1,
+                2*(V0 - V1) + m0 + m1
+            ], axis=1))
+
+            self.segment_inv_dx[k] = 1.0 / dx
+            self.segment_offset[k] = offset
+            self.segment_intervals[k] = n_intervals
+            offset += n_intervals
+
+        # One contiguous (c0, c1, c2, c3) row per interval, so a lookup
+        # gathers all four coefficients at once
+        self.coefficients = np.ascontiguousarray(np.concatenate(coefficients, axis=0))
+
+    def locate(self, x):
+        """Return (global interval index, local coordinate t, segment index)"""
+        if len(self.segment_start) == 1:
+            segment = 0
+        else:
+            segment = np.searchsorted(self.segment_start, x, side="right") - 1
+            np.clip(segment, 0, len(self.segment_start) - 1, out=segment)
+        u = x - self.segment_start[segment]
+        u *= self.segment_inv_dx[segment]
+        i = u.astype(np.intp)
+        np.clip(i, 0, self.segment_intervals[segment] - 1, out=i)
+        u -= i
+        i += self.segment_offset[segment]
+        return i, u, segment
+
+    def evaluate(self, r, need_energy=True, need_force=True, need_curvature=False,
+                 squared=False):
+        """Interpolate energy, force and/or d²V/dr² at distances ``r``.
+
+        With ``squared=True`` (r2 tables only) ``r`` holds squared distances
+        and the force result is F/r, so no square roots are taken.
+        """
+        r = np.asarray(r, dtype=float)
+        scalar = r.ndim == 0
+        r = np.atleast_1d(r)
+        x = r if squared else self.to_x(r)
+
+        lookup = None
+        if not need_curvature and x.size >= kernels.KERNEL_MIN_SIZE:
+            lookup = kernels.kernel("hermite_lookup")
+        if lookup is not None:
+            flat_x = np.ascontiguousarray(x).reshape(-1)
+            V = np.empty(x.shape)
+            dV_dx = np.empty(x.shape)
+            inside = np.empty(x.shape, dtype=bool)
+            lookup(flat_x, self.segment_start, self.segment_inv_dx, self.segment_offset,
+                   self.segment_intervals, self.segment_infinite, self.coefficients,
+                   self.x_min, self.x_max, V.reshape(-1), dV_dx.reshape(-1),
+                   inside.reshape(-1))
+            all_inside = inside.all()
+        else:
+            inside = (x >= self.x_min) & (x < self.x_max)
+            all_inside = inside.all()
+            index, t, segment = self.locate(x if all_inside else np.where(inside, x, self.x_min))
+            c0, c1, c2, c3 = np.take(self.coefficients, index, axis=0).T
+            inv_dx = self.segment_inv_dx[segment]
+
+        results = []
+        if need_energy:
+            if lookup is None:
+                V = np.multiply(c3, t)
+                V += c2
+                V *= t
+                V += c1
+                V *= t
+                V += c0
+                infinite = self.segment_infinite[segment] & inside
+                if np.any(infinite):
+                    V[infinite] = np.inf
+            results.append(V)
+        if (need_force or need_curvature) and lookup is None:
+            dV_dx = np.multiply(c3, t)
+            dV_dx *= 3
+            dV_dx += c2
+            dV_dx += c2
+            dV_dx *= t
+            dV_dx += c1
+            dV_dx *= inv_dx
+        if need_force:
+            # The curvature of r2 tables still needs dV/dx
+            F = dV_dx.copy() if need_curvature else dV_dx
+            if squared:
+                F *= -2
+            elif self.spacing == "r2":
+                F *= -2*r
+            else:
+                np.negative(F, out=F)
+            results.append(F)
+        if need_curvature:
+            d2V_dx2 = (6*c3*t + 2*c2) * inv_dx * inv_dx
+            if self.spacing == "r2":
+                d2V_dx2 = 4*r*r*d2V_dx2 + 2*dV_dx
+            results.append(d2V_dx2)
+
+        # Fall back to the analytic model outside the tabulated range
+        if not all_inside:
+            outside = ~inside
+            r_out = np.sqrt(r[outside]) if squared else r[outside]
+            exact = []
+            if need_energy or need_force:
+                V_out, F_out = self.model.energy_and_force(r_out)
+                if need_energy:
+                    exact.append(V_out)
+                if need_force:
+                    exact.append(F_out / r_out if squared else F_out)
+            if need_curvature:
+                exact.append(self.model.second_derivative(r_out))
+            for result, value in zip(results, exact):
+                result[outside] = value
+
+        if scalar:
+            results = [result[0] for result in results]
+        return results
+
+    def calculate(self, r):
+        return self.evaluate(r, need_force=False)[0]
+
+    def force(self, r):
+        return self.evaluate(r, need_energy=False)[0]
+
+    def energy_and_force(self, r):
+        V, F = self.evaluate(r)
+        return V, F
+
+    def energy_and_force_over_r(self, r2):
+        """(V, F/r) from squared distances, the form pair-force loops need.
+
+        For ``spacing="r2"`` tables this involves no square roots.
+        """
+        if self.spacing == "r2":
+            V, F_over_r = self.evaluate(r2, squared=True)
+            return V, F_over_r
+        r = np.sqrt(r2)
+        V, F = self.evaluate(r)
+        return V, F / r
+
+    def second_derivative(self, r):
+        return self.evaluate(r, need_energy=False, need_force=False,
+                             need_curvature=True)[0]
+
+    def discontinuities(self):
+        return self.model.discontinuities()
+
+    def error_bounds(self, samples_per_interval=4):
+        """Compare the table with the wrapped model between the nodes.
+
+        Returns the maximum absolute and relative energy and force errors over
+        points strictly inside each interval of the finite segments.
+        """
+        x = []
+        for start, inv_dx, n_intervals, infinite in zip(
+                self.segment_start, self.segment_inv_dx,
+                self.segment_intervals, self.segment_infinite):
+            if infinite:
+                continue
+            fractions = (np.arange(samples_per_interval) + 0.5) / samples_per_interval
+            x.append(start + (np.arange(n_intervals)[:, None] + fractions).ravel() / inv_dx)
+        if not x:
+            return {"max_abs_energy": 0.0, "max_rel_energy": 0.0,
+                    "max_abs_force": 0.0, "max_rel_force": 0.0}
+        x = np.concatenate(x)
+        r = np.sqrt(x) if self.spacing == "r2" else x
+
+        V_table, F_table = self.energy_and_force(r)
+        V_exact, F_exact = self.model.energy_and_force(r)
+        energy_error = np.abs(V_table - V_exact)
+        force_error = np.abs(F_table - F_exact)
+        return {
+            "max_abs_energy": float(energy_error.max()),
+            "max_rel_energy": float((energy_error / np.maximum(np.abs(V_exact), 1e-12)).max()),
+            "max_abs_force": float(force_error.max()),
+            "max_rel_force": float((force_error / np.maximum(np.abs(F_exact), 1e-12)).max()),
+        }
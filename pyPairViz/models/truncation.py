@@ -0,0 +1,146 @@
+import numpy as np
+
+from models.potential_models import PotentialModel
+
+TRUNCATION_MODES = ("cut", "shift", "force_shift", "switch")
+
+class TruncatedPotential(PotentialModel):
+    """Truncate any PotentialModel at ``r_cut``.
+
+    Modes:
+        ``cut``          V(r) for r < r_cut, 0 beyond (energy jumps at r_cut)
+        ``shift``        V(r) - V(r_cut), continuous energy
+        ``force_shift``  V(r) - V(r_cut) + (r - r_cut)·F(r_cut), continuous
+                         energy and force
+        ``switch``       V(r)·S(r) with a quintic switch S going smoothly from
+                         1 at ``r_switch`` to 0 at ``r_cut``
+
+    Distances at or beyond ``r_cut`` are masked out and never reach the
+    wrapped model.
+    """
+    def __init__(self, model, r_cut, mode="shift", r_switch=None):
+        super().__init__(model.epsilon_over_kB, model.sigma)
+        if mode not in TRUNCATION_MODES:
+            raise ValueError(f"mode must be one of {TRUNCATION_MODES}, not {mode!r}")
+        if mode == "switch":
+            r_switch = 0.9 * r_cut if r_switch is None else r_switch
+            if not 0 < r_switch < r_cut:
+                raise ValueError("r_switch must lie between 0 and r_cut")
+
+        self.model = model
+        self.name = model.name
+        self.description = model.description
+        self.equation = model.equation
+        self.r_cut = r_cut
+        self.mode = mode
+        self.r_switch = r_switch
+
+        # Values of the wrapped model at the cutoff used by the shifted modes
+        self.V_cut, self.F_cut = (float(value) for value in model.energy_and_force(float(r_cut)))
+        if mode in ("shift", "force_shift") and not np.isfinite(self.V_cut):
+            raise ValueError("the potential must be finite at r_cut to be shifted")
+
+    def switch(self, r):
+        """Quintic switch S(r) and its derivative dS/dr on r_switch <= r < r_cut"""
+        width = self.r_cut - self.r_switch
+        u = np.clip((r - self.r_switch) / width, 0.0, 1.0)
+        S = 1 - u**3 * (10 - 15*u + 6*u*u)
+        dS_dr = -30 * u*u * (1 - u)**2 / width
+        return S, dS_dr
+
+    def energy_and_force(self, r):
+        r = np.asarray(r, dtype=float)
+        scalar = r.ndim == 0
+        r = np.atleast_1d(r)
+
+        inside = r < self.r_cut
+        V = np.zeros_like(r)
+        F = np.zeros_like(r)
+        if inside.all():
+            r_in = r
+            V, F = (np.array(value, dtype=float) for value in self.model.energy_and_force(r))
+        elif inside.any():
+            r_in = r[inside]
+            V_in, F_in = self.model.energy_and_force(r_in)
+            V[inside] = V_in
+            F[inside] = F_in
+
+        if inside.any():
+            if self.mode == "shift":
+                V[inside] -= self.V_cut
+            elif self.mode == "force_shift":
+                V[inside] += (r_in - self.r_cut) * self.F_cut - self.V_cut
+                F[inside] -= self.F_cut
+            elif self.mode == "switch":
+                S, dS_dr = self.switch(r_in)
+                V_in, F_in = V[inside], F[inside]
+                # F = -d(V·S)/dr = F·S - V·dS/dr; the switch is flat (S = 1)
+                # wherever V is infinite, so keep the plain force there
+                with np.errstate(invalid="ignore"):
+                    F_switched = F_in*S - V_in*dS_dr
+                F[inside] = np.where(np.isfinite(V_in), F_switched, F_in)
+                V[inside] = V_in * S
+
+        if scalar:
+            return V[0], F[0]
+        return V, F
+
+    def calculate(self, r):
+        return self.energy_and_force(r)[0]
+
+    def second_derivative(self, r):
+        r = np.asarray(r, dtype=float)
+        scalar = r.ndim == 0
+        r = np.atleast_1d(r)
+        inside = r < self.r_cut
+        result = np.zeros_like(r)
+        if inside.any():
+            r_in = r[inside]
+            d2V = self.model.second_derivative(r_in)
+            if self.mode == "switch":
+                V, F = self.model.energy_and_force(r_in)
+                width = self.r_cut - self.r_switch
+                u = np.clip((r_in - self.r_switch) / width, 0.0, 1.0)
+                S, dS_dr = self.switch(r_in)
+                d2S_dr2 = -60 * u * (1 - u) * (1 - 2*u) / (width * width)
+                # (V·S)'' = V''·S + 2·V'·S' + V·S'', again flat where V is infinite
+                with np.errstate(invalid="ignore"):
+                    d2V_switched = d2V*S - 2*F*dS_dr + V*d2S_dr2
+                d2V = np.where(np.isfinite(V), d2V_switched, d2V)
+            result[inside] = d2V
+        return result[0] if scalar else result
+
+    def discontinuities(self):
+        points = [d for d in self.model.discontinuities() if d < self.r_cut]
+        if self.mode == "cut" and self.V_cut != 0:
+            points.append(self.r_cut)
+        return points
+
+    @property
+    def has_tail_correction(self):
+        """Whether the standard tail correction applies: cut or shifted
+        modes of a model that provides one"""
+        return self.mode in ("cut", "shift") and hasattr(self.model, "tail_energy")
+
+    def check_tail_correction(self):
+        if self.mode not in ("cut", "shift"):
+            raise ValueError(f"the standard tail correction does not apply to the "
+                             f"{self.mode!r} mode, which changes V(r) inside r_cut")
+        if not hasattr(self.model, "tail_energy"):
+            raise ValueError(f"{self.model.name} has no tail correction")
+
+    def tail_energy(self, density):
+        """Long-range energy correction per particle (K) at number density ρ (Å⁻³)
+
+        Standard mean-field tail for a uniform fluid beyond r_cut; applies to
+        the plain and shifted modes, which share the same untruncated tail,
+        and raises ValueError for the force-shifted and switched modes.
+        """
+        self.check_tail_correction()
+        return self.model.tail_energy(self.r_cut, density)
+
+    def tail_pressure(self, density):
+        """Long-range pressure correction (K/Å³) at number density ρ (Å⁻³);
+        cut and shifted modes only, as for ``tail_energy``"""
+        self.check_tail_correction()
+        return self.model.tail_pressure(self.r_cut, density)
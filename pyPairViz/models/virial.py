@@ -0,0 +1,200 @@
+import numpy as np
+
+from models.potential_models import HardSphere, SquareWell
+from models.truncation import TruncatedPotential
+
+# 1 Å³ per molecule in cm³/mol
+A3_TO_CM3_PER_MOL = 0.602214076
+
+# Gauss-Legendre rule used on every panel, mapped from [-1, 1] to [0, 1]
+GAUSS_ORDER = 8
+_nodes, _weights = np.polynomial.legendre.leggauss(GAUSS_ORDER)
+GAUSS_NODES = 0.5 * (_nodes + 1)
+GAUSS_WEIGHTS = 0.5 * _weights
+
+def hard_sphere_b2(sigma):
+    """Excluded-volume B2 = 2πσ³/3 (Å³)"""
+    return 2 * np.pi * sigma**3 / 3
+
+def mayer_integrand(model, r, temperatures):
+    """(e^{-V(r)/T} - 1)·r² on a (T × r) grid"""
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        V = np.asarray(model.calculate(r), dtype=float)
+        f = np.expm1(-V[None, :] / temperatures[:, None])
+        return f * (r * r)[None, :]
+
+def panel_integrals(model, lower, width, temperatures):
+    """Gauss-Legendre integral of the Mayer integrand over each panel, shape (T, panels)"""
+    r = (lower[:, None] + width[:, None] * GAUSS_NODES[None, :]).ravel()
+    values = mayer_integrand(model, r, temperatures).reshape(len(temperatures), len(lower), GAUSS_ORDER)
+    return values @ GAUSS_WEIGHTS * width[None, :]
+
+def adaptive_panels(model, breakpoints, temperatures, rtol=1e-8, max_levels=30):
+    """Integrate the Mayer integrand between ``breakpoints`` for all temperatures.
+
+    Every panel is halved, for all temperatures at once, while the 8-point
+    Gauss-Legendre estimate of its two halves disagrees with the whole.
+    Returns the integrals, shape (T,), and the (lower, width) of the final
+    panels so other integrands can reuse the same nodes.
+    """
+    T = temperatures
+    lower = np.concatenate([
+        np.linspace(a, b, 17)[:-1] for a, b in zip(breakpoints[:-1], breakpoints[1:])
+    ])
+    width = np.concatenate([
+        np.full(16, (b - a) / 16) for a, b in zip(breakpoints[:-1], breakpoints[1:])
+    ])
+
+    integral = np.zeros(T.shape)
+    final_lower, final_width = [], []
+    atol = rtol * model.sigma**3
+    whole = panel_integrals(model, lower, width, T)
+    for level in range(max_levels):
+        half = 0.5 * width
+        left = panel_integrals(model, lower, half, T)
+        right = panel_integrals(model, lower + half, half, T)
+        halves = left + right
+        with np.errstate(invalid="ignore"):
+            error = np.abs(halves - whole)
+            converged = np.all((error <= atol + rtol * np.abs(halves)) | ~np.isfinite(halves), axis=0)
+        if level == max_levels - 1:
+            converged[:] = True
+        integral += halves[:, converged].sum(axis=1)
+        final_lower += [lower[converged], lower[converged] + half[converged]]
+        final_width += [half[converged], half[converged]]
+
+        refine = ~converged
+        if not refine.any():
+            break
+        # Each unconverged panel is replaced by its two halves, whose
+        # integrals are already known
+        lower = np.concatenate([lower[refine], lower[refine] + half[refine]])
+        width = np.concatenate([half[refine], half[refine]])
+        whole = np.concatenate([left[:, refine], right[:, refine]], axis=1)
+
+    return integral, np.concatenate(final_lower), np.concatenate(final_width)
+
+def integration_setup(model, r_max):
+    """Breakpoints, core radius and (possibly shifted) model for the B2 quadrature"""
+    r_max = 10.0 * model.sigma if r_max is None else r_max
+    edges = sorted(point for point in model.discontinuities() if 0 < point < r_max)
+
+    # Infinite core below the first discontinuity, or a tiny excluded sphere
+    # standing in for the r → 0 singularity of soft models
+    r_min, core = 1e-3 * model.sigma, None
+    if edges and not np.isfinite(model.calculate(np.array([np.nextafter(edges[0], 0.0)]))[0]):
+        r_min = core = edges.pop(0)
+
+    V_inf = float(model.calculate(np.array([r_max]))[0])
+    if abs(V_inf) > 1e-3 * abs(model.epsilon_over_kB):
+        model = ShiftedPotential(model, V_inf, r_max)
+
+    return np.array([r_min] + edges + [r_max]), core, model
+
+def second_virial(model, temperatures, r_max=None, rtol=1e-8, max_levels=30):
+    """Second virial coefficient B2(T) = -2π∫(e^{-V(r)/T} - 1) r² dr in Å³ per molecule.
+
+    ``temperatures`` (K) is evaluated in one broadcast (T × r) quadrature
+    (see adaptive_panels), whose halving concentrates the nodes around sigma
+    and the well. Discontinuities are panel edges, and an infinite core below
+    the first one contributes its excluded volume exactly. Beyond ``r_max``
+    (default 10σ) the high-temperature tail (2π/T)∫V r² dr is added for
+    models providing ``tail_energy``.
+
+    The energy zero is taken at large separation; a model that tends to a
+    nonzero constant there (the Morse form here tends to ε) is measured
+    relative to V(r_max). Potentials falling to -∞ at the origin
+    (Buckingham) have no finite B2 and give -inf.
+
+    HardSphere and SquareWell use their closed forms.
+    """
+    temperatures = np.asarray(temperatures, dtype=float)
+    scalar = temperatures.ndim == 0
+    T = np.atleast_1d(temperatures)
+
+    if type(model) is HardSphere:
+        B2 = np.full(T.shape, hard_sphere_b2(model.sigma))
+        return B2[0] if scalar else B2
+    if type(model) is SquareWell:
+        depth = model.epsilon_over_kB * model.well_depth
+        B2 = hard_sphere_b2(model.sigma) * (1 - (model.well_width**3 - 1) * np.expm1(depth / T))
+        return B2[0] if scalar else B2
+
+    breakpoints, _, integrand_model = integration_setup(model, r_max)
+    integral, _, _ = adaptive_panels(integrand_model, breakpoints, T, rtol, max_levels)
+    B2 = hard_sphere_b2(breakpoints[0]) - 2 * np.pi * integral
+
+    if hasattr(model, "tail_energy") and not isinstance(model, TruncatedPotential):
+        # tail_energy at unit density is 2π∫V r² dr beyond r_max
+        B2 += model.tail_energy(breakpoints[-1], 1.0) / T
+
+    return B2[0] if scalar else B2
+
+def second_virial_jacobian(model, temperatures, r_max=None, rtol=1e-8, max_levels=30):
+    """B2(T) and its derivatives with respect to ``model.parameter_names``.
+
+    Returns (B2, J) with J of shape (parameters, T). From the analytic
+    ``parameter_jacobian``, dB2/dp = (2π/T)∫e^{-V/T}·(dV/dp)·r² dr is
+    integrated on the panels of the B2 quadrature. A hard core at sigma adds
+    the boundary term 2πσ²·e^{-V(σ⁺)/T} to dB2/dsigma, and the tail beyond
+    ``r_max`` is integrated on x = r_max/r.
+    """
+    T = np.atleast_1d(np.asarray(temperatures, dtype=float))
+    names = model.parameter_names
+
+    if type(model) is HardSphere:
+        return (np.full(T.shape, hard_sphere_b2(model.sigma)),
+                np.full((1, len(T)), 2 * np.pi * model.sigma**2))
+    if type(model) is SquareWell:
+        B2 = second_virial(model, T)
+        depth = model.epsilon_over_kB * model.well_depth
+        dB2_deps = (-hard_sphere_b2(model.sigma) * (model.well_width**3 - 1) *
+                    np.exp(depth / T) * model.well_depth / T)
+        # B2 scales as sigma³ at fixed epsilon
+        return B2, np.array([dB2_deps, 3 * B2 / model.sigma])
+
+    breakpoints, core, integrand_model = integration_setup(model, r_max)
+    integral, lower, width = adaptive_panels(integrand_model, breakpoints, T, rtol, max_levels)
+    B2 = hard_sphere_b2(breakpoints[0]) - 2 * np.pi * integral
+
+    r = (lower[:, None] + width[:, None] * GAUSS_NODES[None, :]).ravel()
+    weights = (width[:, None] * GAUSS_WEIGHTS[None, :]).ravel()
+    with np.errstate(over="ignore", invalid="ignore"):
+        V = np.asarray(integrand_model.calculate(r), dtype=float)
+        boltzmann = np.exp(-V[None, :] / T[:, None])
+    dV = np.array(integrand_model.parameter_jacobian(r), dtype=float)
+    J = 2 * np.pi / T[None, :] * np.einsum("tr,pr,r->pt", boltzmann, dV, weights * r * r)
+
+    if core is not None and "sigma" in names:
+        V_core = float(integrand_model.calculate(np.array([core]))[0])
+        J[names.index("sigma")] += 2 * np.pi * core**2 * np.exp(-V_core / T) * core / model.sigma
+
+    if hasattr(model, "tail_energy") and not isinstance(model, TruncatedPotential):
+        r_max = breakpoints[-1]
+        B2 += model.tail_energy(r_max, 1.0) / T
+        # (2π/T)∫dV/dp r² dr beyond r_max, mapped onto x = r_max/r in (0, 1]
+        x_lower = np.arange(4) / 4
+        x = (x_lower[:, None] + 0.25 * GAUSS_NODES[None, :]).ravel()
+        x_weights = np.tile(0.25 * GAUSS_WEIGHTS, 4)
+        dV_tail = np.array(model.parameter_jacobian(r_max / x), dtype=float)
+        J += 2 * np.pi / T[None, :] * (dV_tail @ (x_weights * r_max**3 / x**4))[:, None]
+
+    return B2, J
+
+class ShiftedPotential:
+    """Model measured relative to its value at ``r_ref``, used for B2 only"""
+    def __init__(self, model, offset, r_ref):
+        self.model = model
+        self.offset = offset
+        self.r_ref = r_ref
+        self.sigma = model.sigma
+        self.epsilon_over_kB = model.epsilon_over_kB
+        self.parameter_names = model.parameter_names
+
+    def calculate(self, r):
+        return self.model.calculate(r) - self.offset
+
+    def parameter_jacobian(self, r):
+        reference = np.array([self.r_ref])
+        return tuple(dV - dV_ref[0] for dV, dV_ref in zip(
+            self.model.parameter_jacobian(r), self.model.parameter_jacobian(reference)))
@@ -0,0 +1,56 @@
+"""Radial distribution function g(r) of a trajectory, streamed frame by frame.
+
+    python rdf.py run.lammpstrj --r-max 12 --bins 240 --step 10 --workers 4 \
+        --output gr.txt
+
+XYZ (with an extended-XYZ Lattice, or ``--box``) and LAMMPS text dumps are
+read, gzipped or not, as are binary .pvtraj files (see convert.py), which
+skip the text parsing. The output has two columns: r (Å) and g(r).
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from engine.rdf import compute_rdf
+from engine.trajectory import TRAJECTORY_FORMATS
+
+def print_progress(frames, start_time):
+    elapsed = time.perf_counter() - start_time
+    rate = frames / elapsed if elapsed > 0 else 0.0
+    print(f"\r{frames} frames ({rate:.1f} frames/s)", end="", file=sys.stderr, flush=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trajectory")
+    parser.add_argument("--format", choices=TRAJECTORY_FORMATS,
+                        help="file format (default: from the extension)")
+    parser.add_argument("--box", type=float, nargs=3, metavar=("LX", "LY", "LZ"),
+                        help="box lengths (Å) for XYZ files without a Lattice")
+    parser.add_argument("--r-max", type=float, default=10.0, help="largest distance (Å)")
+    parser.add_argument("--bins", type=int, default=200)
+    parser.add_argument("--start", type=int, default=0, help="first frame")
+    parser.add_argument("--stop", type=int, help="frame to stop before")
+    parser.add_argument("--step", type=int, default=1, help="use every n-th frame")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes (0 for all cores)")
+    parser.add_argument("--output", default="rdf.txt")
+    args = parser.parse_args(argv)
+
+    start_time = time.perf_counter()
+    try:
+        result = compute_rdf(args.trajectory, args.r_max, args.bins, args.format, args.box,
+                             args.start, args.stop, args.step, max_workers=args.workers,
+                             progress=lambda frames: print_progress(frames, start_time))
+    except (OSError, ValueError) as error:
+        parser.exit(1, f"error: {error}\n")
+    print(file=sys.stderr)
+
+    np.savetxt(args.output, np.column_stack([result.r, result.g()]), fmt="%.6g",
+               header=f"r (Å)  g(r), {result.n_frames} frames of {args.trajectory}")
+    print(f"g(r) from {result.n_frames} frames written to {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
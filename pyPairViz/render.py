@@ -0,0 +1,172 @@
+"""Render styled potential plots without Tk or a display.
+
+    python -m pyPairViz.render jobs.json [--output-dir figures] [--workers 4]
+
+The job file is a JSON (or, with PyYAML installed, YAML) list of jobs, or an
+object with ``jobs`` and shared ``defaults``. Each job names a model and
+optionally its parameters:
+
+    {"model": "Mie", "epsilon_over_kB": 150, "sigma": 3.6,
+     "params": {"n": 14, "m": 7},
+     "truncation": {"mode": "switch", "r_cut": 8.5, "r_switch": 7.5},
+     "virial": {"T_min": 30, "T_max": 3000},
+     "distance": 4.0,
+     "output": "mie_14_7.png"}
+
+Plots use the same colors, equation box and axis limits as the GUI. Each
+worker process draws every job it receives into one reused Figure. A job
+that fails is reported by its index and does not stop the others.
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Modules of this package import each other as top-level modules (as when
+# running main.py from this directory), so make them importable under -m
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from gui.plot_renderer import PlotRenderer, apply_style
+from models.registry import get_model_class
+from models.truncation import TruncatedPotential
+from models.virial import second_virial
+
+# Per-process renderer, created once by init_worker and reused for every job
+renderer = None
+
+def init_worker(figsize, dpi):
+    global renderer
+    apply_style()
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    renderer = PlotRenderer(fig)
+
+def load_jobs(path):
+    """Read the job list, merging each job over the file's ``defaults``"""
+    with open(path) as f:
+        if path.endswith((".yml", ".yaml")):
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("YAML job files need PyYAML; use JSON instead")
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+
+    if isinstance(spec, dict):
+        defaults, jobs = spec.get("defaults", {}), spec.get("jobs", [])
+    else:
+        defaults, jobs = {}, spec
+    return [{**defaults, **job} for job in jobs]
+
+def build_model(job):
+    """Model of ``job``; ``params`` may set schema parameters or other model attributes"""
+    model = get_model_class(job["model"])(
+        epsilon_over_kB=float(job.get("epsilon_over_kB", 120.0)),
+        sigma=float(job.get("sigma", 3.4))
+    )
+    params = dict(job.get("params", {}))
+    schema = {parameter.name for parameter in model.parameters}
+    model.set_parameters(**{key: params.pop(key) for key in list(params) if key in schema})
+    for key, value in params.items():
+        if not hasattr(model, key):
+            raise ValueError(f"{model.name} has no parameter {key!r}")
+        setattr(model, key, value)
+    return model
+
+def default_output(index, job):
+    name = job["model"].lower().replace(" ", "_").replace("-", "_")
+    return f"{index:04d}_{name}.{job.get('format', 'png')}"
+
+def render_job(index, job, output_dir):
+    """Draw one job into the worker's Figure and save it; return the path"""
+    model = build_model(job)
+    r = np.linspace(0.5 * model.sigma, 10.0, 1000)
+    V = model.calculate(r)
+
+    truncated = None
+    if "truncation" in job:
+        truncation = job["truncation"]
+        truncated_model = TruncatedPotential(model, truncation["r_cut"],
+                                             truncation.get("mode", "shift"),
+                                             truncation.get("r_switch"))
+        truncated = (r, truncated_model.calculate(r), truncation["r_cut"])
+
+    virial = job.get("virial")
+    renderer.set_virial_panel(virial is not None)
+    if virial is not None:
+        T = np.geomspace(virial.get("T_min", 30.0), virial.get("T_max", 3000.0),
+                         virial.get("num_points", 200))
+        renderer.plot_virial(model, T, second_virial(model, T))
+
+    renderer.draw_potential(model, r, V, model.equation, truncated)
+    if "distance" in job:
+        distance = float(job["distance"])
+        current_V = model.calculate(np.array([distance]))[0]
+        if np.isfinite(current_V):
+            renderer.ax.plot([distance], [current_V], 'o', color='#e74c3c', markersize=8,
+                             markeredgecolor='white', markeredgewidth=1.5)
+
+    path = os.path.join(output_dir, job.get("output") or default_output(index, job))
+    renderer.fig.savefig(path, bbox_inches="tight")
+    return path
+
+def try_render_job(index, job, output_dir):
+    """render_job that returns (index, path, None), or (index, None, error message)"""
+    try:
+        return index, render_job(index, job, output_dir), None
+    except Exception as error:
+        return index, None, f"{type(error).__name__}: {error}"
+
+def render_all(jobs, output_dir, workers=None, figsize=(6, 4), dpi=100):
+    """Render ``jobs`` across ``workers`` processes (in-process when 1).
+
+    Yields (index, path, error) per job in order; ``path`` is None and
+    ``error`` describes the failure when a job could not be rendered.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    indices = range(len(jobs))
+    if workers == 1:
+        init_worker(figsize, dpi)
+        for index, job in zip(indices, jobs):
+            yield try_render_job(index, job, output_dir)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(figsize, dpi)) as executor:
+        chunksize = max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))
+        yield from executor.map(try_render_job, indices, jobs, [output_dir] * len(jobs),
+                                chunksize=chunksize)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render potential plots headlessly")
+    parser.add_argument("jobs", help="JSON (or YAML) job file")
+    parser.add_argument("--output-dir", default="figures")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--size", type=float, nargs=2, default=(6, 4), metavar=("W", "H"),
+                        help="figure size in inches")
+    args = parser.parse_args(argv)
+
+    jobs = load_jobs(args.jobs)
+    failed = 0
+    for count, (index, path, error) in enumerate(
+            render_all(jobs, args.output_dir, args.workers, tuple(args.size), args.dpi), start=1):
+        if error is not None:
+            failed += 1
+            print(f"[{count}/{len(jobs)}] job {index} failed: {error}", file=sys.stderr)
+        else:
+            print(f"[{count}/{len(jobs)}] {path}", file=sys.stderr)
+    if failed:
+        print(f"{failed} of {len(jobs)} jobs failed", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Parameter sweep over a pair potential, evaluated across worker processes.
+
+    python sweep.py --model Mie --param n=8:20:13 --param m=5,6,7 \
+        --param sigma=3.0:4.0:11 --quantity r_min well_depth b2 --temperature 150 \
+        --output mie_sweep.npz
+
+Axes are ``name=start:stop:num`` (inclusive linspace) or ``name=v1,v2,...``.
+The .npz output holds one array per scalar quantity shaped like the grid,
+``curves`` for sampled V(r), the axis values and the ``completed`` mask.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from models.registry import model_classes
+from engine.sweep import QUANTITIES, ParameterGrid, run_sweep
+
+def parse_axis(text):
+    name, _, spec = text.partition("=")
+    if not spec:
+        raise argparse.ArgumentTypeError(f"expected name=values, got {text!r}")
+    try:
+        if ":" in spec:
+            start, stop, num = spec.split(":")
+            values = np.linspace(float(start), float(stop), int(num))
+        else:
+            values = np.array([float(value) for value in spec.split(",")])
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"cannot parse values of {text!r}")
+    return name.strip(), values
+
+def print_progress(done, total, start_time):
+    elapsed = time.perf_counter() - start_time
+    rate = done / elapsed if elapsed > 0 else 0.0
+    print(f"\r{done}/{total} points ({100 * done / total:.1f}%, {rate:.0f} points/s)",
+          end="", file=sys.stderr, flush=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    models = model_classes()
+    parser.add_argument("--model", choices=sorted(models), default="Lennard-Jones")
+    parser.add_argument("--param", type=parse_axis, action="append", required=True,
+                        help="grid axis, name=start:stop:num or name=v1,v2,...")
+    parser.add_argument("--quantity", nargs="+", choices=QUANTITIES,
+                        default=["r_min", "well_depth"])
+    parser.add_argument("--temperature", type=float, help="temperature (K) for b2")
+    parser.add_argument("--curve", type=parse_axis, metavar="r=start:stop:num",
+                        help="distances (Å) at which to sample V(r) for the curve quantity")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int)
+    parser.add_argument("--output", default="sweep.npz")
+    args = parser.parse_args(argv)
+
+    try:
+        grid = ParameterGrid(models[args.model], dict(args.param))
+    except ValueError as error:
+        parser.error(str(error))
+    curve_r = args.curve[1] if args.curve else None
+    print(f"{args.model}: {grid.size} points over {', '.join(grid.names)}", file=sys.stderr)
+
+    start_time = time.perf_counter()
+    try:
+        result = run_sweep(grid, args.quantity, args.temperature, curve_r,
+                           chunk_size=args.chunk_size, max_workers=args.workers,
+                           progress=lambda done, total: print_progress(done, total, start_time))
+    except ValueError as error:
+        parser.error(str(error))
+    print(file=sys.stderr)
+
+    arrays = {name: values for name, values in zip(grid.names, grid.axes)}
+    for quantity in args.quantity:
+        if quantity == "curve":
+            arrays["curves"] = result.curves()
+            arrays["curve_r"] = curve_r
+        else:
+            arrays[quantity] = result.column(quantity)
+    arrays["completed"] = result.completed.reshape(grid.shape)
+    np.savez(args.output, **arrays)
+
+    status = "cancelled" if result.cancelled else "done"
+    print(f"{status}: {int(result.completed.sum())}/{grid.size} points written to {args.output}",
+          file=sys.stderr)
+    return 1 if result.cancelled else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from numbers import Number
+
+import numpy as np
+
+from models.potential_models import PotentialModel
+from models.virial import second_virial
+
+class CurveCache:
+    """Bounded LRU cache of (r, V) and (T, B2) curves keyed by model class and parameters"""
+
+    def __init__(self, max_size=32):
+        self.max_size = max_size
+        self.curves = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def snapshot(self, model):
+        """Hashable snapshot of a model's numeric and string parameters,
+        including those of any wrapped model.
+
+        Schema parameters (``model.parameters``) and numeric class-level
+        constants such as ``SquareWell.well_width`` are read with ``getattr``,
+        so they are part of the key whether or not the instance has assigned
+        them; instance attributes add the settings of wrappers.
+        """
+        values = {}
+        for cls in reversed(type(model).__mro__):
+            values.update((name, value) for name, value in vars(cls).items()
+                          if not name.startswith('_') and isinstance(value, Number))
+        values.update((parameter.name, getattr(model, parameter.name))
+                      for parameter in model.parameters)
+        values.update(vars(model))
+        params = []
+        for name, value in sorted(values.items()):
+            if isinstance(value, (Number, str)):
+                params.append((name, value))
+            elif isinstance(value, PotentialModel):
+                params.append((name, type(value), self.snapshot(value)))
+        return tuple(params)
+
+    def make_key(self, model, r_min, r_max, num_points):
+        """Build a hashable key from the model class and its parameters"""
+        return (type(model), self.snapshot(model), r_min, r_max, num_points)
+
+    def get_curve(self, model, r_min, r_max, num_points=1000):
+        """Return cached (r, V) arrays, evaluating the model on a miss"""
+        key = self.make_key(model, r_min, r_max, num_points)
+        if key in self.curves:
+            self.hits += 1
+            self.curves.move_to_end(key)
+            return self.curves[key]
+
+        self.misses += 1
+        r = np.linspace(r_min, r_max, num_points)
+        V = model.calculate(r)
+        # Cached arrays are shared between callers, so guard against mutation
+        r.flags.writeable = False
+        V.flags.writeable = False
+
+        self.curves[key] = (r, V)
+        while len(self.curves) > self.max_size:
+            self.curves.popitem(last=False)
+        return r, V
+
+    def get_virial_curve(self, model, T_min, T_max, num_points=200):
+        """Return cached (T, B2) arrays on a geometric temperature grid"""
+        key = ('B2',) + self.make_key(model, T_min, T_max, num_points)
+        if key in self.curves:
+            self.hits += 1
+            self.curves.move_to_end(key)
+            return self.curves[key]
+
+        self.misses += 1
+        T = np.geomspace(T_min, T_max, num_points)
+        B2 = second_virial(model, T)
+        T.flags.writeable = False
+        B2.flags.writeable = False
+
+        self.curves[key] = (T, B2)
+        while len(self.curves) > self.max_size:
+            self.curves.popitem(last=False)
+        return T, B2
+
+    def clear(self):
+        """Drop all cached curves and reset the counters"""
+        self.curves.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Return cache hit/miss counters and current size"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.curves),
+            'max_size': self.max_size
+        }
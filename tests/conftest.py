@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules import each other relative to pyPairViz, as when running main.py
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'pyPairViz'))
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from engine.binary_trajectory import (BinaryTrajectory, TrajectoryWriter, binary_to_xyz,
+                                      xyz_to_binary)
+from engine.trajectory import read_xyz
+
+BOX = np.array([10.0, 11.0, 12.0])
+SPECIES = ["Ar"] * 4 + ["Kr"] * 4
+
+def frames(n_frames, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.uniform(0, BOX, size=(len(SPECIES), 3)) for _ in range(n_frames)]
+
+def write(path, positions, first_step=0, **kwargs):
+    with TrajectoryWriter(path, len(SPECIES), species=SPECIES, **kwargs) as writer:
+        for step, frame in enumerate(positions, first_step):
+            writer.write(frame, BOX, energy=-10.0 * step, step=step)
+
+@pytest.mark.parametrize("precision", ["float32", "float64"])
+def test_round_trip(tmp_path, precision):
+    path = str(tmp_path / "run.pvtraj")
+    positions = frames(5)
+    write(path, positions, precision=precision)
+
+    trajectory = BinaryTrajectory(path)
+    assert len(trajectory) == 5
+    assert list(trajectory.species) == SPECIES
+    tolerance = 1e-6 if precision == "float32" else 0
+    np.testing.assert_allclose(trajectory.positions, positions, rtol=tolerance)
+    np.testing.assert_array_equal(trajectory.boxes, np.tile(BOX, (5, 1)))
+    np.testing.assert_array_equal(trajectory.steps, np.arange(5))
+    frame = trajectory[3]
+    assert frame.step == 3 and frame.energy == -30.0
+    assert [f.step for f in trajectory.frames(1, None, 2)] == [1, 3]
+
+def test_unknown_energy_and_step(tmp_path):
+    path = str(tmp_path / "run.pvtraj")
+    with TrajectoryWriter(path, len(SPECIES)) as writer:
+        writer.write(frames(1)[0], BOX)
+    frame = BinaryTrajectory(path)[0]
+    assert frame.energy is None and frame.step is None and frame.species is None
+
+def test_append(tmp_path):
+    path = str(tmp_path / "run.pvtraj")
+    positions = frames(5)
+    write(path, positions[:3])
+    write(path, positions[3:], first_step=3, append=True)
+
+    trajectory = BinaryTrajectory(path)
+    np.testing.assert_array_equal(trajectory.steps, np.arange(5))
+    np.testing.assert_allclose(trajectory.positions, positions, rtol=1e-6)
+
+def test_append_checks_the_layout(tmp_path):
+    path = str(tmp_path / "run.pvtraj")
+    write(path, frames(1))
+    with pytest.raises(ValueError):
+        TrajectoryWriter(path, len(SPECIES), precision="float64", append=True)
+
+def test_partial_last_frame_is_dropped(tmp_path):
+    path = str(tmp_path / "run.pvtraj")
+    positions = frames(4)
+    write(path, positions[:3])
+    # A crash part-way through writing the fourth frame
+    with open(path, "ab") as f:
+        f.write(b"\0" * 40)
+    assert len(BinaryTrajectory(path)) == 3
+
+    write(path, positions[3:], first_step=3, append=True)
+    trajectory = BinaryTrajectory(path)
+    np.testing.assert_array_equal(trajectory.steps, np.arange(4))
+    np.testing.assert_allclose(trajectory.positions, positions, rtol=1e-6)
+
+def test_xyz_conversion_round_trip(tmp_path):
+    path = str(tmp_path / "run.pvtraj")
+    xyz_path = str(tmp_path / "run.xyz")
+    positions = frames(3)
+    write(path, positions, precision="float64")
+
+    assert binary_to_xyz(path, xyz_path) == 3
+    read_back = list(read_xyz(xyz_path))
+    assert [frame.step for frame in read_back] == [0, 1, 2]
+    np.testing.assert_allclose(read_back[2].positions, positions[2], atol=1e-8)
+
+    copy_path = str(tmp_path / "copy.pvtraj")
+    assert xyz_to_binary(xyz_path, copy_path, precision="float64") == 3
+    np.testing.assert_allclose(BinaryTrajectory(copy_path).positions, positions, atol=1e-8)
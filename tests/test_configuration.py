@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from engine.configuration import compute_configuration
+from models.potential_models import LennardJones, MorsePotential
+from models.truncation import TruncatedPotential
+
+BOX = np.array([15.0, 17.0, 19.0])
+
+@pytest.fixture
+def positions():
+    """80 particles at least 2.8 Å apart, so energies stay moderate"""
+    rng = np.random.default_rng(0)
+    points = []
+    while len(points) < 80:
+        x = rng.uniform(0, BOX)
+        d = np.array(points) - x if points else np.zeros((0, 3))
+        d -= BOX * np.round(d / BOX)
+        if np.all(np.einsum("ij,ij->i", d, d) > 2.8**2):
+            points.append(x)
+    return np.array(points)
+
+def brute_force(model, positions, r_cut=np.inf):
+    """Energy, per-particle energy, forces and virial from a double loop"""
+    n = len(positions)
+    energy = 0.0
+    per_particle = np.zeros(n)
+    forces = np.zeros((n, 3))
+    virial = np.zeros((3, 3))
+    for i in range(n):
+        for j in range(i + 1, n):
+            d = positions[j] - positions[i]
+            d -= BOX * np.round(d / BOX)
+            r = np.linalg.norm(d)
+            if r >= r_cut:
+                continue
+            V, F = model.energy_and_force(r)
+            energy += V
+            per_particle[[i, j]] += V / 2
+            f = F * d / r
+            forces[j] += f
+            forces[i] -= f
+            virial += np.outer(d, f)
+    return energy, per_particle, forces, virial
+
+def assert_matches(result, expected):
+    energy, per_particle, forces, virial = expected
+    scale = np.abs(forces).max()
+    assert result.energy == pytest.approx(energy, rel=1e-10)
+    np.testing.assert_allclose(result.per_particle_energy, per_particle, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(result.forces, forces, rtol=1e-9, atol=1e-10 * scale)
+    np.testing.assert_allclose(result.virial, virial, rtol=1e-9, atol=1e-10 * np.abs(virial).max())
+    assert result.volume == pytest.approx(np.prod(BOX))
+
+@pytest.mark.parametrize("model", [LennardJones(), MorsePotential(a=1.3)], ids=lambda m: m.name)
+def test_blocked_all_pairs_match_brute_force(positions, model):
+    # 1000 pairs per block splits the 80 rows into many blocks
+    result = compute_configuration(model, positions, BOX, max_block_pairs=1000)
+    assert_matches(result, brute_force(model, positions))
+
+@pytest.mark.parametrize("model", [LennardJones(), MorsePotential(a=1.3)], ids=lambda m: m.name)
+def test_cell_list_matches_brute_force(positions, model):
+    result = compute_configuration(model, positions, BOX, r_cut=7.0)
+    assert_matches(result, brute_force(model, positions, r_cut=7.0))
+
+def test_cell_list_matches_blocked_all_pairs(positions):
+    # A model that is zero beyond r_cut makes every pair of the blocked
+    # path contribute exactly what the cell list sees
+    model = TruncatedPotential(LennardJones(), 7.0, "cut")
+    blocked = compute_configuration(model, positions, BOX, max_block_pairs=1000)
+    cut = compute_configuration(model.model, positions, BOX, r_cut=7.0)
+    assert blocked.energy == pytest.approx(cut.energy, rel=1e-10)
+    np.testing.assert_allclose(blocked.forces, cut.forces, rtol=1e-9,
+                               atol=1e-10 * np.abs(cut.forces).max())
+    np.testing.assert_allclose(blocked.virial, cut.virial, rtol=1e-9)
+    np.testing.assert_allclose(blocked.forces.sum(axis=0), 0.0, atol=1e-8)
+
+def test_cutoff_must_fit_the_box(positions):
+    with pytest.raises(ValueError):
+        compute_configuration(LennardJones(), positions, BOX, r_cut=8.0)
@@ -0,0 +1,28 @@
+from models.potential_models import LennardJones, SquareWell, Sutherland
+from models.truncation import TruncatedPotential
+from utils.curve_cache import CurveCache
+
+def test_key_includes_class_level_parameters():
+    cache = CurveCache()
+    default = SquareWell()
+    wide = SquareWell()
+    wide.well_width = 2.0
+    assert cache.make_key(default, 1, 10, 100) != cache.make_key(wide, 1, 10, 100)
+    assert ('well_width', 1.5) in cache.snapshot(default)
+    assert ('n', 12) in cache.snapshot(Sutherland())
+
+def test_key_tracks_in_place_parameter_changes():
+    cache = CurveCache()
+    model = LennardJones()
+    key = cache.make_key(model, 1, 10, 100)
+    assert cache.make_key(LennardJones(), 1, 10, 100) == key
+    model.set_parameters(sigma=3.0)
+    assert cache.make_key(model, 1, 10, 100) != key
+
+def test_key_includes_wrapped_model():
+    cache = CurveCache()
+    a = TruncatedPotential(LennardJones(), 8.5)
+    b = TruncatedPotential(LennardJones(sigma=3.0), 8.5)
+    c = TruncatedPotential(LennardJones(), 8.5, "cut")
+    keys = {cache.make_key(model, 1, 10, 100) for model in (a, b, c)}
+    assert len(keys) == 3
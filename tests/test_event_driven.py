@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from engine.configuration import cubic_lattice
+from engine.event_driven import EventDrivenSimulation
+from engine.neighbors import minimum_image
+from models.potential_models import HardSphere, LennardJones, SquareWell
+
+def test_square_well_conserves_energy():
+    model = SquareWell()
+    positions, box = cubic_lattice(64, 0.3 / model.sigma**3)
+    sim = EventDrivenSimulation(model, positions, box, reduced_temperature=1.5, seed=0)
+    start = sim.kinetic_energy() + sim.potential_energy()
+    sim.run(n_events=5000)
+    stats = sim.stats()
+    assert stats["well_entries"] > 0 and stats["well_exits"] > 0 and stats["core_collisions"] > 0
+    assert sim.kinetic_energy() + sim.potential_energy() == pytest.approx(start, rel=1e-12)
+
+    # The bond count behind the potential energy matches the configuration;
+    # the pair of the last event may sit exactly on the well edge
+    current = sim.current_positions()
+    i, j = np.triu_indices(len(current), k=1)
+    d = minimum_image(current[j] - current[i], box)
+    r = np.sqrt(np.einsum("ij,ij->i", d, d))
+    inside = np.count_nonzero(r < sim.well_range - 1e-9)
+    assert inside <= sim.bonded_pairs <= np.count_nonzero(r < sim.well_range + 1e-9)
+
+def test_hard_sphere_pressure_matches_carnahan_starling():
+    model = HardSphere()
+    eta = 0.1
+    density = eta * 6 / (np.pi * model.sigma**3)
+    positions, box = cubic_lattice(64, density)
+    sim = EventDrivenSimulation(model, positions, box, temperature=300.0, seed=0)
+    sim.run(n_events=10000)
+    Z = sim.pressure() / (density * sim.temperature())
+    Z_cs = (1 + eta + eta**2 - eta**3) / (1 - eta)**3
+    assert Z == pytest.approx(Z_cs, rel=0.03)
+    # Hard spheres only exchange momentum, so the temperature stays put
+    assert sim.temperature() == pytest.approx(
+        EventDrivenSimulation(model, positions, box, temperature=300.0, seed=0).temperature())
+
+def test_rejects_continuous_models_and_overlaps():
+    positions, box = cubic_lattice(27, 0.01)
+    with pytest.raises(ValueError):
+        EventDrivenSimulation(LennardJones(), positions, box)
+    positions[1] = positions[0] + [1.0, 0.0, 0.0]
+    with pytest.raises(ValueError, match="overlapping"):
+        EventDrivenSimulation(HardSphere(), positions, box)
@@ -0,0 +1,44 @@
+import numpy as np
+
+from models.fitting import ReferenceData, fit_model
+from models.potential_models import LennardJones, Sutherland, YukawaPotential
+from models.registry import Parameter
+
+R = np.linspace(3.6, 10.0, 40)
+
+def test_recovers_the_reference_parameters():
+    data = ReferenceData("potential", R, LennardJones().calculate(R))
+    result = fit_model(LennardJones(epsilon_over_kB=100.0, sigma=3.3), data)
+    assert result.converged and result.message == "converged"
+    assert np.isclose(result.parameters["epsilon_over_kB"], 120.0, rtol=1e-8)
+    assert np.isclose(result.parameters["sigma"], 3.4, rtol=1e-8)
+    assert result.rms < 1e-8
+
+def test_fit_ending_on_the_lower_bound_is_not_converged():
+    # Purely repulsive data drives the Sutherland well depth towards zero
+    data = ReferenceData("potential", R, YukawaPotential().calculate(R))
+    result = fit_model(Sutherland(epsilon_over_kB=100.0, sigma=3.3), data)
+    assert not result.converged
+    assert "epsilon_over_kB" in result.message
+    assert all(value > 0 for value in result.parameters.values())
+
+class BoundedYukawa(YukawaPotential):
+    name = "Bounded Yukawa"
+    parameters = YukawaPotential.parameters[:2] + (
+        Parameter("kappa", 0.3, "Screening length", "κ", "Å⁻¹", bounds=(0, 0.5)),
+    )
+
+def test_steps_are_clipped_to_schema_bounds():
+    data = ReferenceData("potential", R, YukawaPotential(kappa=1.0).calculate(R))
+    result = fit_model(BoundedYukawa(kappa=0.3), data)
+    assert not result.converged
+    assert "kappa" in result.message
+    assert result.parameters["kappa"] <= 0.5
+
+def test_negative_parameters_keep_their_sign():
+    reference = YukawaPotential(epsilon_over_kB=-80.0, kappa=0.6)
+    data = ReferenceData("potential", R, reference.calculate(R))
+    result = fit_model(YukawaPotential(epsilon_over_kB=-50.0, kappa=1.0), data)
+    assert result.converged
+    assert np.isclose(result.parameters["epsilon_over_kB"], -80.0, rtol=1e-8)
+    assert result.errors["epsilon_over_kB"] >= 0
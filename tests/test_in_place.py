@@ -0,0 +1,35 @@
+"""``calculate(r, out=...)`` gives the same result when ``out`` is ``r`` itself"""
+import numpy as np
+import pytest
+
+from models import kernels
+from models.potential_models import (BuckinghamPotential, LennardJones, MiePotential,
+                                     YukawaPotential)
+
+MODELS = [LennardJones(), BuckinghamPotential(), YukawaPotential(),
+          MiePotential(), MiePotential(n=13.5, m=6.2)]
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request):
+    previous = kernels.get_backend()
+    kernels.set_backend(request.param)
+    yield request.param
+    kernels.set_backend(previous)
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.name)
+@pytest.mark.parametrize("size", [10, 5000])
+def test_out_may_alias_r(model, size, backend):
+    r = np.linspace(3.0, 10.0, size)
+    expected = model.calculate(r.copy())
+    result = model.calculate(r, out=r)
+    assert result is r
+    np.testing.assert_allclose(r, expected, rtol=1e-12)
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.name)
+def test_out_separate_from_r(model):
+    r = np.linspace(3.0, 10.0, 100)
+    out = np.empty_like(r)
+    result = model.calculate(r, out=out)
+    assert result is out
+    np.testing.assert_allclose(out, [model.calculate(x) for x in r], rtol=1e-12)
+    np.testing.assert_array_equal(r, np.linspace(3.0, 10.0, 100))
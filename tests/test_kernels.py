@@ -0,0 +1,112 @@
+"""Kernel backends give the same results as the NumPy expressions of the models"""
+import importlib.util
+
+import numpy as np
+import pytest
+
+from models import kernels
+from models.potential_models import (BuckinghamPotential, LennardJones, MiePotential,
+                                     MorsePotential, YukawaPotential)
+
+MODELS = [LennardJones(), MiePotential(), MiePotential(n=13.5, m=6.2), MorsePotential(),
+          BuckinghamPotential(), YukawaPotential()]
+# Models whose calculate takes ``out``
+OUT_MODELS = [model for model in MODELS if not isinstance(model, MorsePotential)]
+
+SIZE = kernels.KERNEL_MIN_SIZE + 10
+
+@pytest.fixture(params=[
+    "python",
+    pytest.param("numba", marks=pytest.mark.skipif(importlib.util.find_spec("numba") is None,
+                                                   reason="Numba is not installed"))
+])
+def backend(request):
+    previous = kernels.get_backend()
+    kernels.set_backend(request.param)
+    yield request.param
+    kernels.set_backend(previous)
+
+def with_backend(name, function, *args, **kwargs):
+    previous = kernels.get_backend()
+    kernels.set_backend(name)
+    try:
+        return function(*args, **kwargs)
+    finally:
+        kernels.set_backend(previous)
+
+def assert_close(actual, expected):
+    actual, expected = np.asarray(actual), np.asarray(expected)
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, rtol=1e-10,
+                               atol=1e-12 * np.max(np.abs(expected)))
+
+def distances(layout):
+    """Distances of SIZE or more points in a contiguous or non-contiguous layout"""
+    r = np.linspace(3.0, 10.0, 2 * SIZE)
+    if layout == "contiguous":
+        return r[:SIZE].copy()
+    if layout == "strided":
+        return r[::2]
+    # Transposed 2-D block
+    return r[:2 * (SIZE // 2)].reshape(2, -1).T
+
+LAYOUTS = ["contiguous", "strided", "transposed"]
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.name)
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_calculate_matches_numpy(model, layout, backend):
+    r = distances(layout)
+    before = r.copy()
+    assert_close(model.calculate(r), with_backend("numpy", model.calculate, r))
+    np.testing.assert_array_equal(r, before)
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.name)
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_energy_and_force_match_numpy(model, layout, backend):
+    r = distances(layout)
+    V, F = model.energy_and_force(r)
+    expected_V, expected_F = with_backend("numpy", model.energy_and_force, r)
+    assert_close(V, expected_V)
+    assert_close(F, expected_F)
+
+@pytest.mark.parametrize("model", OUT_MODELS, ids=lambda model: model.name)
+@pytest.mark.parametrize("layout", ["contiguous", "strided"])
+def test_out_matches_numpy(model, layout, backend):
+    r = distances("contiguous")
+    out = np.full(2 * SIZE, np.nan)
+    out = out[:SIZE] if layout == "contiguous" else out[::2]
+    result = model.calculate(r, out=out)
+    assert result is out
+    assert_close(out, with_backend("numpy", model.calculate, r))
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.name)
+def test_scalar_input(model, backend):
+    V = model.calculate(4.0)
+    assert np.ndim(V) == 0
+    assert_close(V, with_backend("numpy", model.calculate, 4.0))
+    V, F = model.energy_and_force(4.0)
+    expected_V, expected_F = with_backend("numpy", model.energy_and_force, 4.0)
+    assert_close(V, expected_V)
+    assert_close(F, expected_F)
+
+def test_evaluate_runs_the_kernel(backend):
+    r = distances("strided")
+    V = kernels.evaluate("lennard_jones_energy", r, (120.0, 3.4))
+    assert V is not None and V.shape == r.shape
+    assert_close(V, with_backend("numpy", LennardJones().calculate, r))
+    assert kernels.evaluate("lennard_jones_energy", r[:10], (120.0, 3.4)) is None
+
+@pytest.mark.skipif(importlib.util.find_spec("numba") is None, reason="Numba is not installed")
+def test_auto_compiles_only_the_faster_kernels():
+    previous = kernels.get_backend()
+    kernels.set_backend("auto")
+    try:
+        assert kernels.kernel("lennard_jones_energy") is not None
+        assert kernels.kernel("mie_integer_energy_force") is not None
+        assert kernels.kernel("mie_energy") is None
+        assert kernels.kernel("yukawa_energy") is None
+        r = distances("contiguous")
+        assert_close(MiePotential(n=13.5, m=6.2).calculate(r),
+                     with_backend("numpy", MiePotential(n=13.5, m=6.2).calculate, r))
+    finally:
+        kernels.set_backend(previous)
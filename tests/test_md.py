@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from engine.configuration import compute_configuration, cubic_lattice
+from engine.md import MDSimulation
+from models.potential_models import LennardJones
+
+@pytest.mark.parametrize("r_cut", [None, 8.5])
+def test_forces_accumulate_in_place(r_cut):
+    model = LennardJones()
+    positions, box = cubic_lattice(343, 0.02)
+    positions += np.random.default_rng(0).normal(scale=0.1, size=positions.shape)
+    sim = MDSimulation(model, positions, box, r_cut=r_cut, seed=1)
+    forces, per_particle = sim.forces, sim.per_particle_energy
+    address = forces.__array_interface__["data"][0]
+
+    sim.run(5)
+    assert sim.forces is forces
+    assert sim.per_particle_energy is per_particle
+    assert sim.forces.__array_interface__["data"][0] == address
+
+    reference = compute_configuration(model, sim.positions, sim.box, r_cut=r_cut)
+    np.testing.assert_allclose(sim.potential_energy, reference.energy, rtol=1e-12)
+    np.testing.assert_allclose(sim.forces, reference.forces, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(sim.per_particle_energy, reference.per_particle_energy,
+                               rtol=1e-9, atol=1e-9)
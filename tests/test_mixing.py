@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from engine.configuration import compute_configuration, cubic_lattice
+from engine.neighbors import minimum_image
+from models.mixing import MIXING_RULES, Mixture
+from models.potential_models import LennardJones, MiePotential, MorsePotential
+
+EPSILON = np.array([120.0, 160.0, 90.0])
+SIGMA = np.array([3.4, 3.8, 3.0])
+R_CUT = 7.0
+
+MIXTURES = [
+    (LennardJones, "lorentz-berthelot", {}),
+    (LennardJones, "kong", {}),
+    (MiePotential, "geometric", {"n": 13.5, "m": 6.5}),
+    (MiePotential, "kong", {"n": 14, "m": 6}),
+    (MorsePotential, "lorentz-berthelot", {"a": 1.3}),
+]
+IDS = [f"{model_class.name}-{rule}" for model_class, rule, _ in MIXTURES]
+
+@pytest.fixture
+def system():
+    """Jittered lattice of 64 particles of three species"""
+    rng = np.random.default_rng(0)
+    positions, box = cubic_lattice(64, 0.02)
+    positions = positions + rng.normal(0, 0.2, positions.shape)
+    return positions, box, rng.integers(0, len(EPSILON), len(positions))
+
+def pair_sum(mixture, positions, box, species, r_cut):
+    """Total energy from one pair_model call per pair"""
+    energy = 0.0
+    for i in range(len(positions)):
+        for j in range(i + 1, len(positions)):
+            r = np.linalg.norm(minimum_image(positions[i] - positions[j], box))
+            if r < r_cut:
+                energy += mixture.pair_model(species[i], species[j]).calculate(r)
+    return energy
+
+@pytest.mark.parametrize("model_class, rule, params", MIXTURES, ids=IDS)
+def test_pair_energies_match_pair_models(model_class, rule, params):
+    mixture = Mixture(model_class, EPSILON, SIGMA, rule, **params)
+    rng = np.random.default_rng(1)
+    r = rng.uniform(3.0, 9.0, 300)
+    si, sj = rng.integers(0, len(EPSILON), (2, 300))
+    V, F = mixture.energy_and_force(r, si, sj)
+    expected = np.array([mixture.pair_model(a, b).energy_and_force(x)
+                         for x, a, b in zip(r, si, sj)])
+    np.testing.assert_allclose(V, expected[:, 0], rtol=1e-10)
+    np.testing.assert_allclose(F, expected[:, 1], rtol=1e-10)
+
+@pytest.mark.parametrize("model_class, rule, params", MIXTURES, ids=IDS)
+def test_configuration_energy_matches_pair_sum(system, model_class, rule, params):
+    positions, box, species = system
+    mixture = Mixture(model_class, EPSILON, SIGMA, rule, **params)
+    result = compute_configuration(mixture, positions, box, R_CUT, species=species)
+    assert result.energy == pytest.approx(pair_sum(mixture, positions, box, species, R_CUT),
+                                          rel=1e-10)
+
+@pytest.mark.parametrize("rule", MIXING_RULES)
+@pytest.mark.parametrize("n, m", [(12, 6), (14, 6), (13.5, 6.5)])
+def test_rules_keep_pure_species(rule, n, m):
+    epsilon, sigma = MIXING_RULES[rule](EPSILON, SIGMA, n=n, m=m)
+    np.testing.assert_allclose(np.diag(epsilon), EPSILON, rtol=1e-12)
+    np.testing.assert_allclose(np.diag(sigma), SIGMA, rtol=1e-12)
+    np.testing.assert_array_equal(epsilon, epsilon.T)
+    np.testing.assert_array_equal(sigma, sigma.T)
+
+def test_kong_uses_the_model_exponents():
+    mixture = Mixture(MiePotential, EPSILON, SIGMA, "kong", n=14, m=6)
+    expected = MIXING_RULES["kong"](EPSILON, SIGMA, n=14, m=6)
+    np.testing.assert_allclose(mixture.epsilon_matrix, expected[0])
+    np.testing.assert_allclose(mixture.sigma_matrix, expected[1])
+    with pytest.raises(ValueError):
+        Mixture(MorsePotential, EPSILON, SIGMA, "kong")
+
+@pytest.mark.parametrize("model_class, rule, params", MIXTURES, ids=IDS)
+def test_tabulated_mixture_matches_pair_models(model_class, rule, params):
+    mixture = Mixture(model_class, EPSILON, SIGMA, rule, **params)
+    table = mixture.tabulate(r_min=3.0, r_max=8.0)
+    rng = np.random.default_rng(2)
+    # Some pairs fall outside the tables and take the analytic models
+    r = rng.uniform(2.8, 9.0, 300)
+    si, sj = rng.integers(0, len(EPSILON), (2, 300))
+    V, F = table.energy_and_force(r, si, sj)
+    expected = np.array([mixture.pair_model(a, b).energy_and_force(x)
+                         for x, a, b in zip(r, si, sj)])
+    np.testing.assert_allclose(V, expected[:, 0], rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(F, expected[:, 1], rtol=1e-4, atol=1e-5)
+
+def test_tabulated_configuration_energy(system):
+    positions, box, species = system
+    mixture = Mixture(LennardJones, EPSILON, SIGMA)
+    table = mixture.tabulate(spacing="r2")
+    result = compute_configuration(table, positions, box, R_CUT, species=species)
+    assert result.energy == pytest.approx(pair_sum(mixture, positions, box, species, R_CUT),
+                                          rel=1e-6)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from engine.configuration import compute_configuration, cubic_lattice
+from engine.moments import PowerMoments
+from models.potential_models import LennardJones, MiePotential, MorsePotential
+
+R_CUT = 7.0
+
+@pytest.fixture
+def configuration():
+    rng = np.random.default_rng(0)
+    positions, box = cubic_lattice(125, 0.03)
+    return positions + rng.normal(0, 0.2, positions.shape), box
+
+MODELS = [LennardJones(), LennardJones(epsilon_over_kB=80.0, sigma=3.0),
+          MiePotential(n=14, m=6), MiePotential(n=13.5, m=6.5)]
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: f"{model.name}-{model.sigma}")
+def test_energy_matches_configuration(configuration, model):
+    positions, box = configuration
+    moments = PowerMoments.from_configuration(positions, box, R_CUT)
+    expected = compute_configuration(model, positions, box, R_CUT).energy
+    assert moments.energy(model) == pytest.approx(expected, rel=1e-10)
+
+def test_moments_are_reused_across_parameters(configuration):
+    moments = PowerMoments.from_configuration(*configuration, R_CUT)
+    moments.energy(LennardJones())
+    cached = dict(moments.sums)
+    moments.energy(LennardJones(epsilon_over_kB=100.0, sigma=3.6))
+    assert moments.sums.keys() == cached.keys()
+    assert all(moments.sums[k] is cached[k] for k in cached)
+
+def test_per_frame_energies():
+    rng = np.random.default_rng(1)
+    distances = [rng.uniform(3.0, 7.0, size) for size in (50, 0, 80)]
+    offsets = np.concatenate([[0], np.cumsum([len(d) for d in distances])])
+    moments = PowerMoments(np.concatenate(distances), offsets)
+    model = MiePotential(n=13.5, m=6.5)
+    expected = [model.calculate(d).sum() for d in distances]
+    np.testing.assert_allclose(moments.energies(model), expected, rtol=1e-10)
+
+def test_rejects_models_that_are_not_power_laws():
+    with pytest.raises(ValueError):
+        PowerMoments(np.array([4.0])).energies(MorsePotential())
@@ -0,0 +1,39 @@
+import numpy as np
+
+from engine.configuration import cubic_lattice
+from engine.monte_carlo import MonteCarloSimulation
+from models.potential_models import LennardJones
+
+def simulation(seed):
+    model = LennardJones()
+    positions, box = cubic_lattice(64, 0.3 / model.sigma**3)
+    return MonteCarloSimulation(model, positions, box, r_cut=1.4 * model.sigma,
+                                reduced_temperature=1.5, seed=seed)
+
+def energy_samples(batch, n_sweeps=250):
+    sim = simulation(seed=3)
+    energies = []
+    sim.run(n_sweeps, equilibration=50, batch=batch,
+            callback=lambda sim: energies.append(sim.energy))
+    return np.array(energies)
+
+def test_batch_moves_cross_cell_boundaries():
+    sim = simulation(seed=1)
+    assert np.all(sim.grid.shape == 4)
+    start = sim.grid.cell_of.copy()
+    sim.run(50, equilibration=50, batch=True)
+
+    assert np.mean(sim.grid.cell_of != start) > 0.5
+    np.testing.assert_array_equal(
+        sim.grid.cell_of, np.ravel_multi_index(sim.grid.coords_at(sim.positions).T, sim.grid.shape))
+    for cell, members in enumerate(sim.grid.cells):
+        assert all(sim.grid.cell_of[particle] == cell for particle in members)
+    np.testing.assert_allclose(sim.energy, sim.recompute_energy(), rtol=1e-9)
+
+def test_batch_energy_matches_serial():
+    serial = energy_samples(batch=False)
+    batch = energy_samples(batch=True)
+    # Standard errors from 10 block averages, to allow for correlated sweeps
+    error = np.hypot(*(samples.reshape(10, -1).mean(axis=1).std() / 3 for samples in (serial, batch)))
+    assert abs(serial.mean() - batch.mean()) < 4 * error
+    assert error < 0.05 * abs(serial.mean())
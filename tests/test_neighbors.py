@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from engine.neighbors import VerletList, find_pairs, minimum_image
+
+def brute_force_pairs(positions, box, r_cut):
+    i, j = np.triu_indices(len(positions), k=1)
+    d = minimum_image(positions[j] - positions[i], box)
+    close = np.einsum("ij,ij->i", d, d) < r_cut * r_cut
+    return set(zip(i[close].tolist(), j[close].tolist()))
+
+def random_positions(box, n=300, seed=0):
+    return np.random.default_rng(seed).uniform(0, box, size=(n, 3))
+
+# Non-cubic boxes, including an axis with only two cells
+@pytest.mark.parametrize("box", [[12.0, 20.0, 31.0], [7.5, 16.0, 10.0]])
+@pytest.mark.parametrize("r_cut", [2.5, 3.7])
+def test_find_pairs_matches_brute_force(box, r_cut):
+    box = np.array(box)
+    positions = random_positions(box)
+    i, j = find_pairs(positions, box, r_cut)
+    pairs = list(zip(i.tolist(), j.tolist()))
+    assert np.all(i < j)
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == brute_force_pairs(positions, box, r_cut)
+
+def test_find_pairs_wraps_positions_outside_the_box():
+    box = np.array([12.0, 20.0, 31.0])
+    positions = random_positions(box)
+    shifted = positions + box * np.random.default_rng(1).integers(-2, 3, positions.shape)
+    i, j = find_pairs(shifted, box, 3.0)
+    assert set(zip(i.tolist(), j.tolist())) == brute_force_pairs(positions, box, 3.0)
+
+def test_verlet_list_rebuilds_after_half_the_skin():
+    box = np.array([12.0, 14.0, 16.0])
+    positions = random_positions(box)
+    neighbor_list = VerletList(r_cut=3.0, skin=0.6)
+    assert neighbor_list.update(positions, box)
+    assert neighbor_list.build_count == 1
+
+    moved = positions.copy()
+    moved[5] += [0.29, 0.0, 0.0]
+    assert not neighbor_list.update(moved)
+    assert neighbor_list.build_count == 1
+    # The list built with the skin still holds every pair inside r_cut
+    i, j = neighbor_list.pairs()
+    listed = set(zip(i.tolist(), j.tolist()))
+    assert brute_force_pairs(moved, box, 3.0) <= listed
+
+    moved[7] += [0.0, -0.2, 0.25]
+    assert neighbor_list.update(moved)
+    assert neighbor_list.build_count == 2
+    i, j = neighbor_list.pairs()
+    assert set(zip(i.tolist(), j.tolist())) == brute_force_pairs(moved, box, 3.6)
+
+def test_verlet_list_rebuilds_for_a_new_box():
+    box = np.array([12.0, 14.0, 16.0])
+    positions = random_positions(box)
+    neighbor_list = VerletList(r_cut=3.0, skin=0.6)
+    neighbor_list.update(positions, box)
+    assert neighbor_list.update(positions * 1.01, box * 1.01)
+    assert neighbor_list.build_count == 2
@@ -0,0 +1,77 @@
+"""F = -dV/dr and d²V/dr² of every model against central differences of V"""
+import numpy as np
+import pytest
+
+from models.potential_models import MiePotential, MorsePotential
+from models.registry import model_classes
+
+MODELS = [cls() for cls in model_classes().values()] + [
+    MiePotential(n=13.5, m=6.2),
+    MorsePotential(a=2.0),
+]
+
+def first_difference(f, r, h):
+    """Central difference of f at r, Richardson-extrapolated to O(h⁴)"""
+    with np.errstate(invalid="ignore"):
+        coarse = (f(r + h) - f(r - h)) / (2 * h)
+        fine = (f(r + h/2) - f(r - h/2)) / h
+    return (4 * fine - coarse) / 3
+
+def second_difference(f, r, h):
+    """Second central difference of f at r, Richardson-extrapolated to O(h⁴)"""
+    with np.errstate(invalid="ignore"):
+        coarse = (f(r + h) - 2 * f(r) + f(r - h)) / h**2
+        fine = (f(r + h/2) - 2 * f(r) + f(r - h/2)) / (h/2)**2
+    return (4 * fine - coarse) / 3
+
+def sample_points(model):
+    """Smooth-region points, plus points on both sides of every discontinuity"""
+    r = list(np.linspace(0.85, 3.0, 40) * model.sigma)
+    for point in model.discontinuities():
+        r += [point * (1 - offset) for offset in (0.02, 0.005)]
+        r += [point * (1 + offset) for offset in (0.005, 0.02)]
+    r = np.array(r)
+    # Keep the stencils clear of the jumps
+    h = 1e-3 * r
+    clear = np.ones(len(r), dtype=bool)
+    for point in model.discontinuities():
+        clear &= np.abs(r - point) > 1.5 * h
+    return r[clear], h[clear]
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.name)
+def test_force_matches_finite_difference(model):
+    r, h = sample_points(model)
+    V_plus, V_minus = model.calculate(r + h), model.calculate(r - h)
+    finite = np.isfinite(V_plus) & np.isfinite(V_minus)
+    assert finite.any()
+
+    V, F = model.energy_and_force(r)
+    np.testing.assert_allclose(V, model.calculate(r))
+    expected = -first_difference(model.calculate, r, h)
+    scale = model.epsilon_over_kB / model.sigma
+    np.testing.assert_allclose(F[finite], expected[finite], rtol=1e-6, atol=1e-7 * scale)
+    # Inside a hard core the force is reported as zero
+    assert np.all(F[~finite] == 0)
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.name)
+def test_second_derivative_matches_finite_difference(model):
+    r, h = sample_points(model)
+    V_plus, V_minus = model.calculate(r + h), model.calculate(r - h)
+    finite = np.isfinite(model.calculate(r)) & np.isfinite(V_plus) & np.isfinite(V_minus)
+
+    curvature = model.second_derivative(r)
+    scale = model.epsilon_over_kB / model.sigma**2
+    from_energy = second_difference(model.calculate, r, h)
+    np.testing.assert_allclose(curvature[finite], from_energy[finite],
+                               rtol=1e-5, atol=1e-6 * scale)
+
+    from_force = -first_difference(model.force, r, h)
+    np.testing.assert_allclose(curvature[finite], from_force[finite],
+                               rtol=1e-6, atol=1e-7 * scale)
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.name)
+def test_discontinuities_are_jumps(model):
+    """V differs on the two sides of every reported discontinuity"""
+    for point in model.discontinuities():
+        left, right = model.calculate(np.array([point * (1 - 1e-9), point * (1 + 1e-9)]))
+        assert left != right
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from engine import rdf
+from engine.rdf import compute_rdf
+
+BOX = np.full(3, 12.0)
+
+@pytest.fixture
+def trajectory(tmp_path):
+    """Extended XYZ file of 11 random frames of 60 particles"""
+    rng = np.random.default_rng(0)
+    lattice = " ".join(f"{value:g}" for value in np.diag(BOX).ravel())
+    path = tmp_path / "frames.xyz"
+    with open(path, "w") as f:
+        for _ in range(11):
+            f.write(f"60\nLattice=\"{lattice}\"\n")
+            for x, y, z in rng.uniform(0, BOX, size=(60, 3)):
+                f.write(f"Ar {x:.8f} {y:.8f} {z:.8f}\n")
+    return str(path)
+
+def test_workers_match_serial(trajectory, monkeypatch):
+    serial = compute_rdf(trajectory, 5.0, 50, step=2)
+
+    reads = []
+    read_trajectory = rdf.read_trajectory
+    def counted(*args):
+        reads.append(args)
+        return read_trajectory(*args)
+    monkeypatch.setattr(rdf, "read_trajectory", counted)
+    frames = []
+    parallel = compute_rdf(trajectory, 5.0, 50, step=2, max_workers=2, batch_size=2,
+                           progress=frames.append)
+
+    assert len(reads) == 1
+    assert parallel.n_frames == serial.n_frames == 6
+    assert frames[-1] == 6
+    np.testing.assert_array_equal(parallel.counts, serial.counts)
+    np.testing.assert_allclose(parallel.g(), serial.g(), rtol=1e-12)
+
+def test_workers_report_errors(trajectory):
+    with pytest.raises(ValueError, match="r_max"):
+        compute_rdf(trajectory, 7.0, 50, max_workers=2, batch_size=2)
@@ -0,0 +1,82 @@
+import importlib.metadata
+
+import pytest
+
+from models import registry
+from models.potential_models import LennardJones, MiePotential, YukawaPotential
+from models.registry import MODEL_REGISTRY, Parameter, create_model, register_model
+
+def test_parameter_check():
+    parameter = Parameter("sigma", 3.4, "Size", "σ", "Å", bounds=(0, 10))
+    assert parameter.check("2.5") == 2.5
+    for value in (0, -1.0, 10, "nan"):
+        with pytest.raises(ValueError):
+            parameter.check(value)
+    with pytest.raises(ValueError):
+        parameter.check("abc")
+
+def test_parameters_are_unbounded_by_default():
+    parameter = Parameter("c", 1.0, "Offset", "c")
+    assert parameter.check(-5.0) == -5.0
+    assert parameter.check(0) == 0.0
+
+def test_set_parameters_rejects_bad_values():
+    model = LennardJones()
+    with pytest.raises(ValueError, match="sigma"):
+        model.set_parameters(sigma=-1.0)
+    with pytest.raises(ValueError, match="kappa"):
+        model.set_parameters(kappa=1.0)
+    with pytest.raises(ValueError):
+        MiePotential(n=-12)
+    # A rejected update leaves every parameter unchanged
+    with pytest.raises(ValueError):
+        model.set_parameters(epsilon_over_kB=90.0, sigma=0.0)
+    assert (model.epsilon_over_kB, model.sigma) == (120.0, 3.4)
+
+def test_attractive_yukawa():
+    model = YukawaPotential(epsilon_over_kB=-50.0)
+    assert model.calculate(4.0) < 0
+    with pytest.raises(ValueError):
+        YukawaPotential(kappa=-1.0)
+
+def test_register_model_rejects_duplicate_names(monkeypatch):
+    monkeypatch.setattr(registry, "MODEL_REGISTRY", dict(MODEL_REGISTRY))
+    assert register_model(LennardJones) is LennardJones
+
+    class Impostor(LennardJones):
+        pass
+    with pytest.raises(ValueError, match="already registered"):
+        register_model(Impostor)
+
+class FakeEntryPoint:
+    def __init__(self, name, target):
+        self.name = name
+        self.target = target
+
+    def load(self):
+        if isinstance(self.target, Exception):
+            raise self.target
+        return self.target
+
+class FakeEntryPoints(list):
+    def select(self, group):
+        return self if group == registry.ENTRY_POINT_GROUP else []
+
+class PluginModel(LennardJones):
+    name = "Plugin LJ"
+
+def test_load_plugins(monkeypatch):
+    monkeypatch.setattr(registry, "MODEL_REGISTRY", dict(MODEL_REGISTRY))
+    monkeypatch.setattr(registry, "_plugins_loaded", False)
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda: FakeEntryPoints([
+        FakeEntryPoint("plugin", PluginModel),
+        FakeEntryPoint("broken", ImportError("missing dependency"))
+    ]))
+
+    with pytest.warns(UserWarning, match="broken"):
+        classes = registry.model_classes()
+    assert classes["Plugin LJ"] is PluginModel
+    assert "Lennard-Jones" in classes
+    assert isinstance(create_model("Plugin LJ", sigma=3.0), PluginModel)
+    with pytest.raises(ValueError, match="unknown model"):
+        create_model("No Such Model")
@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("matplotlib")
+
+import render  # noqa: E402
+
+JOBS = [
+    {"model": "Lennard-Jones", "distance": 4.0, "virial": {"num_points": 20}},
+    {"model": "Mie", "params": {"n": 14, "m": 7}, "output": "mie.png",
+     "truncation": {"mode": "switch", "r_cut": 8.5, "r_switch": 7.0}},
+]
+
+def test_render_jobs(tmp_path):
+    results = list(render.render_all(JOBS, str(tmp_path), workers=1))
+    assert [index for index, _, _ in results] == [0, 1]
+    assert all(error is None for _, _, error in results)
+    paths = [path for _, path, _ in results]
+    assert paths[1] == str(tmp_path / "mie.png")
+    for path in paths:
+        with open(path, "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+
+def test_failing_jobs_are_reported_by_index(tmp_path):
+    jobs = [
+        {"model": "No Such Model"},
+        JOBS[0],
+        # r_switch reaches TruncatedPotential, which rejects it beyond r_cut
+        {"model": "Lennard-Jones", "truncation": {"mode": "switch", "r_cut": 8.5, "r_switch": 9.0}},
+    ]
+    results = list(render.render_all(jobs, str(tmp_path), workers=1))
+    assert [index for index, _, _ in results] == [0, 1, 2]
+    assert results[0][1] is None and "No Such Model" in results[0][2]
+    assert results[1][2] is None
+    assert results[2][1] is None and "r_switch" in results[2][2]
@@ -0,0 +1,50 @@
+from gui.render_scheduler import RenderScheduler
+
+class FakeWidget:
+    """Stands in for a Tk widget; scheduled callbacks run on ``run_pending``"""
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+    def after_idle(self, callback):
+        return self.after(0, callback)
+
+    def after_cancel(self, after_id):
+        self.scheduled[after_id - 1] = None
+
+    def run_pending(self):
+        scheduled, self.scheduled = self.scheduled, []
+        for callback in scheduled:
+            if callback is not None:
+                callback()
+
+def test_only_same_key_replacements_are_coalesced():
+    scheduler = RenderScheduler(FakeWidget(), target_fps=0)
+    rendered = []
+    scheduler.request('distance', rendered.append, 1)
+    scheduler.request('parameters', rendered.append, 'p')
+    scheduler.request('distance', rendered.append, 2)
+    scheduler.request('distance', rendered.append, 3)
+    scheduler.widget.run_pending()
+
+    assert rendered == [3, 'p']
+    stats = scheduler.stats()
+    assert stats['requested'] == 4
+    assert stats['rendered'] == 2
+    assert stats['coalesced'] == 2
+    assert stats['dropped'] == 2
+    assert stats['frames'] == 1
+
+def test_cancelled_requests_are_dropped_not_coalesced():
+    scheduler = RenderScheduler(FakeWidget(), target_fps=0)
+    scheduler.request('distance', print, 1)
+    scheduler.request('parameters', print, 2)
+    scheduler.cancel()
+    scheduler.widget.run_pending()
+    stats = scheduler.stats()
+    assert stats['coalesced'] == 0
+    assert stats['dropped'] == 2
+    assert stats['rendered'] == 0
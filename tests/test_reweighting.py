@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from engine.configuration import compute_configuration, cubic_lattice
+from engine.reweighting import PairDistanceCache, Reweighting
+from models.potential_models import LennardJones, MorsePotential
+
+R_CUT = 7.0
+
+@pytest.fixture
+def configurations():
+    """Six jittered lattices of 64 particles"""
+    rng = np.random.default_rng(0)
+    positions, box = cubic_lattice(64, 0.02)
+    return [(positions + rng.normal(0, 0.2, positions.shape), box) for _ in range(6)]
+
+@pytest.fixture
+def cache(configurations):
+    cache = PairDistanceCache(R_CUT)
+    for positions, box in configurations:
+        cache.add_frame(positions, box)
+    return cache
+
+@pytest.mark.parametrize("model", [LennardJones(), MorsePotential()], ids=lambda model: model.name)
+@pytest.mark.parametrize("r_cut", [R_CUT, 6.0])
+def test_energies_match_configuration(cache, configurations, model, r_cut):
+    expected = [compute_configuration(model, positions, box, r_cut).energy
+                for positions, box in configurations]
+    np.testing.assert_allclose(cache.energies(model, r_cut), expected, rtol=1e-10)
+
+def test_reference_model_has_zero_free_energy(cache):
+    model = LennardJones()
+    reweighting = Reweighting(cache, model, temperature=150.0)
+    result = reweighting.estimate(LennardJones())
+    assert result.free_energy == pytest.approx(0.0, abs=1e-9)
+    assert result.effective_samples == pytest.approx(len(cache))
+    np.testing.assert_allclose(result.weights, 1 / len(cache))
+    assert result.energy == pytest.approx(reweighting.reference_energies.mean())
+
+def test_target_model_shifts_the_weights(cache):
+    reweighting = Reweighting(cache, LennardJones(), temperature=150.0)
+    result = reweighting.estimate(LennardJones(epsilon_over_kB=130.0))
+    energies = cache.energies(LennardJones(epsilon_over_kB=130.0))
+    assert 1 <= result.effective_samples < len(cache)
+    assert result.weights.sum() == pytest.approx(1.0)
+    assert result.energy == pytest.approx(result.weights @ energies)
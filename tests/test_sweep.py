@@ -0,0 +1,57 @@
+import threading
+
+import numpy as np
+import pytest
+
+from engine.sweep import ParameterGrid, run_sweep
+from models.potential_models import LennardJones, MiePotential, MorsePotential
+
+def test_models_are_built_from_the_schema():
+    grid = ParameterGrid(MiePotential, {"n": [10, 14], "sigma": [3.0, 3.5]},
+                         fixed={"epsilon_over_kB": 100.0})
+    model = grid.model(3)
+    assert (model.n, model.sigma, model.epsilon_over_kB, model.m) == (14.0, 3.5, 100.0, 6)
+
+    # Parameters without an axis keep the schema defaults
+    model = ParameterGrid(MorsePotential, {"a": [1.5]}).model(0)
+    assert (model.a, model.epsilon_over_kB, model.sigma) == (1.5, 120.0, 3.4)
+
+def test_unknown_names_are_rejected_at_creation():
+    with pytest.raises(ValueError, match="kappa"):
+        ParameterGrid(LennardJones, {"sigma": [3.0], "kappa": [1.0]})
+    with pytest.raises(ValueError, match="n"):
+        ParameterGrid(LennardJones, {"sigma": [3.0]}, fixed={"n": 10})
+
+def test_out_of_bounds_values_are_rejected_at_creation():
+    with pytest.raises(ValueError, match="sigma"):
+        ParameterGrid(LennardJones, {"sigma": [3.0, -1.0]})
+
+def test_run_sweep_finds_the_minimum():
+    grid = ParameterGrid(LennardJones, {"epsilon_over_kB": [80.0, 120.0],
+                                        "sigma": [3.0, 3.4, 3.8]})
+    steps = []
+    result = run_sweep(grid, chunk_size=2, max_workers=2,
+                       progress=lambda done, total: steps.append((done, total)))
+    assert not result.cancelled and result.completed.all()
+    assert steps[-1] == (6, 6)
+    np.testing.assert_allclose(result.column("r_min"),
+                               np.tile(2**(1/6) * grid.axes[1], (2, 1)), rtol=1e-9)
+    np.testing.assert_allclose(result.column("well_depth"),
+                               np.repeat(grid.axes[0][:, None], 3, axis=1), rtol=1e-9)
+
+def test_run_sweep_mie_well_depth():
+    # Without the LJ prefactor of 4, a 12-6 Mie well is ε/4 deep
+    grid = ParameterGrid(MiePotential, {"epsilon_over_kB": [100.0]}, fixed={"n": 12, "m": 6})
+    result = run_sweep(grid, quantities=("well_depth", "curve"), curve_r=[3.4, 4.0],
+                       max_workers=2)
+    assert result.column("well_depth")[0] == pytest.approx(25.0, rel=1e-9)
+    np.testing.assert_allclose(result.curves()[0], grid.model(0).calculate(np.array([3.4, 4.0])))
+
+def test_run_sweep_cancels():
+    grid = ParameterGrid(LennardJones, {"sigma": np.linspace(3.0, 4.0, 200)})
+    cancel = threading.Event()
+    result = run_sweep(grid, chunk_size=1, max_workers=2, cancel=cancel,
+                       progress=lambda done, total: cancel.set())
+    assert result.cancelled
+    assert result.completed.any() and not result.completed.all()
+    assert np.all(np.isnan(result.values[~result.completed]))
@@ -0,0 +1,83 @@
+import importlib.util
+
+import numpy as np
+import pytest
+
+from models import kernels
+from models.potential_models import (BuckinghamPotential, HardSphere, LennardJones,
+                                     SquareWell, Sutherland, YukawaPotential)
+from models.tabulated import TabulatedPotential
+
+@pytest.fixture(params=[
+    "numpy",
+    "python",
+    pytest.param("numba", marks=pytest.mark.skipif(importlib.util.find_spec("numba") is None,
+                                                   reason="Numba is not installed"))
+])
+def backend(request):
+    previous = kernels.get_backend()
+    kernels.set_backend(request.param)
+    yield request.param
+    kernels.set_backend(previous)
+
+def inside_points(table, size=kernels.KERNEL_MIN_SIZE + 10):
+    """Random distances in the table range, enough to take the kernel path"""
+    return np.random.default_rng(1).uniform(table.r_min, table.r_max, size)
+
+@pytest.mark.parametrize("spacing", ["r", "r2"])
+@pytest.mark.parametrize("model", [LennardJones(), YukawaPotential(),
+                                   BuckinghamPotential(A=5e5, B=3.0)],
+                         ids=lambda model: model.name)
+def test_interpolation_within_error_bounds(model, spacing, backend):
+    table = TabulatedPotential(model, r_min=3.0, spacing=spacing)
+    bounds = table.error_bounds(samples_per_interval=32)
+    r = inside_points(table)
+    V, F = table.energy_and_force(r)
+    V_exact, F_exact = model.energy_and_force(r)
+    assert np.abs(V - V_exact).max() <= 1.01 * bounds["max_abs_energy"]
+    assert np.abs(F - F_exact).max() <= 1.01 * bounds["max_abs_force"]
+    assert bounds["max_rel_energy"] < 1e-4
+
+@pytest.mark.parametrize("spacing", ["r", "r2"])
+def test_kernel_matches_numpy(spacing, backend):
+    table = TabulatedPotential(SquareWell(), spacing=spacing)
+    r = inside_points(table)
+    V, F = table.energy_and_force(r)
+    kernels.set_backend("numpy")
+    expected_V, expected_F = table.energy_and_force(r)
+    np.testing.assert_allclose(V, expected_V, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(F, expected_F, rtol=1e-12, atol=1e-12)
+
+@pytest.mark.parametrize("spacing", ["r", "r2"])
+@pytest.mark.parametrize("model", [HardSphere(), Sutherland()], ids=lambda model: model.name)
+def test_hard_core(model, spacing, backend):
+    table = TabulatedPotential(model, spacing=spacing)
+    sigma = model.sigma
+    r = np.concatenate([np.linspace(table.r_min, np.nextafter(sigma, 0), 3000),
+                        np.linspace(sigma, 9.0, 3000)])
+    V, F = table.energy_and_force(r)
+    core = r < sigma
+    assert np.all(np.isinf(V[core])) and np.all(F[core] == 0)
+    V_exact, F_exact = model.energy_and_force(r[~core])
+    np.testing.assert_allclose(V[~core], V_exact, rtol=1e-5, atol=1e-9)
+    np.testing.assert_allclose(F[~core], F_exact, rtol=1e-4, atol=1e-9)
+
+@pytest.mark.parametrize("spacing", ["r", "r2"])
+def test_square_well_edges_stay_sharp(spacing, backend):
+    model = SquareWell()
+    table = TabulatedPotential(model, spacing=spacing)
+    edges = np.array(model.discontinuities())
+    r = np.tile(np.concatenate([np.nextafter(edges, 0), edges]), 1000)
+    np.testing.assert_array_equal(table.calculate(r), model.calculate(r))
+
+@pytest.mark.parametrize("spacing", ["r", "r2"])
+def test_analytic_model_outside_range(spacing, backend):
+    model = LennardJones()
+    table = TabulatedPotential(model, r_min=3.0, r_max=8.0, spacing=spacing)
+    r = np.random.default_rng(2).uniform(2.5, 12.0, kernels.KERNEL_MIN_SIZE + 10)
+    outside = (r < 3.0) | (r >= 8.0)
+    V, F = table.energy_and_force(r)
+    V_exact, F_exact = model.energy_and_force(r[outside])
+    np.testing.assert_array_equal(V[outside], V_exact)
+    np.testing.assert_array_equal(F[outside], F_exact)
+    assert table.calculate(12.0) == model.energy_and_force(12.0)[0]
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from models.potential_models import LennardJones, MorsePotential
+from models.truncation import TRUNCATION_MODES, TruncatedPotential
+
+@pytest.mark.parametrize("mode", ["cut", "shift"])
+def test_tail_correction_for_cut_and_shift(mode):
+    model = LennardJones()
+    truncated = TruncatedPotential(model, 8.5, mode)
+    assert truncated.has_tail_correction
+    assert truncated.tail_energy(0.02) == model.tail_energy(8.5, 0.02)
+    assert truncated.tail_pressure(0.02) == model.tail_pressure(8.5, 0.02)
+
+@pytest.mark.parametrize("mode", ["force_shift", "switch"])
+def test_no_tail_correction_for_modified_modes(mode):
+    truncated = TruncatedPotential(LennardJones(), 8.5, mode)
+    assert not truncated.has_tail_correction
+    with pytest.raises(ValueError):
+        truncated.tail_energy(0.02)
+    with pytest.raises(ValueError):
+        truncated.tail_pressure(0.02)
+
+def test_no_tail_correction_without_model_tail():
+    truncated = TruncatedPotential(MorsePotential(), 8.5, "shift")
+    assert not truncated.has_tail_correction
+    with pytest.raises(ValueError):
+        truncated.tail_energy(0.02)
+
+@pytest.mark.parametrize("mode", TRUNCATION_MODES)
+def test_zero_beyond_cutoff(mode):
+    truncated = TruncatedPotential(LennardJones(), 8.5, mode)
+    V, F = truncated.energy_and_force(np.array([8.5, 9.0, 12.0]))
+    assert np.all(V == 0) and np.all(F == 0)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from models.potential_models import HardSphere, LennardJones, SquareWell
+from models.virial import hard_sphere_b2, second_virial
+
+class QuadratureSquareWell(SquareWell):
+    """SquareWell without the closed-form shortcut, so B2 takes the quadrature"""
+
+def test_lennard_jones_reduced_values():
+    model = LennardJones()
+    B2 = second_virial(model, np.array([1.0, 2.0]) * model.epsilon_over_kB)
+    # B2* = B2 / (2πσ³/3), tabulated in the literature
+    np.testing.assert_allclose(B2 / hard_sphere_b2(model.sigma), [-2.538, -0.6276], atol=5e-4)
+
+def test_scalar_temperature():
+    model = LennardJones()
+    B2 = second_virial(model, 240.0)
+    assert np.ndim(B2) == 0
+    assert B2 == pytest.approx(second_virial(model, np.array([240.0]))[0])
+
+def test_hard_sphere():
+    B2 = second_virial(HardSphere(sigma=3.0), np.array([100.0, 1000.0]))
+    np.testing.assert_allclose(B2, 2 * np.pi * 3.0**3 / 3)
+
+def test_square_well_quadrature_matches_closed_form():
+    T = np.array([50.0, 120.0, 300.0, 1000.0])
+    closed = second_virial(SquareWell(), T)
+    quadrature = second_virial(QuadratureSquareWell(), T)
+    np.testing.assert_allclose(quadrature, closed, rtol=1e-8)
+    # The well makes B2 negative at low T and the core dominates at high T
+    assert closed[0] < 0 < closed[-1] < hard_sphere_b2(SquareWell().sigma)